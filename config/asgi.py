@@ -0,0 +1,17 @@
+"""
+ASGI config for unicorn_maker project.
+예) uvicorn config.asgi:application --workers 2
+게임 진행 화면(play/invest/pass)은 async 뷰로 처리합니다. (ASYNC_GAME_VIEWS=0이면 sync 뷰)
+sync 코드는 요청마다 다른 스레드에서 돌 수 있어 스레드별 영구 커넥션이 정리되지 않고 쌓이므로
+ASGI에서는 DB 커넥션을 요청마다 닫습니다. (DB_CONN_MAX_AGE=0)
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('ASYNC_GAME_VIEWS', '1')
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
+application = get_asgi_application()
@@ -3,6 +3,7 @@ Django settings for unicorn_maker project.
 유니콘 메이커 - AI 투자 시뮬레이션 게임
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -31,6 +32,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'game.middleware.MetricsMiddleware',  # 뷰별 처리 시간 (가장 바깥에서 측정)
+    'game.middleware.QueryBudgetMiddleware',  # 요청별 SQL 쿼리 수/DB 시간 (세션/인증 쿼리 포함)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -59,15 +62,63 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
+
+# 게임 진행 화면(play/invest/pass)을 async 뷰로 처리 (game/async_views.py)
+# ASGI 서버로 띄우면 config/asgi.py가 기본으로 켬 → LLM 응답 대기 중에도 워커 스레드를 잡지 않음
+# WSGI에서는 async 뷰가 요청마다 이벤트 루프를 새로 돌리므로 끄는 게 맞음
+ASYNC_GAME_VIEWS = os.getenv('ASYNC_GAME_VIEWS', '0') == '1'
 
 
 # Database
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DB 선택 (DB_BACKEND 환경변수, 기본값 sqlite)
+# - sqlite: 개발/소규모 배포용. WAL 모드라 쓰기(투자/강화/패스) 중에도 읽기(랭킹/메인)가 막히지 않음
+# - postgres: 커넥션 풀 사용 (pip install "psycopg[binary,pool]")
+# 동시 읽기/쓰기 처리량 비교는 python manage.py bench_db_mixed
+DB_BACKEND = os.getenv('DB_BACKEND', 'sqlite')
+
+if DB_BACKEND == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv('POSTGRES_DB', 'unicorn_maker'),
+            'USER': os.getenv('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+            'HOST': os.getenv('POSTGRES_HOST', '127.0.0.1'),
+            'PORT': os.getenv('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': 0,  # 풀을 쓸 때는 0이어야 함 (커넥션 재사용은 풀이 담당)
+            'OPTIONS': {
+                # 워커 프로세스당 풀 (전체 커넥션 수 = GUNICORN_WORKERS x max_size 이하)
+                'pool': {
+                    'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+                    'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 8)),  # GUNICORN_THREADS 이상
+                    'timeout': 10,  # 빈 커넥션을 기다리는 최대 시간(초)
+                },
+            },
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            # 요청마다 새로 연결하지 않고 스레드별 커넥션 재사용 (PRAGMA 설정도 연결할 때 한 번만)
+            'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 600)),  # 초
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                # WAL: 읽기와 쓰기가 서로 기다리지 않음 / synchronous=NORMAL: WAL에서는 안전, 커밋마다 fsync 안 함
+                'init_command': (
+                    'PRAGMA journal_mode=WAL;'
+                    'PRAGMA synchronous=NORMAL;'
+                    'PRAGMA temp_store=MEMORY;'
+                    'PRAGMA cache_size=-16000;'  # 약 16MB
+                ),
+                # 트랜잭션 시작 시 바로 쓰기 잠금 (읽다가 쓰기로 바꿀 때 timeout 대기 없이 실패하는 문제 방지)
+                'transaction_mode': 'IMMEDIATE',
+                'timeout': 20,  # 쓰기 잠금 대기 시간(초)
+            },
+        }
     }
-}
 
 
 # Custom User Model
@@ -105,11 +156,24 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
+# 캐릭터 이미지 변형 (python manage.py build_character_images 로 생성)
+CHARACTER_IMAGE_DIR = 'images/characters'  # static/ 기준 경로
+CHARACTER_IMAGE_WIDTHS = (160, 320, 480)  # 화면 표시 크기 140~500px 기준 (원본 폭은 항상 포함)
+CHARACTER_IMAGE_FORMATS = ('avif', 'webp')  # <picture>에서 앞쪽 포맷 우선
+CHARACTER_IMAGE_QUALITY = {'avif': 55, 'webp': 80}
+
 
 # Media files (프로필 이미지 등 업로드 파일)
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 프로필 이미지 (업로드 후 축소/재인코딩 + 썸네일)
+PROFILE_IMAGE_MAX_SIZE = 512  # 보관용 원본 긴 변 (px)
+PROFILE_THUMBNAIL_SIZES = {'sm': 120, 'md': 240}  # 화면 120px 기준 1x/2x
+PROFILE_IMAGE_QUALITY = 80  # WebP 품질
+PROFILE_IMAGE_SYNC_MAX_BYTES = 512 * 1024  # 이보다 큰 업로드는 백그라운드에서 처리
+PROFILE_IMAGE_RETRY_INTERVAL = 600  # 처리 실패한 이미지를 화면 표시 때 다시 시도하는 최소 간격(초)
+
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -119,3 +183,110 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+
+# 아이디어 풀 (캐릭터별 아이디어 미리 생성)
+# 풀이 LOW 아래로 내려가면 백그라운드 워커가 HIGH까지 채움
+IDEA_POOL_ENABLED = True
+IDEA_POOL_LOW_WATERMARK = 2
+IDEA_POOL_HIGH_WATERMARK = 5
+IDEA_POOL_POLL_INTERVAL = 10  # 초
+
+
+# 투자 결과 반응 비동기 생성 (ASYNC_RESULT_REACTION=1로 켬, 기본은 꺼짐)
+# 켜면 투자 결과(수익/자본금)를 먼저 저장하고 AI 반응은 백그라운드에서 채움 (결과 화면이 폴링으로 받음)
+# 끄면 기존대로 반응까지 생성한 뒤 결과 화면으로 이동
+ASYNC_RESULT_REACTION = os.getenv('ASYNC_RESULT_REACTION', '0') == '1'
+RESULT_REACTION_TIMEOUT = 30  # 초, 넘으면 기본 문구로 대체
+BACKGROUND_WORKERS = 4
+
+
+# 아이디어 스트리밍 (SSE, IDEA_STREAMING=1로 켬, 기본은 꺼짐)
+# 켜면 풀이 비었을 때 play 화면을 먼저 보여주고 피칭 문구는 생성되는 대로 표시
+# 끄면 기존대로 아이디어를 받은 뒤 play 화면을 그림
+IDEA_STREAMING = os.getenv('IDEA_STREAMING', '0') == '1'
+
+
+# LLM 백엔드 선택 (gemini: 실서비스 / fake: 프로세스 내부 가짜 / http: 로컬 대역 서버)
+# 옵션 키는 각 백엔드 클래스의 인자 이름 (대문자)
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'gemini')
+LLM_BACKENDS = {
+    'gemini': {
+        'MODEL': 'gemini-3-flash-preview',
+        'TIMEOUT': 30,  # 초
+    },
+    'fake': {
+        'LATENCY': float(os.getenv('LLM_FAKE_LATENCY', 0)),  # 초
+    },
+    'http': {
+        'URL': os.getenv('LLM_HTTP_URL', 'http://127.0.0.1:8765'),
+        'TIMEOUT': 10,  # 초
+        'CONNECT_TIMEOUT': 2,
+        'POOL_SIZE': 20,  # keep-alive 커넥션 수
+        'KEEPALIVE_EXPIRY': 30,
+    },
+}
+
+# 워커 시작 직후 LLM 클라이언트/아이디어 풀 미리 준비 (gunicorn.conf.py의 post_worker_init)
+LLM_WARMUP = os.getenv('LLM_WARMUP', '1') == '1'
+
+# LLM 호출 마감 시간(초)과 헤지 요청 여부 (호출 종류별)
+# 헤지: 최근 p95 지연을 넘기면 같은 요청을 하나 더 보내고 먼저 온 응답 사용
+LLM_CALL_BUDGETS = {
+    'idea': {'DEADLINE': 8, 'HEDGE': True},
+    'idea_stream': {'DEADLINE': 15, 'HEDGE': False},
+    'batch': {'DEADLINE': 40, 'HEDGE': False},  # 아이디어 풀 워커 (백그라운드)
+    'result': {'DEADLINE': 6, 'HEDGE': True},
+}
+LLM_HEDGE_PERCENTILE = 95
+LLM_HEDGE_MIN_DELAY = 1.0  # 초
+LLM_HEDGE_MIN_SAMPLES = 20  # 표본이 이보다 적으면 헤지 안 함
+
+# 서킷 브레이커: 연속 실패 N번이면 RESET_TIMEOUT 동안 바로 기본 문구로 대체
+LLM_BREAKER_FAILURE_THRESHOLD = 5
+LLM_BREAKER_RESET_TIMEOUT = 30  # 초
+
+# 랭킹 보드 크기 (보드별로 상위 K개만 유지)
+LEADERBOARD_DAILY_SIZE = 20  # 오늘의 랭킹
+LEADERBOARD_ALL_TIME_SIZE = 10  # 명예의 전당
+
+# Prometheus 메트릭 (/metrics), 기본은 꺼짐 (404)
+# 켜면 스태프 로그인, METRICS_TOKEN (Authorization: Bearer <토큰>), METRICS_ALLOWED_IPS 중 하나를 만족해야 응답
+# 프록시 뒤라면 REMOTE_ADDR가 프록시 주소이므로 IP 대신 토큰을 쓰세요.
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '0') == '1'
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv('METRICS_ALLOWED_IPS', '').split(',') if ip.strip()]
+
+# 요청별 SQL 쿼리 예산 (넘으면 경고 출력 + unicorn_http_query_budget_exceeded_total)
+QUERY_BUDGET_MAX_QUERIES = 15
+QUERY_BUDGET_MAX_DB_MS = 100  # 밀리초
+# 뷰별 쿼리 수 예산 (check_query_counts가 EXPECTED 값이 예산 안에 있는지도 확인)
+QUERY_BUDGET_OVERRIDES = {
+    # 보통 14~20 (첫 투자/처음 만난 캐릭터면 누적 통계 행 생성 포함)
+    # 게임을 끝내는 투자는 종료 처리 + 랭킹 보드 2개 갱신이 더해져 최대 약 38
+    'game:invest': 40,
+    # 보통 6, 자본금/기회가 바닥난 게임을 여기서 끝내면 종료 처리 + 랭킹 보드 갱신으로 약 18
+    'game:play': 20,
+}
+QUERY_BUDGET_HEADERS = DEBUG  # 응답 헤더에 X-DB-Queries / X-DB-Time-Ms 표시
+
+# 캐시 (랭킹 조각 캐시 등)
+# 기본은 프로세스 메모리(LocMem) → 워커가 여러 개면 무효화는 해당 워커에만 적용되므로
+# RANKING_CACHE_TIMEOUT이 다른 워커의 최대 지연 시간이 됨. REDIS_URL이 있으면 공유 캐시 사용
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unicorn-maker',
+        }
+    }
+
+# 랭킹 조각(오늘의 랭킹/Top 3/명예의 전당) 캐시 유지 시간 (게임 종료 시 즉시 무효화)
+RANKING_CACHE_TIMEOUT = 60  # 초
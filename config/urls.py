@@ -1,13 +1,17 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+
+from game.views import media_view, metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),  # Prometheus 스크랩 경로 (METRICS_ENABLED일 때만)
     path('', include('game.urls')),
 ]
 
-# 개발 환경에서 미디어 파일 서빙
+# 개발 환경에서 미디어 파일 서빙 (해시 이름 파일은 영구 캐시 헤더)
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % settings.MEDIA_URL.lstrip('/'), media_view),
+    ]
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import User, GameSession, Investment
+from .models import (
+    User, GameSession, Investment, LeaderboardEntry, SessionArchive, StoredFile, TextBlob, UserCharacterStats, UserStats,
+)
 
 
 @admin.register(User)
@@ -19,3 +21,49 @@ class GameSessionAdmin(admin.ModelAdmin):
 class InvestmentAdmin(admin.ModelAdmin):
     list_display = ['session', 'character_name', 'idea_title', 'invest_amount', 'is_success', 'profit_rate']
     list_filter = ['is_success', 'character_name']
+    # 생성 문구는 TextBlob에 있으므로 조인해서 읽기 전용으로 표시
+    exclude = list(Investment.TEXT_BLOBS)
+    readonly_fields = ['idea_description', 'result_system_msg', 'result_character_reaction']
+
+    def get_queryset(self, request):
+        # select_related를 직접 지정하면 목록 화면의 자동 select_related가 빠지므로 session__user도 함께
+        return super().get_queryset(request).select_related('session__user', *Investment.TEXT_BLOBS)
+
+
+@admin.register(LeaderboardEntry)
+class LeaderboardEntryAdmin(admin.ModelAdmin):
+    list_display = ['board', 'day', 'session', 'profit_rate']
+    list_filter = ['board', 'day']
+
+
+@admin.register(StoredFile)
+class StoredFileAdmin(admin.ModelAdmin):
+    list_display = ['name', 'size', 'refcount', 'created_at']
+    search_fields = ['name', 'sha256']
+
+
+@admin.register(UserStats)
+class UserStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'investments', 'successes', 'total_invested', 'total_profit', 'enchants', 'passes', 'bankruptcies']
+    search_fields = ['user__nickname']
+
+
+@admin.register(UserCharacterStats)
+class UserCharacterStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'character_key', 'investments', 'successes', 'total_invested', 'total_profit']
+    list_filter = ['character_key']
+    search_fields = ['user__nickname']
+
+
+@admin.register(SessionArchive)
+class SessionArchiveAdmin(admin.ModelAdmin):
+    list_display = ['session', 'investment_count', 'archived_at']
+    exclude = ['data']
+
+
+@admin.register(TextBlob)
+class TextBlobAdmin(admin.ModelAdmin):
+    list_display = ['id', '__str__', 'compressed']
+    list_filter = ['compressed']
+    exclude = ['data']
+    readonly_fields = ['text']
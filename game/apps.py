@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class GameConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'game'
+
+    def ready(self):
+        # 신호 수신자 등록
+        from . import signals  # noqa: F401
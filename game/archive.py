@@ -0,0 +1,107 @@
+import json
+import zlib
+from collections import defaultdict, namedtuple
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from .models import GameSession, Investment, SessionArchive
+
+
+# ============================================================
+# 오래된 게임 투자 기록 보관 (콜드 스토리지)
+# - 종료된 지 N일 지난 게임의 Investment 행을 세션당 zlib 압축 JSON 하나(SessionArchive)로 옮기고 삭제
+# - GameSession/랭킹 보드/누적 통계는 건드리지 않으므로 랭킹과 마이페이지 통계는 그대로
+# - 읽을 때는 attach_history()가 보관 여부에 상관없이 같은 모양의 목록을 붙여줌
+# ============================================================
+FIELDS = (
+    'id', 'character_name', 'idea_title', 'idea_description', 'invest_amount', 'is_success', 'profit_rate',
+    'result_system_msg', 'result_character_reaction', 'created_at',
+)
+
+# 보관된 투자 기록 (Investment와 같은 이름의 속성, 읽기 전용)
+ArchivedInvestment = namedtuple('ArchivedInvestment', FIELDS)
+
+COMPRESS_LEVEL = 9
+
+
+def _encode(investments):
+    rows = [
+        [getattr(investment, field) for field in FIELDS[:-1]] + [investment.created_at.isoformat()]
+        for investment in investments
+    ]
+    return json.dumps(rows, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def pack(investments):
+    """Investment 목록 → 압축된 bytes"""
+    return zlib.compress(_encode(investments), COMPRESS_LEVEL)
+
+
+def unpack(data):
+    """압축된 bytes → ArchivedInvestment 목록 (투자 순서대로)"""
+    rows = json.loads(zlib.decompress(bytes(data)))
+    return [ArchivedInvestment(*row[:-1], parse_datetime(row[-1])) for row in rows]
+
+
+def candidates(cutoff):
+    """보관 대상: cutoff 이전에 시작해서 종료된, 아직 보관하지 않은 게임"""
+    return GameSession.objects.filter(is_finished=True, created_at__lt=cutoff, archive__isnull=True)
+
+
+def archive_batch(session_ids):
+    """
+    게임 여러 개의 투자 기록을 한 트랜잭션에서 보관 + 삭제
+    반환: (보관한 게임 수, 투자 기록 수, 원본 JSON 크기, 압축 크기)
+    """
+    with transaction.atomic():
+        # 다른 실행과 겹쳐도 두 번 보관하지 않도록 트랜잭션 안에서 다시 거름
+        session_ids = list(
+            GameSession.objects.filter(pk__in=session_ids, archive__isnull=True).values_list('pk', flat=True)
+        )
+        grouped = defaultdict(list)
+        investments = Investment.objects.filter(session_id__in=session_ids).select_related(*Investment.TEXT_BLOBS)
+        for investment in investments.order_by('created_at', 'pk'):
+            grouped[investment.session_id].append(investment)
+
+        archives = []
+        raw_size = packed_size = 0
+        for session_id in session_ids:
+            investments = grouped.get(session_id, [])
+            raw = _encode(investments)
+            data = zlib.compress(raw, COMPRESS_LEVEL)
+            raw_size += len(raw)
+            packed_size += len(data)
+            archives.append(SessionArchive(session_id=session_id, data=data, investment_count=len(investments)))
+
+        SessionArchive.objects.bulk_create(archives)
+        Investment.objects.filter(session_id__in=session_ids).delete()
+    return len(session_ids), sum(map(len, grouped.values())), raw_size, packed_size
+
+
+def attach_history(sessions):
+    """
+    게임 목록에 투자 기록(session.history)을 붙임, 보관된 게임은 압축을 풀어서
+    sessions는 select_related('archive')로 가져와야 게임 수와 상관없이 쿼리 1번
+    """
+    hot = []
+    for session in sessions:
+        try:
+            session.history = unpack(session.archive.data)
+        except ObjectDoesNotExist:
+            session.history = []
+            hot.append(session)
+    if hot:
+        by_id = {session.pk: session for session in hot}
+        for investment in Investment.objects.filter(session_id__in=by_id).order_by('created_at', 'pk'):
+            by_id[investment.session_id].history.append(investment)
+    return sessions
+
+
+def iter_archived():
+    """보관된 모든 투자 기록 (user_id, ArchivedInvestment), 통계 재계산용"""
+    archives = SessionArchive.objects.values_list('session__user_id', 'data').iterator(chunk_size=200)
+    for user_id, data in archives:
+        for investment in unpack(data):
+            yield user_id, investment
@@ -0,0 +1,129 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import aget_object_or_404, redirect, render
+
+from .gemini_service import agenerate_idea, agenerate_result
+from .idea_pool import take_pooled_idea
+from .models import GameSession
+from .rules import get_random_character
+from .turn import TurnState
+from .views import (
+    apply_enchant, finish_game, parse_invest_amount, play_context, record_investment,
+    roll_investment, spend_enchant, spend_pass, submitted_turn_no,
+)
+from . import metrics, rules
+
+
+# ============================================================
+# 게임 진행 async 뷰 (ASGI 배포용, ASYNC_GAME_VIEWS=True일 때 game/urls.py에서 사용)
+# - LLM 응답을 기다리는 동안 스레드를 잡지 않으므로 워커 하나가 많은 플레이어를 동시에 처리
+# - 규칙/DB 처리는 views.py의 공용 함수를 그대로 쓰고, 트랜잭션이 필요한 부분만 sync_to_async로 실행
+# - 템플릿이 request.user를 읽으므로 뷰 시작 시 await request.auser()로 미리 불러둠
+#   (지연 로딩된 유저를 템플릿에서 조회하면 async 컨텍스트라 SynchronousOnlyOperation)
+# ============================================================
+async def astart_new_turn(request, session, blocking=True):
+    """views.start_new_turn()의 async 버전 (실시간 아이디어 생성을 await)"""
+    character = get_random_character()
+    idea = take_pooled_idea(character)
+    if idea is None and not settings.IDEA_STREAMING:
+        if not blocking:
+            TurnState.clear(request)
+            return None
+        idea = await agenerate_idea(character)
+    turn = TurnState.new(session, character, idea)
+    turn.save(request)
+    return turn
+
+
+async def _get_session(request, session_id):
+    request.user = await request.auser()
+    return await aget_object_or_404(GameSession, pk=session_id, user=request.user)
+
+
+@login_required
+async def play_view(request, session_id):
+    """투자 화면 (views.play_view와 동일)"""
+    session = await _get_session(request, session_id)
+
+    if session.is_finished:
+        return redirect('game:main')
+
+    if rules.is_game_over(session.current_capital, session.remaining_chances):
+        reason = 'bankrupt' if session.current_capital <= 0 else 'completed'
+        await sync_to_async(finish_game)(request.user, session, reason=reason)
+        return redirect('game:ranking')
+
+    turn = await TurnState.aload(request, session)
+    if turn is None:
+        turn = await astart_new_turn(request, session)
+
+    return render(request, 'game/play.html', play_context(session, turn))
+
+
+@login_required
+async def invest_view(request, session_id):
+    """투자/강화 처리 (views.invest_view와 동일)"""
+    session = await _get_session(request, session_id)
+
+    if session.is_finished:
+        return redirect('game:main')
+    if request.method != 'POST':
+        return redirect('game:play', session_id=session_id)
+
+    action = request.POST.get('action')
+    turn = await TurnState.aload(request, session)
+    # 화면에서 본 턴(제출된 turn_no)이 아니면 무시 (views.load_submitted_turn과 동일)
+    if turn is not None and turn.turn_no != submitted_turn_no(request):
+        turn = None
+
+    if action == 'invest':
+        invest_amount = parse_invest_amount(request, session)
+        if invest_amount is None or turn is None or turn.idea is None:
+            return redirect('game:play', session_id=session_id)
+
+        outcome = roll_investment(turn, invest_amount)
+        if settings.ASYNC_RESULT_REACTION:
+            result = {}
+        else:
+            result = await agenerate_result(turn.character, turn.idea['title'], outcome.is_success)
+
+        investment = await sync_to_async(record_investment)(session, turn, outcome, result)
+        if investment is None:
+            return redirect('game:play', session_id=session_id)
+
+        await session.arefresh_from_db(fields=['current_capital', 'remaining_chances', 'turn_no'])
+        if rules.is_game_over(session.current_capital, session.remaining_chances):
+            reason = 'bankrupt' if session.current_capital <= 0 else 'completed'
+            await sync_to_async(finish_game)(request.user, session, reason=reason)
+            TurnState.clear(request)
+        else:
+            await astart_new_turn(request, session, blocking=False)
+        return redirect('game:result', investment_id=investment.pk)
+
+    if action == 'enchant':
+        if turn is None or turn.enchant_used:
+            return redirect('game:play', session_id=session_id)
+        if not await sync_to_async(spend_enchant)(session, turn):
+            return redirect('game:play', session_id=session_id)
+        apply_enchant(turn)
+        turn.save(request)
+
+    return redirect('game:play', session_id=session_id)
+
+
+@login_required
+async def pass_view(request, session_id):
+    """패스 (views.pass_view와 동일)"""
+    session = await _get_session(request, session_id)
+    if request.method != 'POST':
+        return redirect('game:play', session_id=session_id)
+    turn_no = submitted_turn_no(request)
+    if turn_no is None or not await sync_to_async(spend_pass)(session, turn_no):
+        return redirect('game:play', session_id=session_id)
+
+    turn = await TurnState.aload(request, session)
+    metrics.game_actions.inc(action='pass', character=turn.character_key if turn else '')
+    session.turn_no = turn_no + 1
+    await astart_new_turn(request, session)
+    return redirect('game:play', session_id=session_id)
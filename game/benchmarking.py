@@ -0,0 +1,130 @@
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from .gemini_service import CHARACTERS
+from .models import GameSession, Investment, TextBlob, User
+
+
+# ============================================================
+# 벤치마크 공용 도구 (관리 명령어에서 사용)
+# ============================================================
+@contextmanager
+def temporary_database(name=None, verbosity=0):
+    """
+    임시 테스트 DB를 만들어서 그 안에서 실행 (끝나면 삭제)
+    운영 DB를 건드리지 않고 대량 데이터를 넣어볼 때 사용합니다.
+    name을 주면 SQLite도 파일 DB로 만듭니다. (여러 스레드/커넥션에서 같이 쓸 때)
+    """
+    old_name = connection.settings_dict['NAME']
+    test_settings = connection.settings_dict.setdefault('TEST', {})
+    old_test_name = test_settings.get('NAME')
+    if name is not None:
+        test_settings['NAME'] = name
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        test_settings['NAME'] = old_test_name
+
+
+def seed_games(users=100, sessions_per_user=20, investments_per_session=5, days=30, seed=0, prefix='bench'):
+    """
+    유저/게임/투자 기록 대량 생성 (bulk_create)
+    게임의 약 90%는 종료 상태, 생성/종료 날짜는 최근 days일에 고르게 분포
+    prefix: 유저 아이디 접두어 (같은 DB에 여러 번 넣을 때 겹치지 않게)
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    characters = list(CHARACTERS.values())
+
+    User.objects.bulk_create([
+        User(username=f'{prefix}{n}', nickname=f'{prefix}{n}', password='!') for n in range(users)
+    ], batch_size=500)
+    user_ids = list(User.objects.filter(username__startswith=prefix).values_list('pk', flat=True))
+
+    sessions = []
+    for user_id in user_ids:
+        for _ in range(sessions_per_user):
+            created_at = now - timedelta(seconds=rng.randrange(days * 86400))
+            finished = rng.random() < 0.9
+            sessions.append(GameSession(
+                user_id=user_id,
+                current_capital=rng.randrange(0, 40000),
+                remaining_chances=0 if finished else rng.randrange(1, 6),
+                is_finished=finished,
+                final_profit_rate=round(rng.uniform(-100, 300), 2) if finished else None,
+                finished_on=timezone.localdate(created_at) if finished else None,
+            ))
+            sessions[-1]._bench_created_at = created_at
+    GameSession.objects.bulk_create(sessions, batch_size=500)
+
+    # auto_now_add는 bulk_create에서도 덮어쓰므로 생성 시각은 따로 맞춤
+    for session in sessions:
+        session.created_at = session._bench_created_at
+    GameSession.objects.bulk_update(sessions, ['created_at'], batch_size=500)
+
+    description_id, system_msg_id, reaction_id = TextBlob.intern('벤치마크용 더미 설명', '벤치마크 결과', '벤치마크 반응')
+    investments = []
+    for session in sessions:
+        for _ in range(investments_per_session):
+            character = rng.choice(characters)
+            investments.append(Investment(
+                session=session,
+                character_name=character['name'],
+                idea_title='벤치마크 아이디어',
+                idea_description_blob_id=description_id,
+                invest_amount=rng.randrange(100, 5000),
+                is_success=rng.random() < character['success_rate'],
+                profit_rate=rng.randrange(-100, 500),
+                result_system_msg_blob_id=system_msg_id,
+                result_character_reaction_blob_id=reaction_id,
+            ))
+    Investment.objects.bulk_create(investments, batch_size=1000)
+    return {'users': len(user_ids), 'sessions': len(sessions), 'investments': len(investments)}
+
+
+def time_call(func, repeat=20, warmup=2):
+    """func()를 repeat번 실행한 지연시간(밀리초) 통계"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return _summarize(samples)
+
+
+def time_interleaved(funcs, repeat=20, warmup=2):
+    """
+    {이름: 함수}를 한 바퀴씩 번갈아 repeat번 실행한 이름별 통계
+    공용 VM처럼 몇 초 단위로 빨라졌다 느려졌다 하는 환경에서도 항목마다 표본이 전체 구간에 퍼지므로
+    최솟값이 항목끼리/실행끼리 비교 가능해짐
+    """
+    for func in funcs.values():
+        for _ in range(warmup):
+            func()
+    samples = {name: [] for name in funcs}
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            start = time.perf_counter()
+            func()
+            samples[name].append((time.perf_counter() - start) * 1000)
+    return {name: _summarize(values) for name, values in samples.items()}
+
+
+def _summarize(samples):
+    samples = sorted(samples)
+    return {
+        'min_ms': samples[0],
+        'median_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'max_ms': samples[-1],
+    }
@@ -1,16 +1,134 @@
-import random
-import os
+import re
+import threading
+import time
 
-from google import genai
-from google.genai import types
-from dotenv import load_dotenv
+from django.conf import settings
 
-# .env 파일 로드
-load_dotenv()
+from . import metrics
+from .llm_backends import create_backend
+from .resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded, GuardedCaller
+
+# ============================================================
+# LLM 백엔드 (settings.LLM_BACKEND로 선택: gemini / fake / http)
+# ============================================================
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """현재 설정된 LLM 백엔드 (프로세스당 1개 생성 후 재사용)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                name = settings.LLM_BACKEND
+                _backend = create_backend(name, settings.LLM_BACKENDS.get(name))
+    return _backend
+
+
+def warm_up():
+    """
+    LLM 백엔드 미리 준비 (SDK import, 클라이언트/커넥션 생성)
+    첫 요청이 초기화 비용을 떠안지 않도록 워커 시작 직후 호출합니다.
+    """
+    try:
+        backend = get_backend()
+        if hasattr(backend, 'warm_up'):
+            backend.warm_up()
+    except Exception as e:
+        # 준비 실패해도 워커는 계속 뜨고, 첫 호출 때 다시 시도
+        print(f"LLM Warm-up Error: {e}")
+
+
+def set_backend(backend):
+    """백엔드 교체 (부하 테스트/벤치마크용, None이면 설정값으로 다시 생성)"""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+# ============================================================
+# 호출 보호 (마감 시간 + 헤지 요청 + 서킷 브레이커)
+# ============================================================
+guarded = GuardedCaller(
+    CircuitBreaker(
+        failure_threshold=settings.LLM_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=settings.LLM_BREAKER_RESET_TIMEOUT,
+    ),
+    hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+    hedge_min_delay=settings.LLM_HEDGE_MIN_DELAY,
+    hedge_min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+)
+
+
+def call_llm(kind, prompt, **options):
+    """
+    LLM 호출 (settings.LLM_CALL_BUDGETS[kind]의 마감 시간/헤지 적용)
+    브레이커가 열려 있으면 CircuitOpenError, 시간 초과면 DeadlineExceeded
+    """
+    budget = settings.LLM_CALL_BUDGETS[kind]
+    backend = get_backend()
+    response = guarded.call(
+        kind,
+        lambda: backend.generate(prompt, **options),
+        deadline=budget['DEADLINE'],
+        hedge=budget['HEDGE'],
+    )
+    _count_tokens(kind, response)
+    return response
+
+
+async def acall_llm(kind, prompt, **options):
+    """call_llm()의 async 버전 (async 뷰용, 응답을 기다리는 동안 스레드를 잡지 않음)"""
+    budget = settings.LLM_CALL_BUDGETS[kind]
+    backend = get_backend()
+    response = await guarded.acall(
+        kind,
+        lambda: backend.agenerate(prompt, **options),
+        deadline=budget['DEADLINE'],
+        hedge=budget['HEDGE'],
+    )
+    _count_tokens(kind, response)
+    return response
+
+
+def _count_tokens(kind, response):
+    metrics.llm_tokens.inc(response.input_tokens, kind=kind, direction='input')
+    metrics.llm_tokens.inc(response.output_tokens, kind=kind, direction='output')
+
+
+def llm_stats():
+    """모니터링용 브레이커 상태/헤지 횟수/호출 카운터"""
+    return guarded.stats()
+
+
+def fallback_reason(error):
+    """대체 문구 사용 사유 (메트릭 라벨용)"""
+    if isinstance(error, CircuitOpenError):
+        return 'circuit_open'
+    if isinstance(error, DeadlineExceeded):
+        return 'deadline'
+    return 'error'
+
+
+@metrics.register_collector
+def _collect_llm_metrics():
+    stats = llm_stats()
+    breaker = stats['breaker']
+    states = ('closed', 'half_open', 'open')
+    samples = [
+        ('unicorn_llm_breaker_state', 'gauge', '서킷 브레이커 상태 (현재 상태만 1)',
+         [({'state': state}, int(breaker['state'] == state)) for state in states]),
+        ('unicorn_llm_breaker_opened_total', 'counter', '서킷 브레이커가 열린 횟수',
+         [({}, breaker['open_count'])]),
+    ]
+    for name in ('calls', 'hedged', 'hedge_wins', 'deadline_exceeded', 'errors', 'short_circuited'):
+        samples.append((
+            f'unicorn_llm_guarded_{name}_total', 'counter', f'보호 호출 {name} 횟수',
+            [({'kind': kind}, counters.get(name, 0)) for kind, counters in stats['calls'].items()],
+        ))
+    return samples
 
-# API 키 가져오기
-client = genai.Client(api_key=os.getenv('GEMINI_API_KEY'))
-MODEL_NAME = "gemini-3-flash-preview"
 
 # ============================================================
 # 5인 캐릭터 페르소나 설정 (성격과 규칙 분리 + 밸런스 데이터 추가)
@@ -100,26 +218,20 @@ CHARACTERS = {
 }
 
 
-def get_random_character():
-    """
-    랜덤 캐릭터 선택 (가중치 적용)
-    spawn_weight가 높을수록 자주 등장합니다.
-    """
-    keys = list(CHARACTERS.keys())
-    weights = [CHARACTERS[k]['spawn_weight'] for k in keys]
-    
-    # 가중치 기반 랜덤 선택 (리스트로 반환되므로 [0]으로 꺼냄)
-    selected_key = random.choices(keys, weights=weights, k=1)[0]
-    return CHARACTERS[selected_key]
+def get_character_by_name(name):
+    """캐릭터 이름으로 캐릭터 데이터 조회 (없으면 None)"""
+    for character in CHARACTERS.values():
+        if character['name'] == name:
+            return character
+    return None
 
 
-def generate_idea(character):
+def build_idea_prompt(character):
     """
-    [아이디어 생성 단계]
-    성격(persona)과 제안 규칙(idea_format)을 모두 사용하여
-    완벽한 피칭 문단을 생성합니다.
+    [아이디어 생성 프롬프트]
+    성격(persona)과 제안 규칙(idea_format)을 모두 사용합니다.
     """
-    prompt = f'''
+    return f'''
 [역할 부여]
 {character['persona']}
 
@@ -137,54 +249,232 @@ def generate_idea(character):
 [DESC] 위 규칙대로 작성된 아이디어 제안 본문 (250자 미만)
 '''
 
-    try:
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                thinking_config=types.ThinkingConfig(thinking_level="minimal"),
-                max_output_tokens=300,  # TITLE+DESC 합쳐서 350자 커버
-                temperature=0.8  # 창의성부분 (숫자가 낮을수록 창의성 낮음)
-            )
-        )
-        text = response.text.strip()
-        
-        # 파싱 로직
-        title = ''
-        description = ''
-        
-        for line in text.split('\n'):
-            if '[TITLE]' in line:
-                title = line.replace('[TITLE]', '').strip()
-            elif '[DESC]' in line:
-                description = line.replace('[DESC]', '').strip()
-        
-        # 파싱 실패 시 전체 텍스트를 설명으로 간주 (방어 코드)
-        if not description and not title:
-             description = text
 
-        return {
-            'title': title or f"{character['name']}의 비밀 프로젝트",
-            'description': description or '아이디어 구상 중입니다...'
-        }
+def idea_config():
+    """아이디어 생성용 모델 설정"""
+    return {
+        'max_output_tokens': 300,  # TITLE+DESC 합쳐서 350자 커버
+        'temperature': 0.8  # 창의성부분 (숫자가 낮을수록 창의성 낮음)
+    }
+
+
+def parse_idea(text, character):
+    """[TITLE]/[DESC] 태그 파싱"""
+    text = text.strip()
+    title = ''
+    description = ''
+    
+    for line in text.split('\n'):
+        if '[TITLE]' in line:
+            title = line.replace('[TITLE]', '').strip()
+        elif '[DESC]' in line:
+            description = line.replace('[DESC]', '').strip()
+    
+    if not title:
+        metrics.llm_parse_failures.inc(kind='idea', tag='TITLE')
+    if not description:
+        metrics.llm_parse_failures.inc(kind='idea', tag='DESC')
+
+    # 파싱 실패 시 전체 텍스트를 설명으로 간주 (방어 코드)
+    if not description and not title:
+         description = text
+
+    return {
+        'title': title or f"{character['name']}의 비밀 프로젝트",
+        'description': description or '아이디어 구상 중입니다...'
+    }
+
+
+def fallback_idea():
+    """API 오류 시 사용할 기본 아이디어 문구"""
+    return {
+        'title': '통신 오류',
+        'description': 'AI와의 연결이 불안정하여 아이디어를 불러오지 못했습니다.'
+    }
+
+
+def fetch_idea(character):
+    """
+    [아이디어 생성 단계 - 원본 호출]
+    완벽한 피칭 문단을 생성합니다.
+    API 오류는 그대로 raise 합니다. (아이디어 풀 워커용)
+    """
+    response = call_llm('idea', build_idea_prompt(character), **idea_config())
+    return parse_idea(response.text, character)
+
+
+def generate_idea(character):
+    """
+    [아이디어 생성 단계]
+    fetch_idea() 호출, 실패 시 기본 문구로 대체합니다.
+    """
+    start = time.perf_counter()
+    try:
+        idea = fetch_idea(character)
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_idea', outcome='ok')
+        return idea
     
     except Exception as e:
         print(f"Gemini API Error (Idea): {e}")
-        return {
-            'title': '통신 오류',
-            'description': 'AI와의 연결이 불안정하여 아이디어를 불러오지 못했습니다.'
-        }
+        metrics.llm_fallbacks.inc(function='generate_idea', reason=fallback_reason(e))
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_idea', outcome='fallback')
+        return fallback_idea()
 
 
-def generate_result(character, idea_title, is_success):
+async def agenerate_idea(character):
+    """generate_idea()의 async 버전"""
+    start = time.perf_counter()
+    try:
+        response = await acall_llm('idea', build_idea_prompt(character), **idea_config())
+        idea = parse_idea(response.text, character)
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_idea', outcome='ok')
+        return idea
+
+    except Exception as e:
+        print(f"Gemini API Error (Idea): {e}")
+        metrics.llm_fallbacks.inc(function='generate_idea', reason=fallback_reason(e))
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_idea', outcome='fallback')
+        return fallback_idea()
+
+
+def build_ideas_prompt(character, count):
     """
-    [결과 반응 단계]
-    제안 규칙(idea_format)을 제외하고, 오직 성격(persona)만 사용하여
-    성공/실패 결과에 대한 리액션만 생성합니다.
+    [아이디어 묶음 생성 프롬프트]
+    한 번의 호출로 아이디어 count개를 번호 붙은 태그로 받습니다.
+    """
+    return f'''
+[역할 부여]
+{character['persona']}
+
+[미션]
+너의 성격에 맞는 기상천외하고 웃긴 스타트업 아이디어를 서로 다른 내용으로 {count}개 제안해줘.
+
+[응답 규칙 - 필수]
+1. 각 아이디어는 반드시 아래 포맷을 따라서 답변해야 해:
+   {character['idea_format']}
+2. 각 아이디어 본문은 **구분선이나 줄바꿈 없이 하나의 단락**으로 자연스럽게 연결해서 출력해.
+3. 질문형 마무리나 "함께 가자"는 식의 권유 멘트는 절대 하지 마.
+
+[출력 태그 가이드 - 번호 N은 1부터 {count}까지]
+[TITLE N] N번째 아이디어 제목 (15자 이내)
+[DESC N] N번째 아이디어 제안 본문 (250자 미만)
+'''
+
+
+def ideas_config(count):
+    """아이디어 묶음 생성용 모델 설정 (아이디어 수만큼 출력 토큰 확보)"""
+    return {
+        'max_output_tokens': 300 * count,
+        'temperature': 0.9  # 묶음 안에서 아이디어가 겹치지 않도록 조금 더 높게
+    }
+
+
+IDEA_BLOCK_TAG = re.compile(r'\[(TITLE|DESC)\s*(\d+)\]')
+
+
+def parse_ideas(text, character):
+    """
+    번호 붙은 [TITLE N]/[DESC N] 태그 파싱
+    본문(DESC)이 없는 블록은 버리고, 번호 순서대로 리스트를 반환합니다.
+    """
+    blocks = {}
+    matches = list(IDEA_BLOCK_TAG.finditer(text))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        value = text[match.end():end].strip()
+        field = 'title' if match.group(1) == 'TITLE' else 'description'
+        blocks.setdefault(int(match.group(2)), {})[field] = value
+
+    ideas = []
+    for number in sorted(blocks):
+        block = blocks[number]
+        if not block.get('description'):
+            continue
+        ideas.append({
+            'title': block.get('title') or f"{character['name']}의 비밀 프로젝트",
+            'description': block['description']
+        })
+    return ideas
+
+
+def fetch_ideas(character, count):
+    """
+    [아이디어 묶음 생성 - 원본 호출]
+    페르소나 프롬프트를 한 번만 보내고 아이디어 여러 개를 받아옵니다.
+    (캐시 채우기/배포 직후 워밍업용, API 오류는 그대로 raise)
+    """
+    if count <= 1:
+        return [fetch_idea(character)]
+
+    response = call_llm('batch', build_ideas_prompt(character, count), **ideas_config(count))
+    return parse_ideas(response.text, character)[:count]
+
+
+def stream_idea(character):
+    """
+    [아이디어 생성 단계 - 스트리밍]
+    생성되는 텍스트 조각(chunk)을 도착하는 대로 yield 합니다.
+    API 오류는 그대로 raise 합니다.
+    """
+    backend = get_backend()
+    yield from guarded.stream(
+        'idea_stream',
+        lambda: backend.stream(build_idea_prompt(character), **idea_config()),
+        deadline=settings.LLM_CALL_BUDGETS['idea_stream']['DEADLINE'],
+    )
+
+
+class IdeaStreamParser:
+    """
+    스트리밍 중인 [TITLE]/[DESC] 텍스트를 점진적으로 파싱
+    feed()에 조각을 넣으면 새로 확정된 (필드, 추가 텍스트) 목록을 돌려줍니다.
+    """
+    TAGS = {'[TITLE]': 'title', '[DESC]': 'description'}
+
+    def __init__(self):
+        self.text = ''
+        self._sent = {'title': '', 'description': ''}
+
+    def feed(self, chunk):
+        self.text += chunk
+        events = []
+        for field, value in self._current_values().items():
+            sent = self._sent[field]
+            if len(value) > len(sent) and value.startswith(sent):
+                events.append((field, value[len(sent):]))
+                self._sent[field] = value
+        return events
+
+    def _current_values(self):
+        text = self.text
+        # 태그가 조각 경계에서 잘렸으면 (예: "[DE") 다음 조각까지 보류
+        last_open = text.rfind('[')
+        if last_open != -1 and ']' not in text[last_open:]:
+            text = text[:last_open]
+
+        values = {}
+        for tag, field in self.TAGS.items():
+            pos = text.find(tag)
+            if pos == -1:
+                continue
+            value = text[pos + len(tag):]
+            for other in self.TAGS:
+                if other in value:
+                    value = value[:value.index(other)]
+            # 한 줄짜리 태그 (파싱 로직과 동일하게 줄바꿈에서 끊음)
+            value = value.split('\n')[0].lstrip()
+            values[field] = value
+        return values
+
+
+def build_result_prompt(character, idea_title, is_success):
+    """
+    [결과 반응 프롬프트]
+    제안 규칙(idea_format)을 제외하고, 오직 성격(persona)만 사용합니다.
     """
     result_type = "대성공 (초대박)" if is_success else "완전 실패 (폭망)"
     
-    prompt = f'''
+    return f'''
 [역할 부여]
 {character['persona']}
 
@@ -204,40 +494,73 @@ def generate_result(character, idea_title, is_success):
 [REACTION] 성공/실패한 아이디어와 관련된 캐릭터의 직접적인 반응 대사 (1~2문장)
 '''
 
+
+def parse_result(text):
+    """[SYSTEM]/[REACTION] 태그 파싱"""
+    system_msg = ''
+    reaction = ''
+    
+    for line in text.strip().split('\n'):
+        if '[SYSTEM]' in line:
+            system_msg = line.replace('[SYSTEM]', '').strip()
+        elif '[REACTION]' in line:
+            reaction = line.replace('[REACTION]', '').strip()
+    
+    if not system_msg:
+        metrics.llm_parse_failures.inc(kind='result', tag='SYSTEM')
+    if not reaction:
+        metrics.llm_parse_failures.inc(kind='result', tag='REACTION')
+    
+    return {
+        'system_msg': system_msg or '결과가 집계되었습니다.',
+        'reaction': reaction or '...'
+    }
+
+
+def generate_result(character, idea_title, is_success):
+    """
+    [결과 반응 단계]
+    성공/실패 결과에 대한 리액션만 생성합니다.
+    """
+    start = time.perf_counter()
     try:
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                thinking_config=types.ThinkingConfig(thinking_level="minimal")
-            )
-        )
-        text = response.text.strip()
-        
-        # 파싱 로직
-        system_msg = ''
-        reaction = ''
-        
-        for line in text.split('\n'):
-            if '[SYSTEM]' in line:
-                system_msg = line.replace('[SYSTEM]', '').strip()
-            elif '[REACTION]' in line:
-                reaction = line.replace('[REACTION]', '').strip()
-        
-        return {
-            'system_msg': system_msg or '결과가 집계되었습니다.',
-            'reaction': reaction or '...'
-        }
+        response = call_llm('result', build_result_prompt(character, idea_title, is_success))
+        result = parse_result(response.text)
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_result', outcome='ok')
+        return result
     
     except Exception as e:
         print(f"Gemini API Error (Result): {e}")
-        if is_success:
-            return {
-                'system_msg': f'{character["name"]}의 사업이 대박났습니다!',
-                'reaction': '와! 진짜 대박이다!'
-            }
-        else:
-            return {
-                'system_msg': f'{character["name"]}의 사업이 망했습니다...',
-                'reaction': '으악... 내 돈...'
-            }
\ No newline at end of file
+        metrics.llm_fallbacks.inc(function='generate_result', reason=fallback_reason(e))
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_result', outcome='fallback')
+        return fallback_result(character, is_success)
+
+
+async def agenerate_result(character, idea_title, is_success):
+    """generate_result()의 async 버전"""
+    start = time.perf_counter()
+    try:
+        response = await acall_llm('result', build_result_prompt(character, idea_title, is_success))
+        result = parse_result(response.text)
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_result', outcome='ok')
+        return result
+
+    except Exception as e:
+        print(f"Gemini API Error (Result): {e}")
+        metrics.llm_fallbacks.inc(function='generate_result', reason=fallback_reason(e))
+        metrics.llm_generate_seconds.observe(time.perf_counter() - start, function='generate_result', outcome='fallback')
+        return fallback_result(character, is_success)
+
+
+def fallback_result(character, is_success):
+    """API 오류/지연 시 사용할 기본 결과 문구"""
+    if is_success:
+        return {
+            'system_msg': f'{character["name"]}의 사업이 대박났습니다!',
+            'reaction': '와! 진짜 대박이다!'
+        }
+    else:
+        return {
+            'system_msg': f'{character["name"]}의 사업이 망했습니다...',
+            'reaction': '으악... 내 돈...'
+        }
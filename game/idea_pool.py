@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+
+from . import metrics
+from .gemini_service import CHARACTERS, fetch_ideas, generate_idea
+
+
+# ============================================================
+# 캐릭터별 아이디어 풀 (백그라운드 미리 생성)
+# ============================================================
+class IdeaPool:
+    """
+    캐릭터별로 미리 생성해둔 아이디어 저장소
+    - 백그라운드 워커가 low 워터마크 아래로 내려간 풀을 high 워터마크까지 채움
+    - pop()은 O(1), 비어 있으면 None 반환 (호출 측에서 실시간 생성)
+    """
+
+    def __init__(self, low_watermark, high_watermark, poll_interval):
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.poll_interval = poll_interval
+
+        self._pools = {key: deque() for key in CHARACTERS}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self._worker_pid = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def pop(self, key):
+        """준비된 아이디어 하나 꺼내기 (없으면 None)"""
+        self.start()
+
+        pool = self._pools.get(key)
+        try:
+            idea = pool.popleft()
+        except (AttributeError, IndexError):
+            idea = None
+
+        with self._lock:
+            if idea is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        # 워터마크 아래로 내려가면 워커 깨우기
+        if pool is not None and len(pool) < self.low_watermark:
+            self._wakeup.set()
+        return idea
+
+    def stats(self):
+        """모니터링용 풀 깊이 및 hit/miss 카운터"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            'depth': {key: len(pool) for key, pool in self._pools.items()},
+            'hits': hits,
+            'misses': misses,
+            'low_watermark': self.low_watermark,
+            'high_watermark': self.high_watermark,
+        }
+
+    def start(self):
+        """워커 시작 (이미 돌고 있으면 무시)"""
+        # fork 이후에는 부모의 스레드가 없으므로 프로세스마다 워커를 새로 띄움
+        if self._worker is not None and self._worker_pid == os.getpid() and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+            self._worker_pid = os.getpid()
+            self._worker = threading.Thread(target=self._run, name='idea-pool-worker', daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            failed = False
+            for key, pool in self._pools.items():
+                if len(pool) < self.low_watermark:
+                    failed = not self._refill(key, pool) or failed
+            if failed:
+                # API 장애 시 pop() 때마다 재시도하지 않도록 한 주기 쉬기
+                time.sleep(self.poll_interval)
+            else:
+                self._wakeup.wait(timeout=self.poll_interval)
+
+    def _refill(self, key, pool):
+        character = CHARACTERS[key]
+        while len(pool) < self.high_watermark:
+            # 모자란 개수만큼 한 번의 호출로 묶어서 생성
+            try:
+                ideas = fetch_ideas(character, self.high_watermark - len(pool))
+            except Exception as e:
+                # 오류 문구는 풀에 넣지 않고 다음 주기에 재시도
+                print(f"Idea Pool Error ({key}): {e}")
+                return False
+            if not ideas:
+                print(f"Idea Pool Error ({key}): 아이디어 파싱 실패")
+                return False
+            pool.extend(ideas)
+        return True
+
+
+idea_pool = IdeaPool(
+    low_watermark=settings.IDEA_POOL_LOW_WATERMARK,
+    high_watermark=settings.IDEA_POOL_HIGH_WATERMARK,
+    poll_interval=settings.IDEA_POOL_POLL_INTERVAL,
+)
+
+
+@metrics.register_collector
+def _collect_pool_metrics():
+    stats = idea_pool.stats()
+    return [
+        ('unicorn_idea_pool_depth', 'gauge', '캐릭터별 준비된 아이디어 수',
+         [({'character': key}, depth) for key, depth in stats['depth'].items()]),
+        ('unicorn_idea_pool_hits_total', 'counter', '풀에서 바로 꺼낸 횟수', [({}, stats['hits'])]),
+        ('unicorn_idea_pool_misses_total', 'counter', '풀이 비어 있던 횟수', [({}, stats['misses'])]),
+    ]
+
+
+def take_pooled_idea(character):
+    """풀에 준비된 아이디어 꺼내기 (풀 비활성 또는 비어 있으면 None)"""
+    if not settings.IDEA_POOL_ENABLED:
+        return None
+    return idea_pool.pop(character['key'])
+
+
+def get_idea(character):
+    """
+    아이디어 가져오기
+    풀에 준비된 아이디어가 있으면 바로 꺼내고, 비어 있으면 실시간 생성합니다.
+    """
+    idea = take_pooled_idea(character)
+    if idea is None:
+        idea = generate_idea(character)
+    return idea
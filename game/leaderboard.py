@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import GameSession, LeaderboardEntry
+
+
+# ============================================================
+# 랭킹 보드 (상위 K개만 유지하는 테이블)
+# - 쓰기: 게임 종료 시 record() 한 번
+# - 읽기: 보드의 K개 행만 조회 (GameSession 전체 정렬 없음)
+# ============================================================
+
+def board_day(session):
+    """오늘의 랭킹 날짜 (한국 시간 기준 게임 종료일)"""
+    return session.finished_on or timezone.localdate(session.created_at)
+
+
+def _boards(session):
+    return [
+        (LeaderboardEntry.BOARD_DAILY, board_day(session), settings.LEADERBOARD_DAILY_SIZE),
+        (LeaderboardEntry.BOARD_ALL_TIME, None, settings.LEADERBOARD_ALL_TIME_SIZE),
+    ]
+
+
+def record(session):
+    """
+    종료된 게임을 각 보드에 반영 (상위 K 밖이면 아무것도 안 함)
+    반환: 실제로 바뀐 보드 목록 [(board, day), ...]
+    """
+    changed = []
+    if session.final_profit_rate is None:
+        return changed
+
+    with transaction.atomic():
+        for board, day, size in _boards(session):
+            entries = LeaderboardEntry.objects.filter(board=board, day=day)
+            lowest = entries.order_by('-profit_rate', 'session_id').values_list('profit_rate', flat=True)[size - 1:size]
+            lowest = list(lowest)
+            if lowest and session.final_profit_rate <= lowest[0]:
+                continue
+
+            # 종료 처리는 세션당 한 번(transitions.finish)이라 보통은 INSERT, rebuild 직후면 UPDATE
+            values = {'day': day, 'profit_rate': session.final_profit_rate}
+            if not LeaderboardEntry.objects.filter(board=board, session=session).update(**values):
+                LeaderboardEntry.objects.create(board=board, session=session, **values)
+            _trim(entries, size)
+            changed.append((board, day))
+    return changed
+
+
+def _trim(entries, size):
+    """보드를 상위 size개로 자르기 (DELETE 한 번, 상위 목록은 서브쿼리)"""
+    keep = entries.order_by('-profit_rate', 'session_id').values('pk')[:size]
+    entries.exclude(pk__in=keep).delete()
+
+
+def _sessions(board, day, limit):
+    return GameSession.objects.filter(
+        leaderboard_entries__board=board,
+        leaderboard_entries__day=day,
+    ).select_related('user').order_by('-final_profit_rate', 'pk')[:limit]
+
+
+def get_daily(day, limit):
+    """해당 날짜 랭킹 (GameSession 쿼리셋, 최대 LEADERBOARD_DAILY_SIZE개)"""
+    return _sessions(LeaderboardEntry.BOARD_DAILY, day, limit)
+
+
+def get_all_time(limit):
+    """명예의 전당 (GameSession 쿼리셋, 최대 LEADERBOARD_ALL_TIME_SIZE개)"""
+    return _sessions(LeaderboardEntry.BOARD_ALL_TIME, None, limit)
+
+
+def rebuild(days=None):
+    """
+    GameSession 원본으로 보드 다시 만들기 (복구용)
+    days를 주면 최근 며칠의 오늘의 랭킹만 다시 만듭니다.
+    반환: 생성한 항목 수
+    """
+    finished = GameSession.objects.filter(is_finished=True, final_profit_rate__isnull=False)
+    entries = []
+
+    with transaction.atomic():
+        # 명예의 전당
+        LeaderboardEntry.objects.filter(board=LeaderboardEntry.BOARD_ALL_TIME).delete()
+        for session in finished.order_by('-final_profit_rate', 'pk')[:settings.LEADERBOARD_ALL_TIME_SIZE]:
+            entries.append(LeaderboardEntry(
+                board=LeaderboardEntry.BOARD_ALL_TIME, day=None,
+                session=session, profit_rate=session.final_profit_rate,
+            ))
+
+        # 오늘의 랭킹 (날짜별)
+        daily = LeaderboardEntry.objects.filter(board=LeaderboardEntry.BOARD_DAILY)
+        dated = finished.filter(finished_on__isnull=False)
+        if days is not None:
+            since = timezone.localdate() - timedelta(days=days - 1)
+            daily = daily.filter(day__gte=since)
+            dated = dated.filter(finished_on__gte=since)
+        daily.delete()
+
+        dates = dated.order_by('finished_on').values_list('finished_on', flat=True).distinct()
+        for day in dates:
+            # (finished_on, -final_profit_rate) 인덱스 범위 조회
+            top = finished.filter(finished_on=day).order_by('-final_profit_rate', 'pk')
+            for session in top[:settings.LEADERBOARD_DAILY_SIZE]:
+                entries.append(LeaderboardEntry(
+                    board=LeaderboardEntry.BOARD_DAILY, day=day,
+                    session=session, profit_rate=session.final_profit_rate,
+                ))
+
+        LeaderboardEntry.objects.bulk_create(entries)
+    return len(entries)
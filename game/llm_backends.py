@@ -0,0 +1,294 @@
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Iterator, Protocol
+
+# google-genai SDK / httpx 는 import 비용이 커서 (수백 ms) 실제 호출 시점에 import 합니다.
+# migrate, admin, 랭킹처럼 LLM을 쓰지 않는 프로세스/요청은 비용을 내지 않음
+
+
+# ============================================================
+# LLM 백엔드 인터페이스
+# ============================================================
+@dataclass
+class LLMResponse:
+    """LLM 응답 (텍스트 + 토큰 사용량)"""
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class LLMBackend(Protocol):
+    """
+    LLM 백엔드 프로토콜
+    - generate(): 완성된 응답 한 번에 받기
+    - stream(): 생성되는 텍스트 조각을 도착하는 대로 받기
+    - agenerate(): generate()의 async 버전 (ASGI용 async 뷰에서 사용, 기다리는 동안 스레드를 잡지 않음)
+    """
+
+    def generate(self, prompt, *, max_output_tokens=None, temperature=None) -> LLMResponse:
+        ...
+
+    async def agenerate(self, prompt, *, max_output_tokens=None, temperature=None) -> LLMResponse:
+        ...
+
+    def stream(self, prompt, *, max_output_tokens=None, temperature=None) -> Iterator[str]:
+        ...
+
+
+# ============================================================
+# Gemini (실서비스)
+# ============================================================
+class GeminiBackend:
+    """
+    google-genai SDK 기반 백엔드
+    SDK import와 클라이언트 생성은 첫 호출(또는 warm_up) 때 한 번만 합니다.
+    """
+
+    def __init__(self, model='gemini-3-flash-preview', timeout=30, api_key=None):
+        self.model = model
+        self.timeout = timeout
+        self.api_key = api_key
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def _create_client(self):
+        from dotenv import load_dotenv
+        from google import genai
+        from google.genai import types
+
+        # .env 파일 로드
+        load_dotenv()
+        return genai.Client(
+            api_key=self.api_key or os.getenv('GEMINI_API_KEY'),
+            http_options=types.HttpOptions(timeout=int(self.timeout * 1000)),  # 밀리초 단위
+        )
+
+    def warm_up(self):
+        """SDK import + 클라이언트 생성을 미리 해둠 (워커 fork 직후)"""
+        self.client
+
+    def _config(self, max_output_tokens, temperature):
+        from google.genai import types
+
+        return types.GenerateContentConfig(
+            thinking_config=types.ThinkingConfig(thinking_level="minimal"),
+            max_output_tokens=max_output_tokens,
+            temperature=temperature
+        )
+
+    def generate(self, prompt, *, max_output_tokens=None, temperature=None):
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self._config(max_output_tokens, temperature)
+        )
+        return self._response(response)
+
+    async def agenerate(self, prompt, *, max_output_tokens=None, temperature=None):
+        # 같은 클라이언트의 async API (client.aio)
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self._config(max_output_tokens, temperature)
+        )
+        return self._response(response)
+
+    def _response(self, response):
+        usage = response.usage_metadata
+        return LLMResponse(
+            text=response.text or '',
+            input_tokens=(usage and usage.prompt_token_count) or 0,
+            output_tokens=(usage and usage.candidates_token_count) or 0,
+        )
+
+    def stream(self, prompt, *, max_output_tokens=None, temperature=None):
+        stream = self.client.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+            config=self._config(max_output_tokens, temperature)
+        )
+        for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+
+
+# ============================================================
+# Fake (프로세스 내부, 네트워크 없음)
+# ============================================================
+class FakeBackend:
+    """
+    결정적(deterministic) 가짜 백엔드
+    프롬프트의 출력 태그 가이드를 보고 형식에 맞는 응답을 만들어 줍니다.
+    latency(초)를 주면 실제 API처럼 지연을 흉내냅니다. (부하 테스트/CI용)
+    """
+
+    BATCH_COUNT = re.compile(r'1부터 (\d+)까지')
+
+    def __init__(self, latency=0.0, chunk_size=8):
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _next_seq(self):
+        with self._lock:
+            return next(self._counter)
+
+    def _render(self, prompt):
+        seq = self._next_seq()
+        digest = hashlib.sha1(f'{prompt}{seq}'.encode()).hexdigest()[:6]
+
+        if '[SYSTEM]' in prompt:
+            if '대성공' in prompt:
+                return (f'[SYSTEM] 사업 #{digest}이(가) 입소문을 타고 대박이 났습니다.\n'
+                        f'[REACTION] 제가 뭐랬어요! 이건 될 줄 알았다니까요!')
+            return (f'[SYSTEM] 사업 #{digest}은(는) 시장의 외면을 받고 문을 닫았습니다.\n'
+                    f'[REACTION] 이건... 시장이 아직 준비가 안 된 거예요...')
+
+        batch = self.BATCH_COUNT.search(prompt)
+        if batch:
+            count = int(batch.group(1))
+            return '\n'.join(
+                f'[TITLE {n}] 테스트 아이디어 {digest}-{n}\n'
+                f'[DESC {n}] 가짜 백엔드가 만든 {n}번째 테스트용 스타트업 아이디어입니다.'
+                for n in range(1, count + 1)
+            )
+
+        return (f'[TITLE] 테스트 아이디어 {digest}\n'
+                f'[DESC] 가짜 백엔드가 만든 테스트용 스타트업 아이디어입니다. 투자하시면 대박 납니다.')
+
+    def generate(self, prompt, *, max_output_tokens=None, temperature=None):
+        text = self._render(prompt)
+        if self.latency:
+            time.sleep(self.latency)
+        return self._response(prompt, text)
+
+    async def agenerate(self, prompt, *, max_output_tokens=None, temperature=None):
+        text = self._render(prompt)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._response(prompt, text)
+
+    def _response(self, prompt, text):
+        # 토큰 수는 대략 4글자당 1토큰으로 계산
+        return LLMResponse(text=text, input_tokens=len(prompt) // 4, output_tokens=len(text) // 4)
+
+    def stream(self, prompt, *, max_output_tokens=None, temperature=None):
+        text = self._render(prompt)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+        for chunk in chunks:
+            if self.latency:
+                time.sleep(self.latency / len(chunks))
+            yield chunk
+
+
+# ============================================================
+# HTTP (로컬 대역 서버 등, 커넥션 풀 재사용)
+# ============================================================
+class HttpBackend:
+    """
+    HTTP JSON 백엔드 (llm_standin_server 커맨드와 같은 프로토콜)
+    - POST /v1/generate → {"text", "usage": {"input_tokens", "output_tokens"}}
+    - POST /v1/stream   → NDJSON 줄마다 {"text"}
+    keep-alive 커넥션 풀을 명시적으로 잡아서 요청마다 TCP 연결을 새로 맺지 않습니다.
+    """
+
+    def __init__(self, url='http://127.0.0.1:8765', timeout=10, connect_timeout=2,
+                 pool_size=20, keepalive_expiry=30):
+        import httpx
+
+        self._client_options = dict(
+            base_url=url,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self.client = httpx.Client(**self._client_options)
+        # async 클라이언트의 커넥션은 이벤트 루프에 묶이므로 루프마다 따로 만듦 (보통 워커당 루프 1개)
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def _async_client(self):
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(**self._client_options)
+        return client
+
+    def warm_up(self):
+        """커넥션 풀에 연결 하나를 미리 열어둠 (응답 코드는 무시)"""
+        try:
+            self.client.get('/')
+        except Exception as e:
+            print(f"LLM Warm-up Error (http): {e}")
+
+    def _payload(self, prompt, max_output_tokens, temperature):
+        return {'prompt': prompt, 'max_output_tokens': max_output_tokens, 'temperature': temperature}
+
+    def generate(self, prompt, *, max_output_tokens=None, temperature=None):
+        response = self.client.post('/v1/generate', json=self._payload(prompt, max_output_tokens, temperature))
+        return self._response(response)
+
+    async def agenerate(self, prompt, *, max_output_tokens=None, temperature=None):
+        response = await self._async_client().post(
+            '/v1/generate', json=self._payload(prompt, max_output_tokens, temperature),
+        )
+        return self._response(response)
+
+    def _response(self, response):
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get('usage') or {}
+        return LLMResponse(
+            text=data.get('text', ''),
+            input_tokens=usage.get('input_tokens', 0),
+            output_tokens=usage.get('output_tokens', 0),
+        )
+
+    def stream(self, prompt, *, max_output_tokens=None, temperature=None):
+        payload = self._payload(prompt, max_output_tokens, temperature)
+        with self.client.stream('POST', '/v1/stream', json=payload) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line).get('text', '')
+
+
+BACKEND_CLASSES = {
+    'gemini': GeminiBackend,
+    'fake': FakeBackend,
+    'http': HttpBackend,
+}
+
+
+def create_backend(name, options=None):
+    """
+    이름과 옵션(settings.LLM_BACKENDS 항목)으로 백엔드 생성
+    옵션 키는 대문자(settings 스타일) → 소문자 인자로 변환합니다.
+    """
+    try:
+        backend_class = BACKEND_CLASSES[name]
+    except KeyError:
+        raise ValueError(f'알 수 없는 LLM 백엔드: {name}')
+    kwargs = {key.lower(): value for key, value in (options or {}).items()}
+    return backend_class(**kwargs)
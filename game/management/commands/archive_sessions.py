@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from game import archive
+
+
+class Command(BaseCommand):
+    """
+    종료된 지 오래된 게임의 투자 기록을 압축 보관 (game/archive.py)
+    게임마다 투자 기록을 zlib 압축 JSON 하나(SessionArchive)로 옮기고 Investment 행을 지웁니다.
+    게임 행, 랭킹 보드, 누적 통계는 그대로이고, 마이페이지에서는 보관된 기록도 똑같이 보입니다.
+    배치마다 한 트랜잭션이므로 중간에 멈춰도 다시 실행하면 이어서 처리합니다.
+    """
+    help = 'N일 지난 종료 게임의 투자 기록을 압축 보관 테이블로 이동'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=90, help='이 기간보다 오래된 게임만 (시작 시각 기준)')
+        parser.add_argument('--batch-size', type=int, default=200, help='한 트랜잭션에서 처리할 게임 수')
+        parser.add_argument('--dry-run', action='store_true', help='대상 게임 수만 출력')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        pending = archive.candidates(cutoff)
+        if options['dry_run']:
+            self.stdout.write(f'보관 대상: 게임 {pending.count()}개 ({cutoff:%Y-%m-%d %H:%M} 이전 시작)')
+            return
+
+        sessions = investments = raw_size = packed_size = 0
+        while True:
+            ids = list(pending.order_by('pk').values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            done, count, raw, packed = archive.archive_batch(ids)
+            sessions += done
+            investments += count
+            raw_size += raw
+            packed_size += packed
+            self.stdout.write(f'  게임 {sessions}개 / 투자 기록 {investments}건 보관')
+
+        ratio = packed_size / raw_size if raw_size else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'보관 완료: 게임 {sessions}개, 투자 기록 {investments}건, '
+            f'{raw_size / 1024:.1f}KB → {packed_size / 1024:.1f}KB ({ratio:.0%})'
+        ))
+        if sessions and connection.vendor == 'sqlite':
+            self.stdout.write('SQLite 파일 크기를 줄이려면 점검 시간에 VACUUM을 실행하세요.')
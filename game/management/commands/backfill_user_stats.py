@@ -0,0 +1,107 @@
+from collections import defaultdict
+from itertools import chain
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, Sum
+
+from game import archive, rules
+from game.gemini_service import get_character_by_name
+from game.models import GameSession, Investment, UserCharacterStats, UserStats
+
+
+class Command(BaseCommand):
+    """
+    UserStats/UserCharacterStats를 기존 기록으로 다시 계산 (롤업 테이블 도입 전 기록 반영/복구용)
+    - 투자 횟수/성공/투자금/손익: Investment 전체 + 보관된 투자 기록 (손익은 rules와 같은 식으로 다시 계산)
+    - 패스: 게임별 (MAX_PASSES - 남은 패스) 합계
+    - 파산: 자본금 0 이하로 끝난 게임 수
+    - 강화: 횟수 기록이 없으므로 기존 값과 "강화한 적 있는 게임 수" 중 큰 값 유지
+    통계 테이블을 잠근 트랜잭션 안에서 기록을 읽고 지우고 다시 만들므로,
+    실행 중인 게임의 통계 갱신은 그동안 대기했다가 다시 계산한 값 위에 더해집니다.
+    (SQLite는 IMMEDIATE 트랜잭션이라 시작할 때 쓰기 잠금, PostgreSQL은 LOCK TABLE)
+    """
+    help = '유저 누적 통계(마이페이지) 롤업 테이블을 기존 기록으로 다시 계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        with transaction.atomic():
+            existing = self._lock_stats()
+            totals, per_character, unknown = self._aggregate(batch_size)
+            for user_id, bucket in totals.items():
+                bucket['enchants'] = max(bucket['enchants'], existing.get(user_id, 0))
+
+            UserStats.objects.all().delete()
+            UserCharacterStats.objects.all().delete()
+            UserStats.objects.bulk_create(
+                [UserStats(user_id=user_id, **bucket) for user_id, bucket in totals.items()],
+                batch_size=batch_size,
+            )
+            UserCharacterStats.objects.bulk_create(
+                [UserCharacterStats(user_id=user_id, character_key=key, **bucket)
+                 for (user_id, key), bucket in per_character.items()],
+                batch_size=batch_size,
+            )
+
+        if unknown:
+            self.stdout.write(self.style.WARNING(f"캐릭터 목록에 없는 이름 (이름 그대로 저장): {', '.join(sorted(unknown))}"))
+        self.stdout.write(self.style.SUCCESS(
+            f'유저 {len(totals)}명, 캐릭터별 {len(per_character)}행 다시 계산'
+        ))
+
+    def _lock_stats(self):
+        """
+        통계 테이블 잠금 (트랜잭션 안에서 호출), 기존 강화 횟수 {user_id: enchants} 반환
+        잠근 뒤에 기록을 읽어야 그 사이에 커밋된 stats 증가분이 지워지지 않음
+        """
+        if connection.vendor == 'postgresql':
+            # 행 잠금만으로는 처음 통계 행을 만드는 INSERT를 막지 못하므로 테이블 단위 (읽기는 허용)
+            tables = ', '.join(
+                connection.ops.quote_name(model._meta.db_table) for model in (UserStats, UserCharacterStats)
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f'LOCK TABLE {tables} IN EXCLUSIVE MODE')
+        # SQLite는 IMMEDIATE 트랜잭션 시작 때 이미 쓰기 잠금 (select_for_update는 무시됨)
+        return dict(UserStats.objects.select_for_update().values_list('user_id', 'enchants'))
+
+    def _aggregate(self, batch_size):
+        """기존 기록으로 (유저별 합계, (유저, 캐릭터)별 합계, 목록에 없는 캐릭터 이름) 계산"""
+        totals = defaultdict(lambda: defaultdict(int))
+        per_character = defaultdict(lambda: defaultdict(int))
+        unknown = set()
+
+        hot = Investment.objects.values_list(
+            'session__user_id', 'character_name', 'invest_amount', 'is_success', 'profit_rate',
+        ).iterator(chunk_size=batch_size)
+        archived = (
+            (user_id, i.character_name, i.invest_amount, i.is_success, i.profit_rate)
+            for user_id, i in archive.iter_archived()
+        )
+        for user_id, character_name, amount, is_success, profit_rate in chain(hot, archived):
+            character = get_character_by_name(character_name)
+            if character is None:
+                unknown.add(character_name)
+                key = character_name
+            else:
+                key = character['key']
+            delta = int(rules.investment_return(amount, profit_rate)) if is_success else -amount
+            for bucket in (totals[user_id], per_character[user_id, key]):
+                bucket['investments'] += 1
+                bucket['successes'] += int(is_success)
+                bucket['total_invested'] += amount
+                bucket['total_profit'] += delta
+
+        sessions = GameSession.objects.values('user_id').annotate(
+            passes=Sum(rules.MAX_PASSES - F('remaining_reroles')),
+            bankruptcies=Count('pk', filter=Q(is_finished=True, current_capital__lte=0)),
+            enchanted_games=Count('pk', filter=Q(enchanted_turn__isnull=False)),
+        )
+        for row in sessions:
+            bucket = totals[row['user_id']]
+            bucket['passes'] = row['passes'] or 0
+            bucket['bankruptcies'] = row['bankruptcies']
+            bucket['enchants'] = row['enchanted_games']
+        return totals, per_character, unknown
@@ -0,0 +1,239 @@
+import json
+import random
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import Client
+from django.test.utils import ContextList, override_settings, setup_test_environment
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from game import leaderboard
+from game.benchmarking import seed_games, temporary_database, time_interleaved
+from game.gemini_service import (
+    CHARACTERS, IdeaStreamParser, parse_idea, parse_ideas, parse_result, set_backend,
+)
+from game.llm_backends import FakeBackend
+from game.models import GameSession, User
+from game.templatetags.number_filters import add_comma, korean_currency
+from game.views import get_prob_level
+
+DEFAULT_BASELINE = settings.BASE_DIR / 'bench_baseline.json'
+
+# 회귀 비교는 최솟값(min_ms) 기준: 중앙값은 GC/스케줄링 잡음에 같은 코드로도 수십 % 흔들림
+# 이보다 작은 차이는 측정 오차로 보고 회귀로 치지 않음 (밀리초)
+MIN_DELTA_MS = 0.2
+# 기준값이 SMALL_ITEM_MS 미만인 항목은 상대 오차가 커서 --threshold 대신 최소 이 비율을 적용
+SMALL_ITEM_MS = 1.0
+SMALL_ITEM_THRESHOLD = 0.5
+
+# 실제 모델 응답과 비슷한 길이의 파싱 입력
+IDEA_TEXT = (
+    '[TITLE] 반려식물 감정 번역기 "풀톡"\n'
+    '[DESC] 안녕하세요! 저는 화분에 센서를 꽂으면 식물의 수분/광량/온도 데이터를 분석해서 '
+    '"목말라요", "햇빛 좀요" 같은 말로 번역해주는 앱을 만들고 싶어요. 1인 가구 반려식물 시장이 '
+    '매년 20%씩 커지고 있고, 투자해주시면 1년 안에 구독자 10만 명을 달성하겠습니다. 야르~ ㅋㅋ\n'
+)
+IDEAS_TEXT = '\n'.join(
+    f'[TITLE {n}] 테스트 아이디어 {n}\n[DESC {n}] 번호가 붙은 {n}번째 아이디어 설명입니다. ' + '근거와 계획. ' * 20
+    for n in range(1, 6)
+)
+RESULT_TEXT = (
+    '[SYSTEM] 풀톡은 식물 집사들 사이에서 입소문을 타며 출시 3개월 만에 앱스토어 1위를 차지했습니다.\n'
+    '[REACTION] 제가 뭐랬어요! 식물도 말하고 싶었던 거라니까요? 어쩔티비 ㅋㅋ 야르~\n'
+)
+
+RANKING_TABLE = Template(
+    '{% load number_filters %}{% for s in sessions %}'
+    '<tr><td>{{ forloop.counter }}</td><td>{{ s.user.nickname }}</td>'
+    '<td>{{ s.current_capital|korean_currency }}</td><td>{{ s.current_capital|add_comma }}</td>'
+    '<td>{{ s.final_profit_rate|floatformat:1 }}%</td></tr>{% endfor %}'
+)
+
+
+class Command(BaseCommand):
+    """
+    마이크로 벤치마크 (임시 DB에 데이터를 넣고 측정)
+    - templates/game/ 각 템플릿 렌더링 (실제 뷰가 만든 context 그대로 재사용)
+    - korean_currency/add_comma 필터, 큰 랭킹 표 렌더링
+    - get_prob_level
+    - gemini_service의 [TITLE]/[DESC]/[SYSTEM]/[REACTION] 파싱
+    - 랭킹 쿼리 (leaderboard.get_daily/get_all_time)
+    --save로 기준값(JSON)을 저장하고, --check면 기준값보다 --threshold 이상 느려진 항목이 있을 때 실패합니다.
+    항목을 번갈아 반복 실행하고 최솟값으로 비교하며, 다음을 모두 만족할 때만 회귀로 봅니다.
+      - 최솟값 증가율 > --threshold (기준값이 1ms 미만인 항목은 최소 50%)
+      - 증가량 > MIN_DELTA_MS
+      - 이번 최솟값 > 기준값의 중앙값 (기준값 측정의 흔들림보다 큰 차이)
+    --check에서 회귀로 보이는 항목은 한 번 더 측정해서 그래도 느릴 때만 실패합니다.
+    기준값은 측정한 기계에서만 의미가 있으므로 저장소에는 올리지 않습니다.
+    """
+    help = '템플릿/필터/파싱/랭킹 쿼리 마이크로 벤치마크 (기준값 저장/회귀 확인)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=50, help='항목당 반복 횟수')
+        parser.add_argument('--filter', default='', help='이름에 이 문자열이 들어간 항목만 실행')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='기준값 JSON 경로')
+        parser.add_argument('--save', action='store_true', help='이번 결과를 기준값으로 저장')
+        parser.add_argument('--check', action='store_true', help='기준값보다 느려진 항목이 있으면 실패')
+        parser.add_argument('--threshold', type=float, default=0.25, help='회귀로 볼 최솟값 증가율 (0.25 = 25%%)')
+        parser.add_argument('--users', type=int, default=200, help='시드 유저 수')
+
+    def handle(self, *args, **options):
+        baseline = self._load_baseline(options['baseline'], required=options['check'])
+        setup_test_environment()
+        set_backend(FakeBackend())
+
+        # 아이디어를 바로 받아서 play 화면이 완성된 상태로 렌더링되게 함
+        with override_settings(DEBUG=False, IDEA_POOL_ENABLED=False, IDEA_STREAMING=False,
+                               ASYNC_RESULT_REACTION=False):
+            with temporary_database():
+                seed_games(users=options['users'], sessions_per_user=10)
+                leaderboard.rebuild()
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE')
+                funcs = {name: func for name, func in self._suite() if options['filter'] in name}
+                results = time_interleaved(funcs, repeat=options['repeat'])
+                if options['check']:
+                    self._remeasure(funcs, results, baseline, options)
+
+        regressions = self._print(results, baseline, options['threshold'])
+        if options['save']:
+            with open(options['baseline'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            self.stdout.write(f"기준값 저장: {options['baseline']}")
+        if options['check'] and regressions:
+            raise CommandError(f"기준값 대비 {options['threshold']:.0%} 이상 느려짐: {', '.join(regressions)}")
+
+    def _load_baseline(self, path, required):
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            if required:
+                raise CommandError(f'기준값이 없습니다: {path} (먼저 --save로 저장)')
+            return {}
+        except ValueError as e:
+            raise CommandError(f'기준값을 읽을 수 없습니다: {path} ({e})')
+
+    # ---------- 측정 항목 ----------
+
+    def _suite(self):
+        """(이름, 함수) 목록, 함수 한 번 실행이 측정 1회"""
+        suite = [(f'template.{name}', render) for name, render in self._template_renders()]
+
+        rng = random.Random(0)
+        amounts = [rng.randrange(-50000, 10 ** 9) for _ in range(5000)]
+        sessions = list(
+            GameSession.objects.filter(is_finished=True).select_related('user').order_by('-final_profit_rate')[:1000]
+        )
+        probs = [rng.random() * 1.2 for _ in range(5000)]
+        character = CHARACTERS['jaemin']
+        chunks = [IDEA_TEXT[i:i + 8] for i in range(0, len(IDEA_TEXT), 8)]
+
+        def stream():
+            parser = IdeaStreamParser()
+            for chunk in chunks:
+                parser.feed(chunk)
+
+        today = timezone.localdate()
+        suite += [
+            ('filter.korean_currency x5000', lambda: [korean_currency(v) for v in amounts]),
+            ('filter.add_comma x5000', lambda: [add_comma(v) for v in amounts]),
+            ('filter.ranking_table x1000', lambda: RANKING_TABLE.render(Context({'sessions': sessions}))),
+            ('views.get_prob_level x5000', lambda: [get_prob_level(p) for p in probs]),
+            ('parse.idea x100', lambda: [parse_idea(IDEA_TEXT, character) for _ in range(100)]),
+            ('parse.ideas x100', lambda: [parse_ideas(IDEAS_TEXT, character) for _ in range(100)]),
+            ('parse.result x100', lambda: [parse_result(RESULT_TEXT) for _ in range(100)]),
+            ('parse.idea_stream', stream),
+            ('query.ranking_daily', lambda: list(leaderboard.get_daily(today, limit=20))),
+            ('query.ranking_all_time', lambda: list(leaderboard.get_all_time(limit=10))),
+        ]
+        return suite
+
+    def _template_renders(self):
+        """
+        각 화면을 실제 뷰로 한 번 요청해서 context를 받아두고, 그 context로 템플릿만 다시 렌더링
+        (쿼리셋은 첫 렌더링 때 결과가 캐시되므로 이후 측정에는 DB 시간이 거의 들어가지 않음)
+        """
+        user = User.objects.filter(username__startswith='bench').order_by('pk').first()
+        client = Client()
+        client.force_login(user)
+        play_url = client.get(reverse('game:game_start'))['Location']
+        session_id = resolve(play_url).kwargs['session_id']
+        client.get(play_url)
+        turn_no = GameSession.objects.values_list('turn_no', flat=True).get(pk=session_id)
+        response = client.post(reverse('game:invest', args=[session_id]),
+                               {'action': 'invest', 'amount': 2000, 'turn_no': turn_no})
+        result_url = response['Location']
+
+        pages = [
+            ('main', client, reverse('game:main')),
+            ('mypage', client, reverse('game:mypage')),
+            ('play', client, play_url),
+            ('result', client, result_url),
+            ('ranking', client, reverse('game:ranking')),
+            ('login', Client(), reverse('game:login')),
+            ('signup', Client(), reverse('game:signup')),
+        ]
+        renders = []
+        for name, page_client, url in pages:
+            response = page_client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f'{name} 화면 요청 실패: {url} ({response.status_code})')
+            # {% include %}가 있으면 템플릿별 context 목록, 첫 번째가 뷰가 렌더링한 템플릿
+            template_name = response.templates[0].name
+            contexts = response.context
+            context = (contexts[0] if isinstance(contexts, ContextList) else contexts).flatten()
+            request = response.wsgi_request
+            renders.append((name, lambda t=template_name, c=context, r=request: render_to_string(t, c, r)))
+        return renders
+
+    # ---------- 출력 ----------
+
+    def _remeasure(self, funcs, results, baseline, options):
+        """회귀로 보이는 항목만 한 번 더 측정해서 더 빠른 쪽을 남김 (잠깐 느려진 구간에 걸린 경우 배제)"""
+        suspects = [
+            name for name, stats in results.items()
+            if name in baseline and self._is_regression(stats, baseline[name], options['threshold'])
+        ]
+        if not suspects:
+            return
+        self.stdout.write(f"재측정: {', '.join(suspects)}")
+        again = time_interleaved({name: funcs[name] for name in suspects}, repeat=options['repeat'])
+        for name, stats in again.items():
+            if stats['min_ms'] < results[name]['min_ms']:
+                results[name] = stats
+
+    def _is_regression(self, stats, old, threshold):
+        """기준값 대비 회귀 여부 (비교 기준은 Command 설명 참고)"""
+        best = stats['min_ms']
+        old_best = old.get('min_ms', old['median_ms'])  # min_ms가 없는 예전 기준값은 중앙값으로
+        change = (best - old_best) / old_best if old_best else 0
+        limit = max(threshold, SMALL_ITEM_THRESHOLD) if old_best < SMALL_ITEM_MS else threshold
+        # 이번 최솟값이 기준값의 중앙값보다도 느려야 회귀 (기준값 측정 자체의 흔들림 안쪽이면 잡음)
+        return change > limit and best - old_best > MIN_DELTA_MS and best > old['median_ms']
+
+    def _print(self, results, baseline, threshold):
+        """결과 표 + 기준값 비교, 회귀 항목 이름 목록 반환"""
+        regressions = []
+        self.stdout.write(
+            f"{'benchmark':<32}{'min_ms':>9}{'median_ms':>11}{'p95_ms':>9}{'base_min':>10}{'change':>9}"
+        )
+        for name, stats in results.items():
+            best = stats['min_ms']
+            line = f"{name:<32}{best:>9.3f}{stats['median_ms']:>11.3f}{stats['p95_ms']:>9.3f}"
+            old = baseline.get(name)
+            if old is None:
+                self.stdout.write(line)
+                continue
+            old_best = old.get('min_ms', old['median_ms'])
+            change = (best - old_best) / old_best if old_best else 0
+            line += f"{old_best:>10.3f}{change:>+9.0%}"
+            if self._is_regression(stats, old, threshold):
+                regressions.append(name)
+                line = self.style.ERROR(line)
+            self.stdout.write(line)
+        return regressions
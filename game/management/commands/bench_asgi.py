@@ -0,0 +1,172 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from asgiref.sync import ThreadSensitiveContext, async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+
+from game.benchmarking import temporary_database
+from game.gemini_service import set_backend
+from game.llm_backends import FakeBackend
+from game.models import GameSession, User
+
+
+class Command(BaseCommand):
+    """
+    WSGI(sync 뷰 + 스레드 슬롯) vs ASGI(async 뷰 + 이벤트 루프 1개) 부하 비교
+    플레이어 N명이 동시에 한 판씩 (play 화면 → 투자) x 5번을 진행합니다.
+    요청마다 가짜 LLM 호출이 1번씩 있고 (아이디어 생성 / 결과 반응), --latency초 걸립니다.
+    - wsgi: 동시에 처리 중인 요청을 --slots개로 제한 (gunicorn workers x threads)
+    - asgi: 워커 1개, 제한 없음 (LLM을 기다리는 동안 다른 요청 처리)
+    URL 설정은 import 시점에 정해지므로 모드별로 하위 프로세스를 띄워서 실행합니다.
+    """
+    help = 'WSGI vs ASGI 동시 플레이어 처리량 비교 (가짜 LLM 지연)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--players', type=int, default=40, help='동시 플레이어 수')
+        parser.add_argument('--latency', type=float, default=0.5, help='LLM 호출 1번 지연(초)')
+        parser.add_argument(
+            '--slots', type=int,
+            default=int(os.getenv('GUNICORN_WORKERS', 2)) * int(os.getenv('GUNICORN_THREADS', 4)),
+            help='WSGI 동시 처리 요청 수 (기본: GUNICORN_WORKERS x GUNICORN_THREADS)',
+        )
+        parser.add_argument('--mode', choices=['wsgi', 'asgi'], help='한 모드만 실행하고 JSON 출력 (내부용)')
+
+    def handle(self, *args, **options):
+        if options['mode']:
+            self._run_mode(options)
+            return
+
+        results = {mode: self._spawn(mode, options) for mode in ('wsgi', 'asgi')}
+        self.stdout.write(
+            f"players={options['players']} latency={options['latency']}s wsgi_slots={options['slots']}\n"
+            f"{'mode':<6}{'wall':>9}{'req/s':>9}{'p50':>9}{'p95':>9}{'max':>9}{'errors':>8}"
+        )
+        for mode, r in results.items():
+            self.stdout.write(
+                f"{mode:<6}{r['wall']:>8.1f}s{r['rps']:>9.1f}{r['p50']:>8.2f}s{r['p95']:>8.2f}s"
+                f"{r['max']:>8.2f}s{r['errors']:>8}"
+            )
+
+    def _spawn(self, mode, options):
+        env = dict(os.environ, ASYNC_GAME_VIEWS='1' if mode == 'asgi' else '0')
+        if mode == 'asgi':
+            env.setdefault('DB_CONN_MAX_AGE', '0')  # config/asgi.py와 같은 기본값
+        command = [
+            sys.executable, sys.argv[0], 'bench_asgi', '--mode', mode,
+            '--players', str(options['players']), '--latency', str(options['latency']),
+            '--slots', str(options['slots']),
+        ]
+        process = subprocess.run(command, env=env, capture_output=True, text=True)
+        if process.returncode != 0:
+            raise CommandError(f'{mode} 실행 실패\n{process.stderr[-2000:]}')
+        return json.loads(process.stdout.strip().splitlines()[-1])
+
+    # ---------- 한 모드 실행 (하위 프로세스) ----------
+
+    def _run_mode(self, options):
+        if options['mode'] == 'asgi' and not settings.ASYNC_GAME_VIEWS:
+            raise CommandError('asgi 모드는 ASYNC_GAME_VIEWS=1로 실행하세요.')
+        setup_test_environment()
+        set_backend(FakeBackend(latency=options['latency']))
+        db_name = os.path.join(tempfile.gettempdir(), f"unicorn_bench_{options['mode']}.sqlite3")
+
+        # 풀/스트리밍/백그라운드 반응을 끄고 요청 안에서 LLM을 기다리는 경우만 측정
+        with override_settings(DEBUG=False, IDEA_POOL_ENABLED=False, IDEA_STREAMING=False,
+                               ASYNC_RESULT_REACTION=False):
+            with temporary_database(name=db_name):
+                # force_login만 쓰므로 비밀번호 해시 없이 생성
+                users = User.objects.bulk_create([
+                    User(username=f'p{n}', password='!', nickname=f'p{n}') for n in range(options['players'])
+                ])
+                connections.close_all()
+                start = time.perf_counter()
+                if options['mode'] == 'wsgi':
+                    samples, errors = self._run_wsgi(users, options['slots'])
+                else:
+                    samples, errors = async_to_sync(self._run_asgi)(users)
+                wall = time.perf_counter() - start
+                connections.close_all()
+
+        samples.sort()
+        pick = lambda p: samples[min(len(samples) - 1, int(len(samples) * p))] if samples else 0
+        print(json.dumps({
+            'wall': wall, 'rps': len(samples) / wall, 'p50': pick(0.5), 'p95': pick(0.95),
+            'max': samples[-1] if samples else 0, 'errors': errors,
+        }))
+
+    def _run_wsgi(self, users, slots):
+        slot = threading.BoundedSemaphore(slots)
+        samples, errors = [], []
+        lock = threading.Lock()
+
+        def request(client, method, url, data=None):
+            start = time.perf_counter()
+            with slot:  # 빈 워커 스레드가 생길 때까지 대기 (대기 시간도 지연에 포함)
+                response = getattr(client, method)(url, data or {})
+            with lock:
+                samples.append(time.perf_counter() - start)
+            return response
+
+        def player(user):
+            client = Client()
+            client.force_login(user)
+            try:
+                self._play(client, user, request)
+            except Exception as e:
+                with lock:
+                    errors.append(str(e))
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=player, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return samples, len(errors)
+
+    def _play(self, client, user, request):
+        request(client, 'get', reverse('game:game_start'))
+        session_id = GameSession.objects.filter(user=user, is_finished=False).values_list('pk', flat=True).get()
+        for turn_no in range(5):  # 투자마다 한 턴씩 진행
+            request(client, 'get', reverse('game:play', args=[session_id]))
+            request(client, 'post', reverse('game:invest', args=[session_id]),
+                    {'action': 'invest', 'amount': 2000, 'turn_no': turn_no})
+
+    async def _run_asgi(self, users):
+        samples, errors = [], []
+
+        async def request(client, method, url, data=None):
+            start = time.perf_counter()
+            # ASGIHandler처럼 요청마다 sync 코드(ORM) 전용 스레드를 따로 씀
+            async with ThreadSensitiveContext():
+                response = await getattr(client, method)(url, data or {})
+            samples.append(time.perf_counter() - start)
+            return response
+
+        async def player(user):
+            client = AsyncClient()
+            await client.aforce_login(user)
+            try:
+                await request(client, 'get', reverse('game:game_start'))
+                session = await GameSession.objects.aget(user=user, is_finished=False)
+                for turn_no in range(5):  # 투자마다 한 턴씩 진행
+                    await request(client, 'get', reverse('game:play', args=[session.pk]))
+                    await request(client, 'post', reverse('game:invest', args=[session.pk]),
+                                  {'action': 'invest', 'amount': 2000, 'turn_no': turn_no})
+            except Exception as e:
+                errors.append(str(e))
+
+        await asyncio.gather(*(player(user) for user in users))
+        return samples, len(errors)
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, connections, transaction
+from django.utils import timezone
+
+from game import leaderboard, transitions
+from game.benchmarking import seed_games, temporary_database
+from game.models import GameSession, Investment, User
+
+# SQLite 비교용: Django 기본 설정 (롤백 저널, DEFERRED 트랜잭션, 잠금 대기 5초, 요청마다 새 연결)
+SQLITE_DEFAULTS = {'OPTIONS': {}, 'CONN_MAX_AGE': 0}
+
+
+class Command(BaseCommand):
+    """
+    동시 읽기/쓰기 처리량 벤치마크
+    읽기 스레드는 랭킹/메인/마이페이지 쿼리를, 쓰기 스레드는 투자(조건부 UPDATE + 투자 기록 INSERT)를
+    정해진 시간 동안 반복하고 초당 처리 수와 지연시간을 출력합니다.
+    SQLite면 Django 기본 설정과 settings의 튜닝 설정(WAL 등)을 차례로 실행해서 비교하고,
+    DB_BACKEND=postgres로 실행하면 settings의 PostgreSQL(커넥션 풀) 설정으로 측정합니다.
+    """
+    help = '동시 읽기/쓰기 처리량 측정 (SQLite 기본 vs 튜닝, 또는 PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=8, help='읽기 스레드 수')
+        parser.add_argument('--writers', type=int, default=4, help='쓰기 스레드 수')
+        parser.add_argument('--duration', type=float, default=5.0, help='설정별 측정 시간(초)')
+        parser.add_argument('--users', type=int, default=200, help='랭킹용 시드 유저 수')
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            profiles = [('sqlite-default', SQLITE_DEFAULTS), ('sqlite-tuned', {})]
+        else:
+            profiles = [(f'{connection.vendor}-configured', {})]
+
+        settings_dict = connection.settings_dict
+        self.stdout.write(
+            f"{'profile':<22}{'reads/s':>10}{'read p95':>10}{'read max':>10}"
+            f"{'writes/s':>10}{'write p95':>10}{'write max':>10}{'errors':>8}"
+        )
+        for name, overrides in profiles:
+            saved = {key: settings_dict.get(key) for key in overrides}
+            settings_dict.update(overrides)
+            try:
+                result = self._run_profile(name, options)
+            finally:
+                connections.close_all()
+                settings_dict.update(saved)
+            self.stdout.write(
+                f"{name:<22}{result['reads']:>10.0f}{result['read_p95']:>9.1f}ms{result['read_max']:>8.1f}ms"
+                f"{result['writes']:>10.0f}{result['write_p95']:>9.1f}ms{result['write_max']:>8.1f}ms"
+                f"{result['errors']:>8}"
+            )
+
+    def _run_profile(self, name, options):
+        db_name = None
+        if connection.vendor == 'sqlite':
+            # 스레드끼리 같은 DB를 봐야 하므로 파일 DB
+            db_name = os.path.join(tempfile.gettempdir(), f'unicorn_bench_{name}.sqlite3')
+        with temporary_database(name=db_name):
+            seed_games(users=options['users'], sessions_per_user=10, investments_per_session=5, days=7)
+            leaderboard.rebuild()
+            writers = [
+                User.objects.create_user(username=f'writer{n}', password='!', nickname=f'writer{n}')
+                for n in range(options['writers'])
+            ]
+            readers = list(User.objects.filter(username__startswith='bench').values_list('pk', flat=True)[:50])
+            connections.close_all()
+
+            stop = threading.Event()
+            samples = {'read': [], 'write': []}
+            errors = []
+            lock = threading.Lock()
+
+            def loop(kind, op):
+                local = []
+                try:
+                    while not stop.is_set():
+                        start = time.perf_counter()
+                        try:
+                            op()
+                        except OperationalError as e:  # database is locked 등
+                            with lock:
+                                errors.append(str(e))
+                            continue
+                        local.append((time.perf_counter() - start) * 1000)
+                finally:
+                    connections.close_all()
+                    with lock:
+                        samples[kind] += local
+
+            threads = [
+                threading.Thread(target=loop, args=('read', self._reader(readers[n % len(readers)])))
+                for n in range(options['readers'])
+            ] + [
+                threading.Thread(target=loop, args=('write', self._writer(user)))
+                for user in writers
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(options['duration'])
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        result = {'errors': len(errors)}
+        for kind in ('read', 'write'):
+            values = sorted(samples[kind])
+            result[f'{kind}s'] = len(values) / options['duration']
+            result[f'{kind}_p95'] = values[min(len(values) - 1, int(len(values) * 0.95))] if values else 0
+            result[f'{kind}_max'] = values[-1] if values else 0
+        return result
+
+    def _reader(self, user_id):
+        """랭킹 + 메인 Top 3 + 마이페이지 최근 기록"""
+        def op():
+            today = timezone.localdate()
+            list(leaderboard.get_daily(today, limit=20))
+            list(leaderboard.get_all_time(limit=10))
+            list(leaderboard.get_daily(today, limit=3))
+            list(GameSession.objects.filter(user_id=user_id, is_finished=True).order_by('-created_at')[:10])
+        return op
+
+    def _writer(self, user):
+        """투자 한 번 (기회를 다 쓰면 새 게임)"""
+        state = {'session': None}
+
+        def op():
+            session = state['session']
+            if session is None:
+                session = state['session'] = GameSession.objects.create(user=user)
+            with transaction.atomic():
+                if not transitions.invest(session.pk, session.turn_no, 2000, -2000):
+                    state['session'] = None
+                    return
+                Investment.objects.create(
+                    session=session, character_name='벤치마크', idea_title='벤치마크 투자',
+                    invest_amount=2000, is_success=False, profit_rate=-100,
+                )
+            session.turn_no += 1
+        return op
@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.gemini_service import (
+    CHARACTERS, build_idea_prompt, build_ideas_prompt, get_backend, idea_config, ideas_config,
+    parse_ideas,
+)
+
+
+class Command(BaseCommand):
+    """
+    아이디어 단건 생성 vs 묶음 생성 벤치마크
+    아이디어 1개당 지연시간과 토큰 사용량을 비교합니다. (settings.LLM_BACKEND 사용)
+    """
+    help = '아이디어 단건 생성과 묶음 생성의 아이디어당 지연시간/토큰 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=5, help='묶음당 아이디어 수')
+        parser.add_argument('--rounds', type=int, default=3, help='반복 횟수')
+        parser.add_argument('--character', default='jaemin', choices=list(CHARACTERS))
+
+    def handle(self, *args, **options):
+        count = options['count']
+        rounds = options['rounds']
+        character = CHARACTERS[options['character']]
+        if count < 2:
+            raise CommandError('--count는 2 이상이어야 합니다.')
+
+        single = {'seconds': 0.0, 'input_tokens': 0, 'output_tokens': 0, 'ideas': 0, 'calls': 0}
+        batch = {'seconds': 0.0, 'input_tokens': 0, 'output_tokens': 0, 'ideas': 0, 'calls': 0}
+
+        for round_no in range(1, rounds + 1):
+            # 단건: 아이디어 count개를 count번 호출
+            for _ in range(count):
+                text = self._call(single, build_idea_prompt(character), idea_config())
+                if self._is_usable_idea(text):
+                    single['ideas'] += 1
+
+            # 묶음: 아이디어 count개를 한 번에 호출
+            text = self._call(batch, build_ideas_prompt(character, count), ideas_config(count))
+            batch['ideas'] += len(parse_ideas(text, character))
+
+            self.stdout.write(f'round {round_no}/{rounds} 완료')
+
+        self.stdout.write('')
+        self.stdout.write(f"{'mode':<8}{'calls':>7}{'ideas':>7}{'sec/idea':>10}{'in_tok/idea':>13}{'out_tok/idea':>14}")
+        for name, stats in (('single', single), ('batch', batch)):
+            ideas = max(stats['ideas'], 1)
+            self.stdout.write(
+                f"{name:<8}{stats['calls']:>7}{stats['ideas']:>7}"
+                f"{stats['seconds'] / ideas:>10.3f}"
+                f"{stats['input_tokens'] / ideas:>13.1f}"
+                f"{stats['output_tokens'] / ideas:>14.1f}"
+            )
+
+    def _is_usable_idea(self, text):
+        """
+        단건 응답이 아이디어로 쓸 만한지 ([TITLE]/[DESC] 태그가 있고 본문이 비어 있지 않음)
+        parse_idea()는 태그가 없어도 대체 문구로 채우므로 원문으로 판단 (parse_ideas처럼 본문 없는 응답은 제외)
+        """
+        has_title = False
+        description = ''
+        for line in text.strip().split('\n'):
+            if '[TITLE]' in line:
+                has_title = True
+            elif '[DESC]' in line:
+                description = line.replace('[DESC]', '').strip()
+        return has_title and bool(description)
+
+    def _call(self, stats, prompt, config):
+        start = time.perf_counter()
+        response = get_backend().generate(prompt, **config)
+        stats['seconds'] += time.perf_counter() - start
+        stats['calls'] += 1
+        stats['input_tokens'] += response.input_tokens
+        stats['output_tokens'] += response.output_tokens
+        return response.text
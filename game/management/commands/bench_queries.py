@@ -0,0 +1,83 @@
+import re
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from game import leaderboard
+from game.benchmarking import seed_games, temporary_database, time_call
+from game.models import GameSession, User
+
+
+class Command(BaseCommand):
+    """
+    랭킹/마이페이지/메인 화면 쿼리 실행 계획 + 지연시간 벤치마크
+    임시 DB에 대량 데이터를 넣고 각 쿼리의 EXPLAIN과 실행 시간을 출력합니다.
+    인덱스를 타지 않는 전체 테이블 스캔이 보이면 표시합니다. (SQLite 기준)
+    """
+    help = '랭킹/마이페이지/메인 쿼리의 EXPLAIN과 지연시간 측정 (임시 DB 사용)'
+
+    FULL_SCAN = re.compile(r'\bSCAN (?!.*\bUSING\b)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500)
+        parser.add_argument('--sessions-per-user', type=int, default=40)
+        parser.add_argument('--investments-per-session', type=int, default=5)
+        parser.add_argument('--days', type=int, default=60, help='게임 날짜 분포 기간')
+        parser.add_argument('--repeat', type=int, default=30, help='쿼리당 반복 횟수')
+        parser.add_argument('--no-explain', action='store_true', help='실행 계획 출력 생략')
+
+    def handle(self, *args, **options):
+        with temporary_database():
+            counts = seed_games(
+                users=options['users'],
+                sessions_per_user=options['sessions_per_user'],
+                investments_per_session=options['investments_per_session'],
+                days=options['days'],
+            )
+            leaderboard.rebuild()
+            # 옵티마이저 통계 갱신 (운영 DB처럼 인덱스 선택도를 반영)
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+            self.stdout.write(
+                f"seed: users={counts['users']} sessions={counts['sessions']} "
+                f"investments={counts['investments']}"
+            )
+            self._run(options)
+
+    def _queries(self):
+        today = timezone.localdate()
+        user = User.objects.filter(username__startswith='bench').order_by('pk').first()
+        finished = GameSession.objects.filter(is_finished=True, final_profit_rate__isnull=False)
+        return [
+            # 화면에서 실제로 쓰는 쿼리
+            ('ranking.today', leaderboard.get_daily(today, limit=20)),
+            ('ranking.hall_of_fame', leaderboard.get_all_time(limit=10)),
+            ('main.top3', leaderboard.get_daily(today, limit=3)),
+            ('main.active_session', GameSession.objects.filter(user=user, is_finished=False).order_by('pk')[:1]),
+            ('mypage.recent_games', GameSession.objects.filter(user=user, is_finished=True).order_by('-created_at')[:10]),
+            ('result.investments', user.game_sessions.order_by('pk').first().investments.order_by('created_at')),
+            # 랭킹 보드 재구성(rebuild_leaderboard)에서 쓰는 원본 테이블 쿼리
+            ('rebuild.daily', finished.filter(finished_on=today).order_by('-final_profit_rate', 'pk')[:20]),
+            ('rebuild.all_time', finished.order_by('-final_profit_rate', 'pk')[:10]),
+        ]
+
+    def _run(self, options):
+        rows = []
+        for name, queryset in self._queries():
+            stats = time_call(lambda: list(queryset.all()), repeat=options['repeat'])
+            plan = queryset.explain()
+            full_scan = any(self.FULL_SCAN.search(line) for line in plan.splitlines())
+            rows.append((name, stats, full_scan))
+            if not options['no_explain']:
+                self.stdout.write('')
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                self.stdout.write(plan)
+
+        self.stdout.write('')
+        self.stdout.write(f"{'query':<24}{'median_ms':>11}{'p95_ms':>9}{'max_ms':>9}  plan")
+        for name, stats, full_scan in rows:
+            note = self.style.WARNING('FULL SCAN') if full_scan else 'index'
+            self.stdout.write(
+                f"{name:<24}{stats['median_ms']:>11.2f}{stats['p95_ms']:>9.2f}{stats['max_ms']:>9.2f}  {note}"
+            )
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# 측정할 진입점 (이름, python 인자)
+ENTRY_POINTS = [
+    ('django.setup', ['-c', 'import django; django.setup()']),
+    ('wsgi', ['-c', 'import config.wsgi']),
+    ('game.views', ['-c', 'import django; django.setup(); import game.views']),
+    ('manage.py check', ['manage.py', 'check']),
+    ('manage.py migrate --plan', ['manage.py', 'migrate', '--plan']),
+]
+
+# 진입점에서 import 되면 안 되는 무거운 모듈
+LAZY_MODULES = ['google.genai', 'httpx']
+
+
+class Command(BaseCommand):
+    """
+    프로세스 시작 시간 벤치마크
+    각 진입점을 `python -X importtime`으로 실행해서 전체 시간과
+    import 누적 시간 상위 모듈을 보여줍니다.
+    """
+    help = '진입점별 시작 시간 및 import 비용 리포트 (python -X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10, help='표시할 상위 모듈 수')
+        parser.add_argument('--repeat', type=int, default=3, help='진입점별 반복 횟수 (최솟값 사용)')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='config.settings')
+
+        for name, argv in ENTRY_POINTS:
+            best_wall = None
+            imports = {}
+            for _ in range(options['repeat']):
+                start = time.perf_counter()
+                result = subprocess.run(
+                    [sys.executable, '-X', 'importtime', *argv],
+                    cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+                )
+                wall = time.perf_counter() - start
+                if best_wall is None or wall < best_wall:
+                    best_wall = wall
+                    imports = self._parse_importtime(result.stderr)
+
+            self.stdout.write(f'\n=== {name}: {best_wall * 1000:.0f} ms (wall, best of {options["repeat"]})')
+            loaded = [module for module in LAZY_MODULES if module in imports]
+            if loaded:
+                self.stdout.write(self.style.WARNING(f'  지연 로딩 대상이 import 됨: {", ".join(loaded)}'))
+
+            top = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:options['top']]
+            for module, cumulative in top:
+                self.stdout.write(f'  {cumulative / 1000:>8.1f} ms  {module}')
+
+    def _parse_importtime(self, stderr):
+        """'import time: self | cumulative | module' 줄 → {모듈: 누적 us}"""
+        imports = {}
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            try:
+                _, cumulative, module = line[len('import time:'):].split('|')
+                imports[module.strip()] = int(cumulative)
+            except ValueError:
+                continue
+        return imports
@@ -0,0 +1,80 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image, features
+
+# Pillow 저장 포맷 이름 / 기능 체크 이름
+FORMATS = {
+    'avif': ('AVIF', 'avif'),
+    'webp': ('WEBP', 'webp'),
+}
+
+
+class Command(BaseCommand):
+    """
+    캐릭터 이미지(PNG) → 폭별 AVIF/WebP 변형 이미지 + manifest.json 생성
+    결과물은 static/images/characters/variants/ 에 저장되고 (git 추적 안 함)
+    {% character_picture %} 태그가 manifest를 읽어 <picture>/srcset을 만듭니다.
+    배포 시 collectstatic 전에 한 번 실행하세요.
+    """
+    help = '캐릭터 이미지의 폭별 AVIF/WebP 변형과 manifest 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--widths', type=int, nargs='+', default=list(settings.CHARACTER_IMAGE_WIDTHS))
+        parser.add_argument('--formats', nargs='+', default=list(settings.CHARACTER_IMAGE_FORMATS),
+                            choices=list(FORMATS))
+        parser.add_argument('--force', action='store_true', help='원본보다 최신인 변형도 다시 생성')
+
+    def handle(self, *args, **options):
+        source_dir = settings.BASE_DIR / 'static' / settings.CHARACTER_IMAGE_DIR
+        output_dir = source_dir / 'variants'
+        sources = sorted(source_dir.glob('*.png'))
+        if not sources:
+            raise CommandError(f'원본 이미지가 없습니다: {source_dir}')
+
+        formats = []
+        for name in options['formats']:
+            if features.check(FORMATS[name][1]):
+                formats.append(name)
+            else:
+                self.stdout.write(self.style.WARNING(f'{name}: 이 Pillow 빌드에서 지원하지 않아 건너뜀'))
+        if not formats:
+            raise CommandError('생성할 수 있는 포맷이 없습니다.')
+
+        output_dir.mkdir(exist_ok=True)
+        manifest = {}
+        before = 0
+        largest = {fmt: 0 for fmt in formats}  # 포맷별 최대 폭 변형 용량 합계
+        for source in sources:
+            with Image.open(source) as image:
+                image.load()
+                entry = {'width': image.width, 'height': image.height, 'variants': {}}
+                # 원본보다 큰 폭은 만들지 않음 (원본 폭은 항상 포함)
+                widths = sorted({w for w in options['widths'] if w < image.width} | {image.width})
+                for fmt in formats:
+                    files = []
+                    for width in widths:
+                        path = output_dir / f'{source.stem}-{width}.{fmt}'
+                        if options['force'] or not path.exists() or path.stat().st_mtime < source.stat().st_mtime:
+                            self._save(image, width, fmt, path)
+                        files.append([width, f'{settings.CHARACTER_IMAGE_DIR}/variants/{path.name}'])
+                        if width == widths[-1]:
+                            largest[fmt] += path.stat().st_size
+                    entry['variants'][fmt] = files
+            before += source.stat().st_size
+            manifest[source.stem] = entry
+            self.stdout.write(f'{source.name}: {", ".join(formats)} x {widths}')
+
+        with open(output_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        sizes = ', '.join(f'{fmt} {size / 1024:.0f}KB' for fmt, size in largest.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(sources)}개 이미지 완료 (원본 PNG {before / 1024:.0f}KB → 최대 폭 변형 {sizes})'
+        ))
+
+    def _save(self, image, width, fmt, path):
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        resized.save(path, FORMATS[fmt][0], quality=settings.CHARACTER_IMAGE_QUALITY[fmt])
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from game.models import User
+from game.thumbnails import process_profile_image
+
+
+class Command(BaseCommand):
+    """
+    기존 프로필 이미지 일괄 처리 (축소/WebP 재인코딩 + 썸네일 생성)
+    썸네일 기능 도입 전에 업로드된 이미지나, 백그라운드 처리가 실패한 이미지용
+    """
+    help = '썸네일이 없는 프로필 이미지를 축소/재인코딩하고 썸네일 생성'
+
+    def handle(self, *args, **options):
+        users = User.objects.exclude(img_profile='').exclude(img_profile__isnull=True).filter(
+            img_profile_thumbnails=False,
+        )
+        done = failed = 0
+        for user in users.iterator():
+            before = user.img_profile.size if user.img_profile.storage.exists(user.img_profile.name) else 0
+            try:
+                process_profile_image(user.pk)
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.WARNING(f'{user.username}: {e}'))
+                continue
+            user.refresh_from_db()
+            done += 1
+            self.stdout.write(f'{user.username}: {before / 1024:.0f}KB → {user.img_profile.size / 1024:.0f}KB')
+        self.stdout.write(self.style.SUCCESS(f'완료 {done}건, 실패 {failed}건'))
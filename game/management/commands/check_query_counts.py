@@ -0,0 +1,158 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings, setup_test_environment
+from django.urls import reverse
+
+from game import archive, leaderboard, stats
+from game import urls as game_urls
+from game.benchmarking import seed_games, temporary_database
+from game.gemini_service import CHARACTERS, set_backend
+from game.llm_backends import FakeBackend
+from game.models import GameSession, Investment, TextBlob, User
+
+# URL 이름별 고정 쿼리 수 (세션/인증 미들웨어 쿼리 포함)
+# 목록 길이에 따라 쿼리 수가 늘어나면(N+1) 데이터를 늘린 두 번째 실행에서 값이 달라져 실패합니다.
+# 쿼리를 의도적으로 늘리거나 줄였다면 --show 결과를 보고 이 표를 같이 고치세요.
+EXPECTED = {
+    'game:main': 4,
+    'game:signup': 0,
+    'game:login': 0,
+    'game:logout': 4,
+    'game:mypage': 6,
+    'game:game_start': 4,
+    'game:play': 6,
+    'game:play_stream': 7,  # 스트리밍 후 저장 전에 세션을 다시 읽는 1회 포함
+    'game:invest': 14,  # 누적 통계 행은 _seed_history에서 미리 만들어 둠 (첫 투자면 행 생성으로 20)
+    'game:result': 3,
+    'game:result_reaction': 3,
+    'game:pass': 10,
+    'game:ranking': 4,
+    'game:ops_status': 2,
+}
+
+
+class Command(BaseCommand):
+    """
+    game/urls.py의 모든 URL에 대해 요청당 SQL 쿼리 수 검사 (N+1 회귀 방지)
+    임시 DB + 가짜 LLM 백엔드로 한 판을 진행하면서 URL마다 쿼리 수를 세고,
+    랭킹 데이터와 측정 유저의 게임/투자 기록을 크게 늘린 뒤 한 번 더 실행해서 두 결과가 모두 EXPECTED와 같은지 확인합니다.
+    EXPECTED 값이 런타임 쿼리 예산(QUERY_BUDGET_OVERRIDES)을 넘어도 실패합니다.
+    하나라도 다르면 CommandError(종료 코드 1)로 끝나므로 CI에서 그대로 쓸 수 있습니다.
+    """
+    help = 'game/urls.py 모든 URL의 요청당 쿼리 수가 고정값과 같은지 검사'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--show', action='store_true', help='검사 없이 측정값만 출력')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        set_backend(FakeBackend())
+
+        # 결과 반응은 동기로 생성 (백그라운드 스레드 쿼리가 섞이지 않게)
+        # 랭킹 조각 캐시는 끄고 측정 (캐시 미스 때의 쿼리 수가 기준)
+        no_cache = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+        with override_settings(IDEA_POOL_ENABLED=False, IDEA_STREAMING=True, ASYNC_RESULT_REACTION=False,
+                               CACHES=no_cache):
+            with temporary_database():
+                seed_games(users=3, sessions_per_user=2, investments_per_session=1, days=1)
+                leaderboard.rebuild()
+                small = self._measure('small', games=3, investments_per_game=2)
+
+                seed_games(users=40, sessions_per_user=5, investments_per_session=1, days=1, prefix='extra')
+                leaderboard.rebuild()
+                large = self._measure('large', games=8, investments_per_game=5)
+
+        self._report(small, large, options['show'])
+
+    def _measure(self, tag, games, investments_per_game):
+        user = User.objects.create_user(username=f'qc_{tag}', password='pw', nickname=f'쿼리{tag}', is_staff=True)
+        self._seed_history(user, games, investments_per_game)
+
+        client = Client()
+        counts = {}
+
+        def hit(name, method='get', kwargs=None, data=None):
+            with CaptureQueriesContext(connection) as ctx:
+                response = getattr(client, method)(reverse(name, kwargs=kwargs), data or {})
+                if response.streaming:
+                    b''.join(response.streaming_content)
+            if response.status_code >= 400:
+                raise CommandError(f'{name}: HTTP {response.status_code}')
+            counts[name] = len(ctx)
+            return response
+
+        hit('game:signup')
+        hit('game:login')
+        client.force_login(user)
+        hit('game:main')
+        hit('game:game_start')
+        session = GameSession.objects.get(user=user, is_finished=False)
+        hit('game:play', kwargs={'session_id': session.pk})
+        hit('game:play_stream', kwargs={'session_id': session.pk})
+        hit('game:invest', 'post', {'session_id': session.pk},
+            {'action': 'invest', 'amount': 2000, 'turn_no': session.turn_no})
+        investment = Investment.objects.filter(session=session).latest('pk')
+        hit('game:result', kwargs={'investment_id': investment.pk})
+        hit('game:result_reaction', kwargs={'investment_id': investment.pk})
+        session.refresh_from_db(fields=['turn_no'])
+        hit('game:pass', 'post', {'session_id': session.pk}, {'turn_no': session.turn_no})
+        hit('game:mypage')
+        hit('game:ranking')
+        hit('game:ops_status')
+        hit('game:logout')
+        return counts
+
+    def _seed_history(self, user, games, investments_per_game):
+        """
+        마이페이지가 읽는 기록 채우기 (실행마다 개수를 다르게 해서 N+1이면 쿼리 수가 달라짐)
+        - 투자 기록이 있는 종료된 게임, 가장 오래된 한 판은 보관 테이블(SessionArchive)로 옮김
+        - 누적 통계: 투자를 캐릭터 순서대로 돌려서 모든 캐릭터의 UserCharacterStats 행이 생김
+          (뒤에서 측정하는 투자가 어느 캐릭터든 통계 행 생성 없이 같은 쿼리 수가 되게)
+        """
+        characters = list(CHARACTERS.values())
+        description_id, system_msg_id, reaction_id = TextBlob.intern('쿼리 검사용 설명', '쿼리 검사 결과', '쿼리 검사 반응')
+        sessions = []
+        for n in range(games):
+            session = GameSession.objects.create(user=user, current_capital=10000, remaining_chances=0,
+                                                 is_finished=True, final_profit_rate=10.0 * (n + 1))
+            for i in range(investments_per_game):
+                character = characters[(n * investments_per_game + i) % len(characters)]
+                is_success = i % 2 == 0
+                Investment.objects.create(
+                    session=session, character_name=character['name'], idea_title='쿼리 검사 아이디어',
+                    idea_description_blob_id=description_id, invest_amount=2000,
+                    is_success=is_success, profit_rate=50 if is_success else -100,
+                    result_system_msg_blob_id=system_msg_id, result_character_reaction_blob_id=reaction_id,
+                )
+                stats.record_investment(user.pk, character['key'], 2000, is_success, 1000 if is_success else -2000)
+            sessions.append(session)
+        archive.archive_batch([sessions[0].pk])
+
+    def _report(self, small, large, show_only):
+        names = [f'{game_urls.app_name}:{pattern.name}' for pattern in game_urls.urlpatterns]
+        failures = []
+        self.stdout.write(f"{'url':<24}{'expected':>10}{'small':>8}{'large':>8}")
+        for name in names:
+            expected = EXPECTED.get(name)
+            got_small, got_large = small.get(name), large.get(name)
+            ok = expected is not None and got_small == got_large == expected
+            line = f"{name:<24}{str(expected):>10}{str(got_small):>8}{str(got_large):>8}"
+            self.stdout.write(line if ok or show_only else self.style.ERROR(line))
+            if expected is None:
+                failures.append(f'{name}: EXPECTED에 없음 (새 URL이면 쿼리 수를 등록하세요)')
+            elif got_small is None:
+                failures.append(f'{name}: 측정되지 않음 (_measure에 요청을 추가하세요)')
+            elif not ok:
+                failures.append(f'{name}: 기대 {expected}, 측정 {got_small}/{got_large}')
+            budget = settings.QUERY_BUDGET_OVERRIDES.get(name, settings.QUERY_BUDGET_MAX_QUERIES)
+            if expected is not None and expected > budget:
+                failures.append(f'{name}: 기대 {expected}가 쿼리 예산 {budget}보다 큼 (QUERY_BUDGET_OVERRIDES 확인)')
+
+        if show_only:
+            return
+        if failures:
+            raise CommandError('쿼리 수 불일치\n' + '\n'.join(failures))
+        self.stdout.write(self.style.SUCCESS(f'{len(names)}개 URL 쿼리 수 일치'))
+
@@ -0,0 +1,124 @@
+import os
+import posixpath
+from collections import Counter
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+from game.models import StoredFile, User
+from game.storage import CONTENT_ADDRESSED
+
+
+class Command(BaseCommand):
+    """
+    내용 주소 저장소(프로필 이미지) 정리
+    1. User.img_profile 참조를 다시 세어서 StoredFile.refcount 맞추기 (0이면 파일 삭제)
+    2. 기록 없는 해시 파일 / 원본이 사라진 썸네일 삭제
+    3. --adopt-legacy: 저장소 도입 전 업로드(원래 파일 이름)를 해시 경로로 옮기기 (중복은 하나로 합쳐짐)
+    """
+    help = '프로필 이미지 저장소 참조 수 재계산 + 고아 파일 정리'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='삭제/수정 없이 결과만 출력')
+        parser.add_argument('--adopt-legacy', action='store_true',
+                            help='원래 파일 이름으로 저장된 프로필 이미지를 해시 경로로 이동')
+        parser.add_argument('--purge-legacy', action='store_true',
+                            help='아무도 참조하지 않는 옛 업로드 파일 삭제')
+
+    def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        field = User._meta.get_field('img_profile')
+        self.storage = field.storage
+        self.upload_dir = field.upload_to.strip('/')
+
+        if options['adopt_legacy']:
+            self._adopt_legacy()
+
+        refs = Counter(
+            name for name in User.objects.exclude(img_profile='').exclude(img_profile__isnull=True)
+            .values_list('img_profile', flat=True)
+        )
+        self._recount(refs)
+        self._sweep(refs, options['purge_legacy'])
+
+    def _adopt_legacy(self):
+        users = User.objects.exclude(img_profile='').exclude(img_profile__isnull=True)
+        legacy = [user for user in users if not CONTENT_ADDRESSED.search(user.img_profile.name)]
+        for user in legacy:
+            old_name = user.img_profile.name
+            if not self.storage.exists(old_name):
+                self.stdout.write(self.style.WARNING(f'{user.username}: 파일 없음 ({old_name})'))
+                continue
+            if self.dry_run:
+                self.stdout.write(f'[dry-run] 이동 {old_name}')
+                continue
+            with self.storage.open(old_name) as f:
+                new_name = self.storage.save(posixpath.join(self.upload_dir, posixpath.basename(old_name)), File(f))
+            User.objects.filter(pk=user.pk).update(img_profile=new_name, img_profile_thumbnails=False)
+            self.stdout.write(f'이동 {old_name} → {new_name}')
+            # 같은 옛 파일을 다른 유저도 쓰고 있으면 남겨둠
+            if not User.objects.filter(img_profile=old_name).exists():
+                self.storage.delete(old_name)
+        if legacy and not self.dry_run:
+            self.stdout.write('썸네일은 build_profile_thumbnails 커맨드로 다시 만드세요.')
+
+    def _recount(self, refs):
+        stored_names = set()
+        for stored in StoredFile.objects.all():
+            stored_names.add(stored.name)
+            expected = refs.get(stored.name, 0)
+            if stored.refcount == expected:
+                continue
+            self.stdout.write(f'참조 수 {stored.name}: {stored.refcount} → {expected}')
+            if self.dry_run:
+                continue
+            if expected == 0:
+                stored.delete()
+                self.storage.delete(stored.name)  # 기록이 없는 파일은 바로 삭제됨
+            else:
+                StoredFile.objects.filter(pk=stored.pk).update(refcount=expected)
+
+        # 참조는 있는데 기록이 없는 해시 파일 (기록 유실 등)
+        for name, count in refs.items():
+            if name in stored_names or not CONTENT_ADDRESSED.search(name) or not self.storage.exists(name):
+                continue
+            self.stdout.write(f'기록 복구 {name} (x{count})')
+            if not self.dry_run:
+                sha256 = posixpath.splitext(posixpath.basename(name))[0]
+                StoredFile.objects.create(name=name, sha256=sha256, size=self.storage.size(name), refcount=count)
+
+    def _sweep(self, refs, purge_legacy):
+        stored = set(StoredFile.objects.values_list('name', flat=True))
+        originals = {posixpath.splitext(name)[0] for name in stored | set(refs)}
+        removed = freed = 0
+
+        root = self.storage.path(self.upload_dir)
+        for dirpath, _, filenames in os.walk(root, topdown=False):
+            for filename in filenames:
+                name = posixpath.join(
+                    self.upload_dir, os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, '/'),
+                )
+                if posixpath.basename(posixpath.dirname(name)) == 'thumbs':
+                    # thumbs/{원본 이름}-{크기}.webp → 원본이 살아 있으면 유지
+                    stem = posixpath.splitext(filename)[0].rsplit('-', 1)[0]
+                    original = posixpath.join(posixpath.dirname(posixpath.dirname(name)), stem)
+                    orphan = original not in originals
+                elif CONTENT_ADDRESSED.search(name):
+                    orphan = name not in stored and name not in refs
+                else:
+                    orphan = purge_legacy and name not in refs
+                    if not orphan and name not in refs:
+                        self.stdout.write(f'참조 없는 옛 업로드 (--purge-legacy로 삭제): {name}')
+                if not orphan:
+                    continue
+                size = os.path.getsize(os.path.join(dirpath, filename))
+                self.stdout.write(f'{"[dry-run] " if self.dry_run else ""}삭제 {name} ({size / 1024:.0f}KB)')
+                if not self.dry_run:
+                    os.remove(os.path.join(dirpath, filename))
+                removed += 1
+                freed += size
+            # 비어 버린 해시 폴더 정리
+            if not self.dry_run and dirpath != root and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+
+        self.stdout.write(self.style.SUCCESS(f'고아 파일 {removed}개, {freed / 1024 / 1024:.1f}MB 정리'))
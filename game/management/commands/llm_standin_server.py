@@ -0,0 +1,86 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+from game.llm_backends import FakeBackend
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """HttpBackend 프로토콜 처리 (HTTP/1.1 keep-alive)"""
+    protocol_version = 'HTTP/1.1'
+    backend = None
+
+    def do_GET(self):
+        # 헬스 체크 / 커넥션 워밍업용
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        prompt = payload.get('prompt', '')
+        options = {
+            'max_output_tokens': payload.get('max_output_tokens'),
+            'temperature': payload.get('temperature'),
+        }
+
+        if self.path == '/v1/generate':
+            response = self.backend.generate(prompt, **options)
+            body = json.dumps({
+                'text': response.text,
+                'usage': {
+                    'input_tokens': response.input_tokens,
+                    'output_tokens': response.output_tokens,
+                },
+            }, ensure_ascii=False).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        elif self.path == '/v1/stream':
+            # 청크 전송 인코딩으로 NDJSON 줄을 도착하는 대로 전송
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for text in self.backend.stream(prompt, **options):
+                line = json.dumps({'text': text}, ensure_ascii=False).encode() + b'\n'
+                self.wfile.write(f'{len(line):X}\r\n'.encode() + line + b'\r\n')
+                self.wfile.flush()
+            self.wfile.write(b'0\r\n\r\n')
+
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    """
+    로컬 LLM 대역 서버
+    FakeBackend 응답을 HTTP로 제공합니다. LLM_BACKEND=http 로 붙여서
+    네트워크/과금 없이 부하 테스트와 CI를 돌릴 수 있습니다.
+    """
+    help = 'HttpBackend용 로컬 LLM 대역 서버 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--latency', type=float, default=0.0, help='응답 지연(초)')
+
+    def handle(self, *args, **options):
+        StandinHandler.backend = FakeBackend(latency=options['latency'])
+        server = ThreadingHTTPServer((options['host'], options['port']), StandinHandler)
+        server.daemon_threads = True
+        self.stdout.write(f"LLM 대역 서버 실행 중: http://{options['host']}:{options['port']}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
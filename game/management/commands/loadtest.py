@@ -0,0 +1,267 @@
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+
+from game import rules
+from game.benchmarking import temporary_database
+from game.gemini_service import set_backend
+from game.llm_backends import FakeBackend
+
+PASSWORD = 'Load!test-2468'
+
+# 화면 상태는 브라우저처럼 HTML에서 읽음
+# (테스트 클라이언트의 response.context는 template_rendered 시그널로 모으므로 스레드끼리 섞임)
+CAPITAL = re.compile(rb'name="amount" max="(-?\d+)"')
+TURN_NO = re.compile(rb'name="turn_no" value="(\d+)"')
+ENCHANT_BUTTON = b'name="action" value="enchant"'
+
+
+class Command(BaseCommand):
+    """
+    전체 게임 흐름 부하 테스트 (가짜 LLM, 임시 파일 DB)
+    가상 플레이어 N명이 동시에 브라우저와 같은 순서로 요청을 보냅니다.
+      회원가입 → 로그인 → 게임 시작 → [play (+스트리밍) → 패스/강화 → 투자 → 결과 (+반응 폴링)] → 게임 종료 → 랭킹
+    LLM은 결정적인 FakeBackend(--latency초 지연)를 쓰고, 플레이어 선택은 --seed로 고정되므로
+    같은 옵션이면 같은 요청 흐름이 재현됩니다. 아이디어 풀/스트리밍/백그라운드 반응은 settings 그대로 사용합니다.
+    URL 이름별 p50/p95/p99와 오류 수를 출력하고, --output으로 JSON 기준값을 저장, --baseline으로 비교합니다.
+    """
+    help = '가상 플레이어 동시 접속 부하 테스트 (URL별 p50/p95/p99, JSON 기준값 저장/비교)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='동시 플레이어 수')
+        parser.add_argument('--games', type=int, default=1, help='플레이어당 게임 수')
+        parser.add_argument('--latency', type=float, default=0.2, help='LLM 호출 1번 지연(초)')
+        parser.add_argument('--pass-rate', type=float, default=0.2, help='턴마다 패스할 확률')
+        parser.add_argument('--enchant-rate', type=float, default=0.3, help='턴마다 강화할 확률')
+        parser.add_argument('--poll-interval', type=float, default=0.2, help='결과 반응 폴링 간격(초)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--fast-passwords', action='store_true',
+                            help='MD5 해시 사용 (회원가입/로그인의 PBKDF2 비용을 빼고 게임 흐름만 볼 때)')
+        parser.add_argument('--output', help='결과를 JSON 기준값으로 저장할 경로')
+        parser.add_argument('--baseline', help='비교할 JSON 기준값 경로')
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            try:
+                with open(options['baseline'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"기준값을 읽을 수 없습니다: {options['baseline']} ({e})")
+
+        setup_test_environment()
+        set_backend(FakeBackend(latency=options['latency']))
+        db_name = os.path.join(tempfile.gettempdir(), 'unicorn_loadtest.sqlite3')
+
+        overrides = {'DEBUG': False}
+        if options['fast_passwords']:
+            overrides['PASSWORD_HASHERS'] = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+        with override_settings(**overrides):
+            with temporary_database(name=db_name):
+                connections.close_all()
+                report = self._run(options)
+                connections.close_all()
+
+        self._print(report)
+        if baseline:
+            self._compare(report, baseline)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"기준값 저장: {options['output']}")
+
+    # ---------- 실행 ----------
+
+    def _run(self, options):
+        samples = defaultdict(list)
+        errors = defaultdict(int)
+        finished = []
+        lock = threading.Lock()
+
+        def request(client, name, method, url, data=None):
+            start = time.perf_counter()
+            ok = False
+            try:
+                response = getattr(client, method)(url, data or {})
+                if response.streaming:
+                    b''.join(response.streaming_content)  # SSE는 끝까지 받아야 한 요청
+                ok = response.status_code < 400
+                return response
+            except Exception:
+                return None
+            finally:
+                with lock:
+                    samples[name].append(time.perf_counter() - start)
+                    if not ok:
+                        errors[name] += 1
+
+        def player(index):
+            rng = random.Random(options['seed'] * 100003 + index)
+            try:
+                client = self._sign_up(request, index)
+                for _ in range(options['games']):
+                    if self._play_game(client, request, rng, options):
+                        with lock:
+                            finished.append(index)
+            except Exception:
+                with lock:
+                    errors['player'] += 1
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=player, args=(n,)) for n in range(options['users'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - start
+
+        total = sum(len(values) for values in samples.values())
+        return {
+            'config': {key: options[key] for key in (
+                'users', 'games', 'latency', 'pass_rate', 'enchant_rate', 'seed', 'fast_passwords',
+            )} | {'async_game_views': settings.ASYNC_GAME_VIEWS},
+            'wall': round(wall, 3),
+            'requests': total,
+            'rps': round(total / wall, 2),
+            'games_finished': len(finished),
+            'errors': sum(errors.values()),
+            'urls': {
+                name: self._summarize(samples.get(name, []), errors.get(name, 0))
+                for name in sorted(set(samples) | set(errors))
+            },
+        }
+
+    def _sign_up(self, request, index):
+        """회원가입 후 새 클라이언트로 다시 로그인 (로그인 요청도 측정)"""
+        username = f'load{index}'
+        request(Client(), 'signup', 'post', reverse('game:signup'), {
+            'username': username, 'nickname': username, 'password1': PASSWORD, 'password2': PASSWORD,
+        })
+        client = Client()
+        response = request(client, 'login', 'post', reverse('game:login'),
+                           {'username': username, 'password': PASSWORD})
+        if response is None or response.status_code != 302:
+            raise RuntimeError('로그인 실패')
+        return client
+
+    def _play_game(self, client, request, rng, options):
+        """게임 한 판을 끝까지 진행, 정상 종료되면 True"""
+        response = request(client, 'game_start', 'get', reverse('game:game_start'))
+        if response is None or response.status_code != 302:
+            return False
+        session_id = int(response['Location'].rstrip('/').split('/')[-2])
+        play_url = reverse('game:play', args=[session_id])
+        invest_url = reverse('game:invest', args=[session_id])
+        pass_url = reverse('game:pass', args=[session_id])
+
+        # 패스/투자마다 한 턴 진행, 게임이 끝나면 play가 다른 화면으로 리다이렉트
+        for _ in range(rules.MAX_CHANCES + rules.MAX_PASSES + 1):
+            response = self._open_play(client, request, play_url, session_id)
+            if response is None:
+                return False
+            if response.status_code == 302:
+                request(client, 'ranking', 'get', reverse('game:ranking'))
+                return True
+
+            turn_no = TURN_NO.search(response.content).group(1).decode()
+            if pass_url.encode() in response.content and rng.random() < options['pass_rate']:
+                request(client, 'pass', 'post', pass_url, {'turn_no': turn_no})
+                continue
+
+            if ENCHANT_BUTTON in response.content and rng.random() < options['enchant_rate']:
+                request(client, 'enchant', 'post', invest_url, {'action': 'enchant', 'turn_no': turn_no})
+                response = self._open_play(client, request, play_url, session_id)
+                if response is None or response.status_code != 200:
+                    return False
+
+            capital = int(CAPITAL.search(response.content).group(1))
+            response = request(client, 'invest', 'post', invest_url,
+                               {'action': 'invest', 'amount': self._amount(rng, capital), 'turn_no': turn_no})
+            if response is None or '/result/' not in response.get('Location', ''):
+                return False
+            self._open_result(client, request, response['Location'], options['poll_interval'])
+        return False
+
+    def _open_play(self, client, request, play_url, session_id):
+        response = request(client, 'play', 'get', play_url)
+        stream_url = reverse('game:play_stream', args=[session_id])
+        if response is not None and response.status_code == 200 and stream_url.encode() in response.content:
+            request(client, 'play_stream', 'get', stream_url)
+        return response
+
+    def _open_result(self, client, request, result_url, poll_interval):
+        """결과 화면 + 반응이 아직이면 준비될 때까지 폴링 (브라우저 pollReaction과 동일)"""
+        response = request(client, 'result', 'get', result_url)
+        if response is None or response.status_code != 200:
+            return
+        investment_id = int(result_url.rstrip('/').split('/')[-1])
+        reaction_url = reverse('game:result_reaction', args=[investment_id])
+        deadline = time.monotonic() + settings.RESULT_REACTION_TIMEOUT + 5
+        ready = reaction_url.encode() not in response.content
+        while not ready and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            response = request(client, 'result_reaction', 'get', reaction_url)
+            ready = response is None or response.json()['ready']
+
+    def _amount(self, rng, capital):
+        """최소 금액 / 절반 / 올인 중 하나 (rules.is_valid_amount를 만족하도록)"""
+        if capital < rules.MIN_INVEST_AMOUNT:
+            return capital
+        return rng.choice([rules.MIN_INVEST_AMOUNT, max(rules.MIN_INVEST_AMOUNT, capital // 2), capital])
+
+    # ---------- 출력 ----------
+
+    def _summarize(self, values, errors):
+        values = sorted(values)
+        pick = lambda p: values[min(len(values) - 1, int(len(values) * p))] * 1000 if values else 0
+        return {
+            'count': len(values), 'errors': errors,
+            'p50_ms': round(pick(0.50), 1), 'p95_ms': round(pick(0.95), 1), 'p99_ms': round(pick(0.99), 1),
+            'max_ms': round(values[-1] * 1000, 1) if values else 0,
+        }
+
+    def _print(self, report):
+        config = report['config']
+        self.stdout.write(
+            f"users={config['users']} games={config['games']} latency={config['latency']}s "
+            f"async_views={config['async_game_views']}\n"
+            f"{report['requests']}건 / {report['wall']:.1f}s = {report['rps']:.1f} req/s, "
+            f"완료 게임 {report['games_finished']}, 오류 {report['errors']}\n"
+        )
+        self.stdout.write(f"{'url':<16}{'count':>7}{'p50_ms':>10}{'p95_ms':>10}{'p99_ms':>10}{'max_ms':>10}{'errors':>8}")
+        for name, stats in report['urls'].items():
+            line = (f"{name:<16}{stats['count']:>7}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+                    f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}{stats['errors']:>8}")
+            self.stdout.write(self.style.ERROR(line) if stats['errors'] else line)
+
+    def _compare(self, report, baseline):
+        """기준값 대비 처리량/URL별 p95 변화율"""
+        change = lambda new, old: f'{(new - old) / old:+.0%}' if old else '-'
+        self.stdout.write(
+            f"\n기준값 대비: req/s {report['rps']:.1f} (기준 {baseline['rps']:.1f}, "
+            f"{change(report['rps'], baseline['rps'])}), 오류 {report['errors']} (기준 {baseline['errors']})"
+        )
+        self.stdout.write(f"{'url':<16}{'p95_ms':>10}{'기준':>10}{'변화':>8}")
+        for name, stats in report['urls'].items():
+            old = baseline.get('urls', {}).get(name)
+            if old is None:
+                self.stdout.write(f"{name:<16}{stats['p95_ms']:>10.1f}{'-':>10}{'new':>8}")
+                continue
+            self.stdout.write(
+                f"{name:<16}{stats['p95_ms']:>10.1f}{old['p95_ms']:>10.1f}{change(stats['p95_ms'], old['p95_ms']):>8}"
+            )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from game import leaderboard
+from game.signals import invalidate_ranking_fragments
+
+
+class Command(BaseCommand):
+    """랭킹 보드를 GameSession 원본 기준으로 다시 만들기 (복구용)"""
+    help = '랭킹 보드(오늘의 랭킹/명예의 전당) 재구축'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='최근 N일의 오늘의 랭킹만 재구축 (기본: 전체)')
+
+    def handle(self, *args, **options):
+        count = leaderboard.rebuild(days=options['days'])
+        # 캐시된 랭킹 조각도 새 보드 기준으로 (이 프로세스의 캐시 백엔드 기준)
+        invalidate_ranking_fragments(day=timezone.localdate())
+        self.stdout.write(self.style.SUCCESS(f'랭킹 보드 재구축 완료: {count}개 항목'))
@@ -0,0 +1,96 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+class Command(BaseCommand):
+    """
+    CHARACTERS 밸런스 몬테카를로 시뮬레이션 (game/simulation.py)
+    전략마다 게임 N판을 끝까지 진행해서 최종 수익률 분포, 파산율, 캐릭터별 기대값을 출력합니다.
+    규칙은 views와 같은 game/rules.py를 쓰고, --verify N을 주면 views와 같은 스칼라 함수로
+    N판을 따로 진행해서 평균 수익률이 오차 범위 안에서 맞는지 확인합니다.
+    numpy가 필요합니다 (pip install numpy).
+    """
+    help = '캐릭터 밸런스 몬테카를로 시뮬레이션 (수익률 분포/파산율/캐릭터별 기대값)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--games', type=int, default=1_000_000, help='전략당 게임 수')
+        parser.add_argument('--strategy', action='append', help='전략 이름 (여러 번 지정 가능, 기본: 전부)')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--verify', type=int, default=0, metavar='N',
+                            help='views와 같은 스칼라 규칙으로 N판 더 돌려서 평균 비교')
+
+    def handle(self, *args, **options):
+        try:
+            from game import simulation
+        except ImportError as e:
+            raise CommandError(f'numpy가 필요합니다 (pip install numpy): {e}')
+        import numpy as np
+
+        names = options['strategy'] or list(simulation.STRATEGIES)
+        unknown = [name for name in names if name not in simulation.STRATEGIES]
+        if unknown:
+            raise CommandError(f"알 수 없는 전략: {', '.join(unknown)} (가능: {', '.join(simulation.STRATEGIES)})")
+
+        table = simulation.CharacterTable()
+        rng = np.random.default_rng(options['seed'])
+        for name in names:
+            strategy = simulation.STRATEGIES[name]()
+            start = time.perf_counter()
+            result = simulation.simulate(strategy, options['games'], rng, table)
+            result.elapsed = time.perf_counter() - start
+            self._report(result, strategy, np)
+            if options['verify']:
+                self._verify(simulation, strategy, result, options, table, np)
+
+    def _report(self, result, strategy, np):
+        rate = result.profit_rate
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'\n[{result.strategy}] {strategy.description} - {len(rate):,}판, {result.elapsed:.2f}s'
+        ))
+        self.stdout.write(
+            f'  최종 수익률: 평균 {rate.mean():+.1f}%  표준편차 {rate.std():.1f}%  최대 {rate.max():+.0f}%'
+        )
+        self.stdout.write('  분위수: ' + '  '.join(
+            f'p{p} {value:+.0f}%' for p, value in zip(PERCENTILES, np.percentile(rate, PERCENTILES))
+        ))
+        self.stdout.write(
+            f'  파산 {result.bankrupt_rate:.2%}  손실 {(rate < 0).mean():.2%}  '
+            f'2배 이상 {(rate >= 100).mean():.2%}'
+        )
+
+        table = result.table
+        self.stdout.write(
+            f"  {'캐릭터':<12}{'등장':>7}{'투자 비중':>10}{'성공률':>8}{'이론 EV':>10}{'실제 EV':>10}{'평균 투자금':>12}"
+        )
+        total = max(result.investments.sum(), 1)
+        for i, name in enumerate(table.names):
+            count = result.investments[i]
+            theory = table.expected_return(i, table.success_rate[i]) * 100
+            actual = result.returned[i] / result.invested[i] * 100 if count else float('nan')
+            self.stdout.write(
+                f'  {name:<12}{table.spawn_prob[i]:>7.0%}{count / total:>10.1%}'
+                f'{result.wins[i] / max(count, 1):>8.1%}{theory:>+9.0f}%{actual:>+9.0f}%'
+                f'{result.invested[i] / max(count, 1):>12,.0f}'
+            )
+
+    def _verify(self, simulation, strategy, result, options, table, np):
+        games = options['verify']
+        scalar = simulation.simulate_scalar(strategy, games, random.Random(options['seed']), table)
+        vector_rate, scalar_rate = result.profit_rate, simulation.rules.profit_rate(scalar)
+        # 평균 수익률/파산율 차이가 표준오차 4배 안이면 같은 규칙으로 봄 (올인 계열은 꼬리가 길어서 파산율이 더 민감)
+        rate_error = np.sqrt(vector_rate.var() / len(vector_rate) + scalar_rate.var() / games)
+        rate_diff = scalar_rate.mean() - vector_rate.mean()
+        bankrupt = (scalar <= 0).mean()
+        p = result.bankrupt_rate
+        bankrupt_error = np.sqrt(p * (1 - p) * (1 / len(vector_rate) + 1 / games))
+        bankrupt_diff = bankrupt - p
+        line = (f'  검증: 스칼라 {games:,}판 평균 {scalar_rate.mean():+.1f}% (차이 {rate_diff:+.1f}%p, '
+                f'허용 ±{4 * rate_error:.1f}%p) / 파산 {bankrupt:.2%} (차이 {bankrupt_diff:+.2%}, '
+                f'허용 ±{4 * bankrupt_error:.2%})')
+        if abs(rate_diff) > 4 * rate_error or abs(bankrupt_diff) > 4 * bankrupt_error:
+            raise CommandError(line + ' - 배열 시뮬레이션이 views 규칙과 다릅니다')
+        self.stdout.write(self.style.SUCCESS(line))
@@ -0,0 +1,236 @@
+import os
+import random
+import tempfile
+import threading
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+
+from game.benchmarking import temporary_database
+from game.gemini_service import set_backend
+from game.llm_backends import FakeBackend
+from game.models import GameSession, Investment, LeaderboardEntry, User, UserStats
+from game.transitions import ENCHANT_COST
+
+ACTIONS = ('invest', 'invest', 'enchant', 'pass', 'play')
+
+
+class Command(BaseCommand):
+    """
+    한 게임 세션에 여러 스레드가 동시에 요청 (따닥/여러 탭 흉내)
+    모든 스레드가 같은 로그인 쿠키를 쓰고, 라운드마다 Barrier로 맞춰서 같은 동작을 동시에 보냅니다.
+    게임이 끝날 때마다 DB 값이 규칙과 맞는지(불변식) 확인하고, 하나라도 어긋나면 CommandError로 끝납니다.
+    임시 파일 DB를 쓰므로 운영 DB는 건드리지 않습니다.
+    """
+    help = '게임 세션 동시 요청 스트레스 테스트 (자본금/기회/패스 불변식 확인)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='동시 요청 스레드 수')
+        parser.add_argument('--games', type=int, default=5, help='진행할 게임 수')
+        parser.add_argument('--rounds', type=int, default=40, help='게임당 최대 라운드 수')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        set_backend(FakeBackend())
+        db_name = os.path.join(tempfile.gettempdir(), 'unicorn_stress_session.sqlite3')
+
+        # 아이디어는 요청 안에서 바로 생성, 결과 반응도 동기 (백그라운드 스레드 없이)
+        # DEBUG 500 화면은 프레임 변수의 쿼리셋까지 평가하므로 끄고 실행 (오류는 한 줄로만 출력)
+        with override_settings(DEBUG=False, IDEA_POOL_ENABLED=False, IDEA_STREAMING=False,
+                               ASYNC_RESULT_REACTION=False):
+            with temporary_database(name=db_name):
+                user = User.objects.create_user(username='stress', password='stress', nickname='stress')
+                owner = Client()
+                owner.force_login(user)
+                rng = random.Random(options['seed'])
+
+                # 같은 화면에서 두 번 제출 (순차 따닥/뒤로 가기 후 재제출)
+                problems = self._check_double_submit(owner, user)
+                finished_games = 1
+                for game_no in range(1, options['games'] + 1):
+                    owner.get(reverse('game:game_start'))
+                    session = GameSession.objects.get(user=user, is_finished=False)
+                    statuses = self._hammer(owner, session, options['threads'], options['rounds'], rng)
+                    owner.get(reverse('game:play', args=[session.pk]))  # 남은 종료 처리 마무리
+                    session.refresh_from_db()
+                    finished_games += session.is_finished
+                    errors = statuses.pop('error', 0)
+                    self.stdout.write(
+                        f'게임 {game_no}: 자본금 {session.current_capital}, 기회 {session.remaining_chances}, '
+                        f'패스 {session.remaining_reroles}, 턴 {session.turn_no}, '
+                        f'종료 {session.is_finished} / 응답 {dict(statuses)} 오류 {errors}'
+                    )
+                    problems += [f'게임 {game_no}: {p}' for p in self._check(session)]
+                    if not session.is_finished:
+                        # 다음 게임을 시작할 수 있게 정리 (라운드 안에 안 끝난 경우)
+                        GameSession.objects.filter(pk=session.pk).update(remaining_chances=0)
+                        owner.get(reverse('game:play', args=[session.pk]))
+                        finished_games += 1
+
+                user.refresh_from_db()
+                if user.total_games != finished_games:
+                    problems.append(f'total_games {user.total_games} != 종료된 게임 {finished_games}')
+                problems += self._check_stats(user)
+                connections.close_all()
+
+        if problems:
+            for problem in problems:
+                self.stdout.write(self.style.ERROR(problem))
+            raise CommandError(f'불변식 위반 {len(problems)}건')
+        self.stdout.write(self.style.SUCCESS(f'{finished_games}판 모두 불변식 유지'))
+
+    def _hammer(self, owner, session, threads, rounds, rng):
+        """라운드마다 모든 스레드가 같은 동작을 동시에 요청"""
+        plan = [(rng.choice(ACTIONS), rng.random()) for _ in range(rounds)]
+        barrier = threading.Barrier(threads)
+        statuses = Counter()
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def worker():
+            client = Client()
+            client.cookies = owner.cookies
+            try:
+                for action, ratio in plan:
+                    # 모든 스레드가 같은 화면(같은 턴 번호)을 보고 제출하는 상황
+                    turn_no = GameSession.objects.values_list('turn_no', flat=True).get(pk=session.pk)
+                    try:
+                        barrier.wait(timeout=30)
+                    except threading.BrokenBarrierError:
+                        return
+                    if stop.is_set():
+                        return
+                    try:
+                        status = self._request(client, session.pk, turn_no, action, ratio).status_code
+                        if GameSession.objects.filter(pk=session.pk, is_finished=True).exists():
+                            stop.set()
+                    except Exception as e:
+                        status = 'error'
+                        print(f'Stress Request Error ({action}): {e}')
+                    with lock:
+                        statuses[status] += 1
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return statuses
+
+    def _request(self, client, session_id, turn_no, action, ratio):
+        if action == 'play':
+            return client.get(reverse('game:play', args=[session_id]))
+        if action == 'pass':
+            return client.post(reverse('game:pass', args=[session_id]), {'turn_no': turn_no})
+        capital = GameSession.objects.values_list('current_capital', flat=True).get(pk=session_id)
+        # 가끔 전 재산 올인 (2천만원 미만 예외 규칙까지 건드리게)
+        amount = capital if ratio > 0.8 else max(2000, int(capital * ratio))
+        return client.post(reverse('game:invest', args=[session_id]),
+                           {'action': action, 'amount': amount, 'turn_no': turn_no})
+
+    def _check_double_submit(self, owner, user):
+        """
+        한 화면의 폼을 순차로 두 번 제출해도 한 번만 반영되는지
+        - 패스: 두 번째 제출 시점엔 이미 다음 턴이 세션에 있음 (패스는 다음 턴을 바로 생성)
+        - 투자: 다음 턴 화면을 연 뒤(다음 턴 생성) 이전 화면의 폼을 다시 제출
+        """
+        problems = []
+        owner.get(reverse('game:game_start'))
+        session = GameSession.objects.get(user=user, is_finished=False)
+        play_url = reverse('game:play', args=[session.pk])
+
+        owner.get(play_url)
+        for _ in range(2):
+            owner.post(reverse('game:pass', args=[session.pk]), {'turn_no': 0})
+        session.refresh_from_db()
+        if session.remaining_reroles != 4 or session.turn_no != 1:
+            problems.append(f'패스 두 번 제출: 남은 패스 {session.remaining_reroles}, 턴 {session.turn_no} (기대 4, 1)')
+
+        owner.get(play_url)
+        invest = {'action': 'invest', 'amount': 2000, 'turn_no': session.turn_no}
+        for _ in range(2):
+            owner.post(reverse('game:invest', args=[session.pk]), invest)
+            owner.get(play_url)
+        session.refresh_from_db()
+        if session.investments.count() != 1 or session.turn_no != 2:
+            problems.append(
+                f'투자 두 번 제출: 투자 기록 {session.investments.count()}건, 턴 {session.turn_no} (기대 1, 2)'
+            )
+
+        problems += [f'두 번 제출: {p}' for p in self._check(session)]
+        # 다음 게임을 시작할 수 있게 정리
+        GameSession.objects.filter(pk=session.pk).update(remaining_chances=0)
+        owner.get(play_url)
+        self.stdout.write(f'두 번 제출: 남은 패스 {session.remaining_reroles}, 투자 {session.investments.count()}건')
+        return problems
+
+    def _check(self, session):
+        """DB 값이 지금까지의 투자 기록과 맞는지"""
+        problems = []
+        investments = list(session.investments.all())
+        passes = 5 - session.remaining_reroles
+        if session.current_capital < 0:
+            problems.append(f'자본금 음수 {session.current_capital}')
+        if not 0 <= session.remaining_chances <= 5:
+            problems.append(f'남은 기회 범위 밖 {session.remaining_chances}')
+        if not 0 <= session.remaining_reroles <= 5:
+            problems.append(f'남은 패스 범위 밖 {session.remaining_reroles}')
+        if len(investments) != 5 - session.remaining_chances:
+            problems.append(f'투자 기록 {len(investments)}건 != 사용한 기회 {5 - session.remaining_chances}')
+        if session.turn_no != len(investments) + passes:
+            problems.append(f'턴 번호 {session.turn_no} != 투자 {len(investments)} + 패스 {passes}')
+
+        # 자본금 = 시작 자본 + 투자 손익 - 강화 비용 x 강화 횟수 (턴당 최대 1회)
+        expected = 10000
+        for investment in investments:
+            if investment.is_success:
+                expected += int(investment.invest_amount * (investment.profit_rate / 100))
+            else:
+                expected -= investment.invest_amount
+        enchant_total = expected - session.current_capital
+        enchants, remainder = divmod(enchant_total, ENCHANT_COST)
+        if remainder or not 0 <= enchants <= session.turn_no + 1:
+            problems.append(f'자본금 {session.current_capital}이 투자 기록과 안 맞음 (차이 {enchant_total})')
+
+        if session.is_finished:
+            if session.final_profit_rate != session.calculate_profit_rate():
+                problems.append(f'최종 수익률 {session.final_profit_rate} != {session.calculate_profit_rate()}')
+            boards = Counter(LeaderboardEntry.objects.filter(session=session).values_list('board', flat=True))
+            if any(count > 1 for count in boards.values()):
+                problems.append(f'랭킹 보드 중복 기록 {dict(boards)}')
+        elif session.remaining_chances == 0 or session.current_capital == 0:
+            problems.append('끝난 게임이 종료 처리되지 않음')
+        return problems
+
+    def _check_stats(self, user):
+        """누적 통계(UserStats)가 전체 게임 기록과 맞는지 (동시 요청에도 증가분이 빠지거나 겹치지 않았는지)"""
+        problems = []
+        stats = UserStats.objects.get(user=user)
+        sessions = list(user.game_sessions.all())
+        investments = list(Investment.objects.filter(session__user=user))
+        profit = sum(
+            int(i.invest_amount * (i.profit_rate / 100)) if i.is_success else -i.invest_amount for i in investments
+        )
+        expected = {
+            'investments': len(investments),
+            'successes': sum(i.is_success for i in investments),
+            'total_invested': sum(i.invest_amount for i in investments),
+            'total_profit': profit,
+            'passes': sum(5 - s.remaining_reroles for s in sessions),
+            'bankruptcies': sum(s.is_finished and s.current_capital <= 0 for s in sessions),
+        }
+        for field, value in expected.items():
+            if getattr(stats, field) != value:
+                problems.append(f'통계 {field} {getattr(stats, field)} != 기록 {value}')
+        # 자본금 합계 = 시작 자본 x 판 수 + 투자 손익 - 강화 비용 x 강화 횟수
+        capital = sum(s.current_capital for s in sessions)
+        if capital != 10000 * len(sessions) + profit - ENCHANT_COST * stats.enchants:
+            problems.append(f'통계 강화 횟수 {stats.enchants}가 자본금 합계 {capital}와 안 맞음')
+        return problems
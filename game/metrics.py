@@ -0,0 +1,168 @@
+import bisect
+import threading
+
+# ============================================================
+# Prometheus 텍스트 포맷 메트릭 (의존성 없는 최소 구현)
+# - 프로세스 단위로 집계 (워커가 여러 개면 워커별로 스크랩)
+# - 기록은 락 하나 + 딕셔너리 갱신이라 요청 경로 오버헤드가 거의 없음
+# ============================================================
+_registry = []
+_collectors = []
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _format_labels(self, key, extra=None):
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        body = ','.join(f'{name}="{_escape(value)}"' for name, value in pairs)
+        return '{' + body + '}'
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(self._render_samples(items))
+        return lines
+
+
+class Counter(_Metric):
+    """증가만 하는 카운터"""
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_samples(self, items):
+        return [f'{self.name}{self._format_labels(key)} {value}' for key, value in items]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (초 단위 지연시간용)"""
+    kind = 'histogram'
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render_samples(self, items):
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{self._format_labels(key, ("le", le))} {cumulative}')
+            lines.append(f'{self.name}_sum{self._format_labels(key)} {total}')
+            lines.append(f'{self.name}_count{self._format_labels(key)} {count}')
+        return lines
+
+
+def register_collector(func):
+    """
+    스크랩 시점에 값을 읽어오는 수집기 등록 (아이디어 풀 깊이, 브레이커 상태 등)
+    func()는 (이름, 타입, 설명, [(라벨 dict, 값), ...]) 목록을 반환
+    """
+    _collectors.append(func)
+    return func
+
+
+def render():
+    """등록된 모든 메트릭을 Prometheus 텍스트 포맷으로"""
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    for collector in _collectors:
+        for name, kind, documentation, samples in collector():
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in samples:
+                body = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f'{name}{{{body}}} {value}' if body else f'{name} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# ============================================================
+# 메트릭 정의
+# ============================================================
+
+# LLM
+llm_generate_seconds = Histogram(
+    'unicorn_llm_generate_seconds', 'generate_idea/generate_result 지연시간 (대체 문구 포함)',
+    ['function', 'outcome'],
+)
+llm_tokens = Counter(
+    'unicorn_llm_tokens_total', 'LLM 토큰 사용량 (응답 메타데이터 기준)', ['kind', 'direction'],
+)
+llm_parse_failures = Counter(
+    'unicorn_llm_parse_failures_total', '필수 태그([TITLE]/[DESC]/[SYSTEM]/[REACTION]) 누락 응답 수',
+    ['kind', 'tag'],
+)
+llm_fallbacks = Counter(
+    'unicorn_llm_fallbacks_total', 'API 오류/차단으로 기본 문구를 사용한 횟수', ['function', 'reason'],
+)
+
+# 뷰
+http_request_seconds = Histogram(
+    'unicorn_http_request_seconds', '뷰별 요청 처리 시간', ['view', 'method'],
+)
+http_responses = Counter(
+    'unicorn_http_responses_total', '뷰별 응답 수 (상태 코드 대역별)', ['view', 'status'],
+)
+http_db_queries = Histogram(
+    'unicorn_http_db_queries', '요청당 SQL 쿼리 수', ['view'],
+    buckets=(1, 2, 3, 5, 8, 10, 15, 20, 30, 50, 100),
+)
+http_db_seconds = Histogram(
+    'unicorn_http_db_seconds', '요청당 DB 실행 시간 합계', ['view'],
+)
+http_query_budget_exceeded = Counter(
+    'unicorn_http_query_budget_exceeded_total', '쿼리 예산(쿼리 수/DB 시간) 초과 요청 수', ['view', 'budget'],
+)
+
+# 게임 경제
+game_actions = Counter(
+    'unicorn_game_actions_total', '게임 행동 수 (invest/enchant/pass)', ['action', 'character'],
+)
+game_investments = Counter(
+    'unicorn_game_investments_total', '투자 결과 수', ['character', 'result'],
+)
+game_invested_amount = Counter(
+    'unicorn_game_invested_amount_total', '누적 투자 금액(만원)', ['character'],
+)
+games_finished = Counter(
+    'unicorn_games_finished_total', '종료된 게임 수', ['reason'],
+)
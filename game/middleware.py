@@ -0,0 +1,125 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+
+from . import metrics
+
+
+class DualModeMiddleware:
+    """
+    WSGI(sync)/ASGI(async) 양쪽에서 동작하는 미들웨어 기반 클래스
+    sync 전용 미들웨어가 하나라도 있으면 ASGI에서 요청마다 스레드를 잡고 async 뷰를 기다리게 되므로
+    async 체인에서는 __acall__()로 처리합니다.
+    하위 클래스는 handle()/__acall__()을 둘 다 덮어씀 (기본은 그대로 통과)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        return await self.get_response(request)
+
+
+class MetricsMiddleware(DualModeMiddleware):
+    """
+    뷰별 요청 처리 시간/응답 수 기록
+    URL 이름(game:play 등)을 라벨로 써서 경로 파라미터별로 라벨이 늘어나지 않게 함
+    """
+
+    def handle(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, time.perf_counter() - start)
+        return response
+
+    def _record(self, request, response, elapsed):
+        match = request.resolver_match
+        view = match.view_name if match else 'unresolved'
+        metrics.http_request_seconds.observe(elapsed, view=view, method=request.method)
+        metrics.http_responses.inc(view=view, status=f'{response.status_code // 100}xx')
+
+
+class QueryCounter:
+    """connection.execute_wrapper용: 실행된 쿼리 수와 DB 시간(초) 누적"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class QueryBudgetMiddleware(DualModeMiddleware):
+    """
+    요청별 SQL 쿼리 수/DB 시간 집계
+    예산(QUERY_BUDGET_MAX_QUERIES, QUERY_BUDGET_MAX_DB_MS)을 넘으면 경고 출력 + 메트릭 기록
+    뷰별 쿼리 수 예산은 QUERY_BUDGET_OVERRIDES로 따로 지정할 수 있습니다.
+    스트리밍 응답(SSE)은 본문을 보내면서 실행하는 쿼리는 집계되지 않습니다.
+    """
+
+    def handle(self, request):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        return self._check(request, response, counter)
+
+    async def __acall__(self, request):
+        # ASGI에서 ORM은 요청별 전용 스레드(thread_sensitive)에서 실행되므로 그 스레드의 커넥션에 설치
+        counter = QueryCounter()
+        await sync_to_async(lambda: connection.execute_wrappers.append(counter))()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(lambda: connection.execute_wrappers.remove(counter))()
+        return self._check(request, response, counter)
+
+    def _check(self, request, response, counter):
+        match = request.resolver_match
+        view = match.view_name if match else 'unresolved'
+        db_ms = counter.seconds * 1000
+        metrics.http_db_queries.observe(counter.count, view=view)
+        metrics.http_db_seconds.observe(counter.seconds, view=view)
+
+        max_queries = settings.QUERY_BUDGET_OVERRIDES.get(view, settings.QUERY_BUDGET_MAX_QUERIES)
+        over = []
+        if counter.count > max_queries:
+            over.append('queries')
+        if db_ms > settings.QUERY_BUDGET_MAX_DB_MS:
+            over.append('db_time')
+        for budget in over:
+            metrics.http_query_budget_exceeded.inc(view=view, budget=budget)
+        if over:
+            print(f"Query Budget Exceeded ({view}): {counter.count} queries / {db_ms:.1f}ms "
+                  f"(budget {max_queries} queries / {settings.QUERY_BUDGET_MAX_DB_MS}ms)")
+
+        if settings.QUERY_BUDGET_HEADERS:
+            response['X-DB-Queries'] = str(counter.count)
+            response['X-DB-Time-Ms'] = f'{db_ms:.1f}'
+        return response
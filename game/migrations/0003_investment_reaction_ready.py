@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0002_gamesession_remaining_reroles"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="investment",
+            name="reaction_ready",
+            field=models.BooleanField(default=True, verbose_name="반응 생성 완료"),
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+DAILY_SIZE = 20
+ALL_TIME_SIZE = 10
+
+
+def populate_leaderboard(apps, schema_editor):
+    """기존 종료 게임으로 랭킹 보드 채우기"""
+    GameSession = apps.get_model("game", "GameSession")
+    LeaderboardEntry = apps.get_model("game", "LeaderboardEntry")
+
+    finished = GameSession.objects.filter(
+        is_finished=True, final_profit_rate__isnull=False
+    ).order_by("-final_profit_rate", "pk")
+
+    entries = []
+    all_time_count = 0
+    daily_counts = {}
+    for session in finished.iterator():
+        if all_time_count < ALL_TIME_SIZE:
+            all_time_count += 1
+            entries.append(
+                LeaderboardEntry(
+                    board="all_time",
+                    day=None,
+                    session_id=session.pk,
+                    profit_rate=session.final_profit_rate,
+                )
+            )
+        day = timezone.localdate(session.created_at)
+        if daily_counts.get(day, 0) < DAILY_SIZE:
+            daily_counts[day] = daily_counts.get(day, 0) + 1
+            entries.append(
+                LeaderboardEntry(
+                    board="daily",
+                    day=day,
+                    session_id=session.pk,
+                    profit_rate=session.final_profit_rate,
+                )
+            )
+    LeaderboardEntry.objects.bulk_create(entries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0003_investment_reaction_ready"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "board",
+                    models.CharField(
+                        choices=[("daily", "오늘의 랭킹"), ("all_time", "명예의 전당")],
+                        max_length=10,
+                        verbose_name="보드",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="날짜(오늘의 랭킹)"
+                    ),
+                ),
+                ("profit_rate", models.FloatField(verbose_name="최종 수익률(%)")),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_entries",
+                        to="game.gamesession",
+                        verbose_name="게임 세션",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["board", "day", "-profit_rate"],
+                        name="leaderboard_board_day_rate",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("board", "session"), name="leaderboard_unique_session"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_leaderboard, migrations.RunPython.noop),
+    ]
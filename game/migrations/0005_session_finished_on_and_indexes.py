@@ -0,0 +1,68 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:52
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_finished_on(apps, schema_editor):
+    """기존 종료 게임은 종료 시각 기록이 없으므로 생성일(KST)로 채움"""
+    GameSession = apps.get_model("game", "GameSession")
+    sessions = GameSession.objects.filter(is_finished=True, finished_on__isnull=True)
+    for session in sessions.only("pk", "created_at").iterator():
+        session.finished_on = timezone.localdate(session.created_at)
+        session.save(update_fields=["finished_on"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0004_leaderboardentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesession",
+            name="finished_on",
+            field=models.DateField(
+                blank=True, null=True, verbose_name="종료 날짜(KST)"
+            ),
+        ),
+        migrations.RunPython(backfill_finished_on, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                condition=models.Q(("is_finished", True)),
+                fields=["-final_profit_rate", "id"],
+                name="session_finished_rate",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                fields=["finished_on", "-final_profit_rate"],
+                name="session_finished_on_rate",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                condition=models.Q(("is_finished", True)),
+                fields=["user", "-created_at"],
+                name="session_user_finished_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gamesession",
+            index=models.Index(
+                condition=models.Q(("is_finished", False)),
+                fields=["user"],
+                name="session_user_active",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(
+                fields=["session", "created_at"], name="investment_session_created"
+            ),
+        ),
+    ]
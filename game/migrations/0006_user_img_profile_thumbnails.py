@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0005_session_finished_on_and_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="img_profile_thumbnails",
+            field=models.BooleanField(
+                default=False, verbose_name="프로필 썸네일 생성 여부"
+            ),
+        ),
+    ]
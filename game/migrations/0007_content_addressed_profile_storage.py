@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:59
+
+import game.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0006_user_img_profile_thumbnails"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StoredFile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="저장 경로"
+                    ),
+                ),
+                ("sha256", models.CharField(max_length=64, verbose_name="SHA-256")),
+                ("size", models.BigIntegerField(verbose_name="파일 크기(바이트)")),
+                (
+                    "refcount",
+                    models.PositiveIntegerField(default=0, verbose_name="참조 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="저장 시간"),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="img_profile",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=game.storage.profile_storage,
+                upload_to="profile/",
+                verbose_name="프로필 이미지",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-18 08:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0007_content_addressed_profile_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesession",
+            name="enchanted_turn",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="마지막 강화 턴"
+            ),
+        ),
+        migrations.AddField(
+            model_name="gamesession",
+            name="turn_no",
+            field=models.PositiveIntegerField(default=0, verbose_name="턴 번호"),
+        ),
+    ]
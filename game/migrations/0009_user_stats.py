@@ -0,0 +1,110 @@
+# Generated by Django 6.0.1 on 2026-10-18 08:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0008_session_turn_no"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="유저",
+                    ),
+                ),
+                (
+                    "investments",
+                    models.PositiveIntegerField(default=0, verbose_name="투자 횟수"),
+                ),
+                (
+                    "successes",
+                    models.PositiveIntegerField(default=0, verbose_name="성공 횟수"),
+                ),
+                (
+                    "total_invested",
+                    models.BigIntegerField(default=0, verbose_name="총 투자금(만원)"),
+                ),
+                (
+                    "total_profit",
+                    models.BigIntegerField(default=0, verbose_name="총 손익(만원)"),
+                ),
+                (
+                    "enchants",
+                    models.PositiveIntegerField(default=0, verbose_name="강화 횟수"),
+                ),
+                (
+                    "passes",
+                    models.PositiveIntegerField(default=0, verbose_name="패스 횟수"),
+                ),
+                (
+                    "bankruptcies",
+                    models.PositiveIntegerField(default=0, verbose_name="파산 횟수"),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="UserCharacterStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "character_key",
+                    models.CharField(max_length=20, verbose_name="캐릭터 키"),
+                ),
+                (
+                    "investments",
+                    models.PositiveIntegerField(default=0, verbose_name="투자 횟수"),
+                ),
+                (
+                    "successes",
+                    models.PositiveIntegerField(default=0, verbose_name="성공 횟수"),
+                ),
+                (
+                    "total_invested",
+                    models.BigIntegerField(default=0, verbose_name="총 투자금(만원)"),
+                ),
+                (
+                    "total_profit",
+                    models.BigIntegerField(default=0, verbose_name="총 손익(만원)"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="character_stats",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="유저",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "character_key"),
+                        name="character_stats_unique_user",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-18 08:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0009_user_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionArchive",
+            fields=[
+                (
+                    "session",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="archive",
+                        serialize=False,
+                        to="game.gamesession",
+                        verbose_name="게임 세션",
+                    ),
+                ),
+                ("data", models.BinaryField(verbose_name="투자 기록(zlib JSON)")),
+                (
+                    "investment_count",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="투자 기록 수"
+                    ),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="보관 시간"),
+                ),
+            ],
+        ),
+    ]
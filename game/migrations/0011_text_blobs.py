@@ -0,0 +1,133 @@
+# Generated by Django 6.0.1 on 2026-10-18 08:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from game import textblobs
+
+TEXT_FIELDS = ('idea_description', 'result_system_msg', 'result_character_reaction')
+BATCH_SIZE = 1000
+
+
+def text_to_blobs(apps, schema_editor):
+    """기존 문자열 필드 → TextBlob (같은 문구는 한 행) + Investment의 *_blob 연결"""
+    Investment = apps.get_model('game', 'Investment')
+    TextBlob = apps.get_model('game', 'TextBlob')
+    investments = Investment.objects.only(*TEXT_FIELDS).order_by('pk')
+    batch = []
+    for investment in investments.iterator(chunk_size=BATCH_SIZE):
+        batch.append(investment)
+        if len(batch) >= BATCH_SIZE:
+            _link_batch(TextBlob, Investment, batch)
+            batch = []
+    if batch:
+        _link_batch(TextBlob, Investment, batch)
+
+
+def _link_batch(TextBlob, Investment, investments):
+    blobs = {}
+    for investment in investments:
+        for field in TEXT_FIELDS:
+            text = getattr(investment, field)
+            blob_id = textblobs.blob_id(text) if text else None
+            if text and blob_id not in blobs:
+                data, compressed = textblobs.pack(text)
+                blobs[blob_id] = TextBlob(id=blob_id, data=data, compressed=compressed)
+            setattr(investment, f'{field}_blob_id', blob_id)
+    TextBlob.objects.bulk_create(blobs.values(), ignore_conflicts=True)
+    Investment.objects.bulk_update(investments, [f'{field}_blob' for field in TEXT_FIELDS])
+
+
+def blobs_to_text(apps, schema_editor):
+    """되돌리기: TextBlob 내용을 다시 문자열 필드로"""
+    Investment = apps.get_model('game', 'Investment')
+    TextBlob = apps.get_model('game', 'TextBlob')
+    texts = {blob.id: textblobs.unpack(blob.data, blob.compressed) for blob in TextBlob.objects.iterator()}
+    batch = []
+    for investment in Investment.objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+        for field in TEXT_FIELDS:
+            setattr(investment, field, texts.get(getattr(investment, f'{field}_blob_id'), ''))
+        batch.append(investment)
+        if len(batch) >= BATCH_SIZE:
+            Investment.objects.bulk_update(batch, TEXT_FIELDS)
+            batch = []
+    if batch:
+        Investment.objects.bulk_update(batch, TEXT_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0010_session_archive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TextBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        primary_key=True, serialize=False, verbose_name="내용 해시"
+                    ),
+                ),
+                ("data", models.BinaryField(verbose_name="내용(UTF-8, 길면 zlib)")),
+                (
+                    "compressed",
+                    models.BooleanField(default=False, verbose_name="압축 여부"),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="investment",
+            name="idea_description_blob",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="game.textblob",
+                verbose_name="아이디어 설명",
+            ),
+        ),
+        migrations.AddField(
+            model_name="investment",
+            name="result_character_reaction_blob",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="game.textblob",
+                verbose_name="[캐릭터] 반응",
+            ),
+        ),
+        migrations.AddField(
+            model_name="investment",
+            name="result_system_msg_blob",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="game.textblob",
+                verbose_name="[SYSTEM] 메시지",
+            ),
+        ),
+        migrations.RunPython(text_to_blobs, blobs_to_text),
+        migrations.RemoveField(
+            model_name="investment",
+            name="idea_description",
+        ),
+        migrations.RemoveField(
+            model_name="investment",
+            name="result_character_reaction",
+        ),
+        migrations.RemoveField(
+            model_name="investment",
+            name="result_system_msg",
+        ),
+    ]
@@ -1,6 +1,10 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 
+from . import rules, textblobs
+from .gemini_service import CHARACTERS
+from .storage import profile_storage
+
 
 # ============================================================
 # User 모델 (유동주 담당)
@@ -18,10 +22,15 @@ class User(AbstractUser):
     )
     img_profile = models.ImageField(
         upload_to='profile/',
+        storage=profile_storage,  # 내용 해시 경로 + 중복 제거
         blank=True,
         null=True,
         verbose_name='프로필 이미지'
     )
+    img_profile_thumbnails = models.BooleanField(
+        default=False,
+        verbose_name='프로필 썸네일 생성 여부'
+    )
     best_profit_rate = models.FloatField(
         default=0.0,
         verbose_name='최고 수익률'
@@ -54,11 +63,11 @@ class GameSession(models.Model):
         verbose_name='플레이어'
     )
     current_capital = models.BigIntegerField(
-        default=10000,  # 만원 단위, 1억 = 10000
+        default=rules.START_CAPITAL,  # 만원 단위, 1억 = 10000
         verbose_name='현재 자본금(만원)'
     )
     remaining_chances = models.IntegerField(
-        default=5,
+        default=rules.MAX_CHANCES,
         verbose_name='남은 기회'
     )
     is_finished = models.BooleanField(
@@ -76,16 +85,104 @@ class GameSession(models.Model):
     )
     # <><><><><><><><><><><><><><><> 0130
     remaining_reroles = models.IntegerField(
-        default=5,
+        default=rules.MAX_PASSES,
         verbose_name='남은 패스 횟수'
     )
     # <><><><><><><><><><><><><><><> end of 0130
+    finished_on = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name='종료 날짜(KST)'
+    )
+    # 투자/패스할 때마다 +1 (같은 턴에 두 번 투자/강화되지 않도록 UPDATE 조건으로 사용, transitions.py)
+    turn_no = models.PositiveIntegerField(
+        default=0,
+        verbose_name='턴 번호'
+    )
+    enchanted_turn = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='마지막 강화 턴'
+    )
+
+    class Meta:
+        # 불리언 조건은 SQL에서 "is_finished" 단독 식으로 나가서 복합 인덱스 선두 컬럼으로 못 씀
+        # → 종료/진행 여부는 부분 인덱스(condition)로 분리
+        indexes = [
+            # 명예의 전당 (종료된 게임 수익률 순)
+            models.Index(
+                fields=['-final_profit_rate', 'id'],
+                condition=models.Q(is_finished=True),
+                name='session_finished_rate',
+            ),
+            # 오늘의 랭킹 (종료 날짜 = 오늘, 수익률 순)
+            models.Index(fields=['finished_on', '-final_profit_rate'], name='session_finished_on_rate'),
+            # 마이페이지 최근 기록
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=models.Q(is_finished=True),
+                name='session_user_finished_created',
+            ),
+            # 메인/게임 시작의 진행 중 게임 조회
+            models.Index(
+                fields=['user'],
+                condition=models.Q(is_finished=False),
+                name='session_user_active',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.nickname}의 게임 ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
 
     def calculate_profit_rate(self):
         """수익률 계산: (현재자본 - 10000) / 10000 * 100"""
-        return (self.current_capital - 10000) / 10000 * 100
+        return rules.profit_rate(self.current_capital)
+
+# ============================================================
+# TextBlob 모델 (생성 문구 저장소, textblobs.py)
+# ============================================================
+class TextBlob(models.Model):
+    """
+    LLM/대체 문구 1개 (같은 문구는 한 행만)
+    - id는 내용 해시(textblobs.blob_id)라서 여러 행이 같은 문구를 가리킴
+    - 여러 투자 기록이 공유하므로 지우지 않음 (보관으로 원본 행이 사라져도 그대로)
+    """
+    id = models.BigIntegerField(
+        primary_key=True,
+        verbose_name='내용 해시'
+    )
+    data = models.BinaryField(
+        verbose_name='내용(UTF-8, 길면 zlib)'
+    )
+    compressed = models.BooleanField(
+        default=False,
+        verbose_name='압축 여부'
+    )
+
+    def __str__(self):
+        text = self.text
+        return text if len(text) <= 40 else f"{text[:40]}..."
+
+    @property
+    def text(self):
+        return textblobs.unpack(self.data, self.compressed)
+
+    @classmethod
+    def intern(cls, *texts):
+        """
+        문구들을 저장(이미 있으면 그대로)하고 id 목록 반환, 빈 문구는 None
+        새 문구가 있어도 INSERT 한 번, 모두 빈 문구면 쿼리 없음
+        """
+        ids = [textblobs.blob_id(text) if text else None for text in texts]
+        blobs = {}
+        for blob_id, text in zip(ids, texts):
+            if text and blob_id not in blobs:
+                data, compressed = textblobs.pack(text)
+                blobs[blob_id] = cls(id=blob_id, data=data, compressed=compressed)
+        if blobs:
+            cls.objects.bulk_create(blobs.values(), ignore_conflicts=True)
+        return ids
+
 
 # ============================================================
 # Investment 모델 (박기상 담당)
@@ -94,7 +191,11 @@ class Investment(models.Model):
     """
     투자 기록
     - 한 게임 세션 내 여러 투자 기록 저장
+    - 긴 생성 문구(설명/결과/반응)는 TextBlob id만 저장, 쓸 때는 TextBlob.intern()으로 id를 받아 넣음
+      읽을 때는 select_related(*Investment.TEXT_BLOBS)로 가져오면 쿼리 1번
     """
+    TEXT_BLOBS = ('idea_description_blob', 'result_system_msg_blob', 'result_character_reaction_blob')
+
     session = models.ForeignKey(
         GameSession,
         on_delete=models.CASCADE,
@@ -109,8 +210,13 @@ class Investment(models.Model):
         max_length=100,
         verbose_name='아이디어 제목'
     )
-    idea_description = models.TextField(
+    idea_description_blob = models.ForeignKey(
+        TextBlob,
+        on_delete=models.PROTECT,
+        null=True,
         blank=True,
+        db_index=False,
+        related_name='+',
         verbose_name='아이디어 설명'
     )
     invest_amount = models.BigIntegerField(
@@ -123,19 +229,274 @@ class Investment(models.Model):
         default=0,
         verbose_name='수익률(%)'
     )
-    result_system_msg = models.TextField(
+    result_system_msg_blob = models.ForeignKey(
+        TextBlob,
+        on_delete=models.PROTECT,
+        null=True,
         blank=True,
+        db_index=False,
+        related_name='+',
         verbose_name='[SYSTEM] 메시지'
     )
-    result_character_reaction = models.TextField(
+    result_character_reaction_blob = models.ForeignKey(
+        TextBlob,
+        on_delete=models.PROTECT,
+        null=True,
         blank=True,
+        db_index=False,
+        related_name='+',
         verbose_name='[캐릭터] 반응'
     )
+    reaction_ready = models.BooleanField(
+        default=True,
+        verbose_name='반응 생성 완료'
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name='투자 시간'
     )
 
+    class Meta:
+        indexes = [
+            # 세션별 투자 기록 (시간순)
+            models.Index(fields=['session', 'created_at'], name='investment_session_created'),
+        ]
+
     def __str__(self):
         result = "성공" if self.is_success else "실패"
-        return f"{self.character_name} - {self.idea_title} ({result})"
\ No newline at end of file
+        return f"{self.character_name} - {self.idea_title} ({result})"
+
+    # 기존 문자열 필드 이름 그대로 읽기 (템플릿/보관용, 비어 있으면 '')
+    @property
+    def idea_description(self):
+        return self.idea_description_blob.text if self.idea_description_blob_id else ''
+
+    @property
+    def result_system_msg(self):
+        return self.result_system_msg_blob.text if self.result_system_msg_blob_id else ''
+
+    @property
+    def result_character_reaction(self):
+        return self.result_character_reaction_blob.text if self.result_character_reaction_blob_id else ''
+
+# ============================================================
+# LeaderboardEntry 모델 (김정원 담당)
+# ============================================================
+class LeaderboardEntry(models.Model):
+    """
+    랭킹 보드 항목
+    - 게임 종료 시에만 갱신, 보드별 상위 K개만 유지
+    - daily: 날짜별 오늘의 랭킹 / all_time: 명예의 전당
+    """
+    BOARD_DAILY = 'daily'
+    BOARD_ALL_TIME = 'all_time'
+    BOARD_CHOICES = [
+        (BOARD_DAILY, '오늘의 랭킹'),
+        (BOARD_ALL_TIME, '명예의 전당'),
+    ]
+
+    board = models.CharField(
+        max_length=10,
+        choices=BOARD_CHOICES,
+        verbose_name='보드'
+    )
+    day = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name='날짜(오늘의 랭킹)'
+    )
+    session = models.ForeignKey(
+        GameSession,
+        on_delete=models.CASCADE,
+        related_name='leaderboard_entries',
+        verbose_name='게임 세션'
+    )
+    profit_rate = models.FloatField(
+        verbose_name='최종 수익률(%)'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'day', '-profit_rate'], name='leaderboard_board_day_rate'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['board', 'session'], name='leaderboard_unique_session'),
+        ]
+
+    def __str__(self):
+        return f"[{self.get_board_display()}] {self.session} {self.profit_rate:.1f}%"
+
+
+# ============================================================
+# StoredFile 모델 (내용 주소 저장소의 참조 카운트)
+# ============================================================
+class StoredFile(models.Model):
+    """
+    ContentAddressedStorage에 저장된 파일 1개
+    같은 내용을 여러 유저가 올려도 파일은 하나, refcount만 늘어남
+    """
+    name = models.CharField(
+        max_length=255,
+        unique=True,
+        verbose_name='저장 경로'
+    )
+    sha256 = models.CharField(
+        max_length=64,
+        verbose_name='SHA-256'
+    )
+    size = models.BigIntegerField(
+        verbose_name='파일 크기(바이트)'
+    )
+    refcount = models.PositiveIntegerField(
+        default=0,
+        verbose_name='참조 수'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='저장 시간'
+    )
+
+    def __str__(self):
+        return f"{self.name} (x{self.refcount})"
+
+
+# ============================================================
+# UserStats / UserCharacterStats 모델 (마이페이지 누적 통계)
+# ============================================================
+class UserStats(models.Model):
+    """
+    유저별 누적 통계
+    - 투자/강화/패스/게임 종료 트랜잭션 안에서 F() 증가로 갱신 (stats.py)
+    - 마이페이지는 투자 기록 전체 대신 이 행 하나만 읽음
+    - 판 수/최고 수익률은 기존대로 User.total_games/best_profit_rate
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        verbose_name='유저'
+    )
+    investments = models.PositiveIntegerField(
+        default=0,
+        verbose_name='투자 횟수'
+    )
+    successes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='성공 횟수'
+    )
+    total_invested = models.BigIntegerField(
+        default=0,
+        verbose_name='총 투자금(만원)'
+    )
+    total_profit = models.BigIntegerField(
+        default=0,
+        verbose_name='총 손익(만원)'
+    )
+    enchants = models.PositiveIntegerField(
+        default=0,
+        verbose_name='강화 횟수'
+    )
+    passes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='패스 횟수'
+    )
+    bankruptcies = models.PositiveIntegerField(
+        default=0,
+        verbose_name='파산 횟수'
+    )
+
+    def __str__(self):
+        return f"{self.user} 통계 (투자 {self.investments}회)"
+
+    @property
+    def success_rate(self):
+        """투자 성공률 (%)"""
+        return self.successes / self.investments * 100 if self.investments else 0
+
+    @property
+    def roi(self):
+        """총 투자금 대비 손익 (%)"""
+        return self.total_profit / self.total_invested * 100 if self.total_invested else 0
+
+
+class UserCharacterStats(models.Model):
+    """유저 x 캐릭터별 누적 투자 통계 (캐릭터 수만큼만 행이 생김)"""
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='character_stats',
+        verbose_name='유저'
+    )
+    character_key = models.CharField(
+        max_length=20,
+        verbose_name='캐릭터 키'
+    )
+    investments = models.PositiveIntegerField(
+        default=0,
+        verbose_name='투자 횟수'
+    )
+    successes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='성공 횟수'
+    )
+    total_invested = models.BigIntegerField(
+        default=0,
+        verbose_name='총 투자금(만원)'
+    )
+    total_profit = models.BigIntegerField(
+        default=0,
+        verbose_name='총 손익(만원)'
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'character_key'], name='character_stats_unique_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.character_key} (투자 {self.investments}회)"
+
+    @property
+    def character(self):
+        return CHARACTERS.get(self.character_key, {'key': self.character_key, 'name': self.character_key})
+
+    @property
+    def success_rate(self):
+        return self.successes / self.investments * 100 if self.investments else 0
+
+    @property
+    def roi(self):
+        return self.total_profit / self.total_invested * 100 if self.total_invested else 0
+
+
+# ============================================================
+# SessionArchive 모델 (오래된 게임의 투자 기록 보관)
+# ============================================================
+class SessionArchive(models.Model):
+    """
+    종료된 지 오래된 게임의 투자 기록 묶음 (archive.py, archive_sessions 명령어)
+    - 투자 기록(LLM 문구 포함)을 zlib 압축 JSON 하나로 저장하고 Investment 행은 삭제
+    - GameSession 행(최종 수익률/자본금, 랭킹 보드 참조)과 누적 통계는 그대로 남음
+    """
+    session = models.OneToOneField(
+        GameSession,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='archive',
+        verbose_name='게임 세션'
+    )
+    data = models.BinaryField(
+        verbose_name='투자 기록(zlib JSON)'
+    )
+    investment_count = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='투자 기록 수'
+    )
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='보관 시간'
+    )
+
+    def __str__(self):
+        return f"{self.session} 보관 ({self.investment_count}건)"
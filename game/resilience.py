@@ -0,0 +1,305 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어서 호출을 건너뜀"""
+
+
+class DeadlineExceeded(Exception):
+    """호출이 마감 시간(deadline) 안에 끝나지 않음"""
+
+
+# ============================================================
+# 서킷 브레이커
+# ============================================================
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 열림(open) → reset_timeout 동안 호출 차단
+    이후 반열림(half_open) 상태에서 시험 호출 1건 허용, 성공하면 닫힘(closed)
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.open_count = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """지금 호출해도 되는지 (반열림이면 시험 호출 1건만 허용)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.open_count += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """결과 없이 끝난 호출 (예: 스트리밍 중 클라이언트 이탈) → 시험 호출 자리만 반납"""
+        with self._lock:
+            self._probing = False
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'open_count': self.open_count,
+            }
+
+
+# ============================================================
+# 최근 지연시간 (헤지 지연 계산용)
+# ============================================================
+class LatencyTracker:
+    """최근 window건의 성공 호출 지연시간(초)으로 백분위 계산"""
+
+    def __init__(self, window=200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def count(self):
+        return len(self._samples)
+
+    def percentile(self, p):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * p / 100))
+        return samples[index]
+
+
+# ============================================================
+# 마감 시간 + 헤지 요청 + 브레이커를 묶은 호출기
+# ============================================================
+class GuardedCaller:
+    """
+    외부 호출을 마감 시간 안에서 실행
+    - hedge=True면 p(hedge_percentile) 지연을 넘길 때 같은 요청을 하나 더 보내고 먼저 끝난 쪽 사용
+    - 실패/시간 초과는 브레이커에 기록, 브레이커가 열려 있으면 바로 CircuitOpenError
+    """
+
+    def __init__(self, breaker, max_workers=32, hedge_percentile=95,
+                 hedge_min_delay=1.0, hedge_min_samples=20):
+        self.breaker = breaker
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-call')
+        self._latency = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def call(self, kind, func, deadline, hedge=False):
+        if not self.breaker.allow():
+            self._count(kind, 'short_circuited')
+            raise CircuitOpenError(f'{kind}: 서킷 브레이커 열림')
+
+        self._count(kind, 'calls')
+        start = time.monotonic()
+        futures = [self._executor.submit(self._timed, kind, func)]
+        try:
+            hedge_delay = self.hedge_delay(kind) if hedge else None
+            if hedge_delay is not None and hedge_delay < deadline:
+                done, _ = wait(futures, timeout=hedge_delay)
+                if not done:
+                    futures.append(self._executor.submit(self._timed, kind, func))
+                    self._count(kind, 'hedged')
+
+            result, winner = self._first_result(futures, deadline - (time.monotonic() - start))
+        except DeadlineExceeded:
+            self._count(kind, 'deadline_exceeded')
+            self.breaker.record_failure()
+            raise
+        except Exception:
+            self._count(kind, 'errors')
+            self.breaker.record_failure()
+            raise
+
+        if winner > 0:
+            self._count(kind, 'hedge_wins')
+        self.breaker.record_success()
+        return result
+
+    async def acall(self, kind, func, deadline, hedge=False):
+        """
+        call()의 async 버전 (func()는 코루틴을 돌려줌, 스레드 풀을 쓰지 않음)
+        스레드와 달리 늦게 끝난 쪽(헤지 패자/마감 초과)은 바로 취소합니다.
+        """
+        if not self.breaker.allow():
+            self._count(kind, 'short_circuited')
+            raise CircuitOpenError(f'{kind}: 서킷 브레이커 열림')
+
+        self._count(kind, 'calls')
+        start = time.monotonic()
+        tasks = [asyncio.ensure_future(self._atimed(kind, func))]
+        try:
+            hedge_delay = self.hedge_delay(kind) if hedge else None
+            if hedge_delay is not None and hedge_delay < deadline:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    tasks.append(asyncio.ensure_future(self._atimed(kind, func)))
+                    self._count(kind, 'hedged')
+
+            result, winner = await self._afirst_result(tasks, deadline - (time.monotonic() - start))
+        except DeadlineExceeded:
+            self._count(kind, 'deadline_exceeded')
+            self.breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            # 클라이언트 연결이 끊겨서 요청이 취소됨 → 실패로 세지 않음
+            self.breaker.release()
+            raise
+        except Exception:
+            self._count(kind, 'errors')
+            self.breaker.record_failure()
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if winner > 0:
+            self._count(kind, 'hedge_wins')
+        self.breaker.record_success()
+        return result
+
+    def stream(self, kind, func, deadline):
+        """
+        스트리밍 호출 (func()가 돌려주는 이터레이터를 그대로 흘려보냄)
+        헤지는 하지 않고, 조각 사이에서 마감 시간을 확인합니다.
+        """
+        if not self.breaker.allow():
+            self._count(kind, 'short_circuited')
+            raise CircuitOpenError(f'{kind}: 서킷 브레이커 열림')
+
+        self._count(kind, 'calls')
+        start = time.monotonic()
+        try:
+            for chunk in func():
+                if time.monotonic() - start > deadline:
+                    raise DeadlineExceeded(f'{deadline:.1f}초 안에 스트리밍이 끝나지 않음')
+                yield chunk
+        except GeneratorExit:
+            self.breaker.release()
+            raise
+        except DeadlineExceeded:
+            self._count(kind, 'deadline_exceeded')
+            self.breaker.record_failure()
+            raise
+        except Exception:
+            self._count(kind, 'errors')
+            self.breaker.record_failure()
+            raise
+        self._tracker(kind).add(time.monotonic() - start)
+        self.breaker.record_success()
+
+    def hedge_delay(self, kind):
+        """최근 지연시간의 p95 (표본이 적으면 헤지 안 함)"""
+        tracker = self._tracker(kind)
+        if tracker.count() < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, tracker.percentile(self.hedge_percentile))
+
+    def stats(self):
+        with self._lock:
+            counters = {kind: dict(values) for kind, values in self._counters.items()}
+        return {
+            'breaker': self.breaker.snapshot(),
+            'calls': counters,
+            'hedge_delay': {kind: self.hedge_delay(kind) for kind in list(self._latency)},
+        }
+
+    def _first_result(self, futures, remaining):
+        """먼저 성공한 결과 반환, 모두 실패하면 마지막 예외, 시간 초과면 DeadlineExceeded"""
+        end = time.monotonic() + remaining
+        pending = set(futures)
+        error = None
+        while pending:
+            timeout = end - time.monotonic()
+            if timeout <= 0:
+                break
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result(), futures.index(future)
+                error = future.exception()
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceeded(f'{remaining:.1f}초 안에 응답 없음')
+
+    async def _afirst_result(self, tasks, remaining):
+        """_first_result()의 async 버전"""
+        end = time.monotonic() + remaining
+        pending = set(tasks)
+        error = None
+        while pending:
+            timeout = end - time.monotonic()
+            if timeout <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), tasks.index(task)
+                error = task.exception()
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceeded(f'{remaining:.1f}초 안에 응답 없음')
+
+    async def _atimed(self, kind, func):
+        start = time.monotonic()
+        result = await func()
+        self._tracker(kind).add(time.monotonic() - start)
+        return result
+
+    def _timed(self, kind, func):
+        start = time.monotonic()
+        result = func()
+        self._tracker(kind).add(time.monotonic() - start)
+        return result
+
+    def _tracker(self, kind):
+        tracker = self._latency.get(kind)
+        if tracker is None:
+            with self._lock:
+                tracker = self._latency.setdefault(kind, LatencyTracker())
+        return tracker
+
+    def _count(self, kind, name):
+        with self._lock:
+            counters = self._counters.setdefault(kind, {})
+            counters[name] = counters.get(name, 0) + 1
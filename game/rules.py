@@ -0,0 +1,80 @@
+import random
+
+from .gemini_service import CHARACTERS
+
+# ============================================================
+# 게임 규칙 (views/transitions와 밸런스 시뮬레이터가 같이 사용)
+# - 숫자와 공식을 여기 한 곳에만 두어서 실제 게임과 시뮬레이션 결과가 어긋나지 않게 함
+# - 캐릭터별 밸런스 데이터(spawn_weight, success_rate, min_roi, max_roi)는 CHARACTERS에 있음
+# - 금액은 모두 만원 단위
+# ============================================================
+START_CAPITAL = 10000       # 시작 자본금 (1억)
+MAX_CHANCES = 5             # 투자 기회
+MAX_PASSES = 5              # 패스 횟수
+MIN_INVEST_AMOUNT = 2000    # 최소 투자금 (전 재산 올인은 예외)
+ENCHANT_COST = 2000         # 강화 비용 (한 턴에 한 번)
+ENCHANT_BOOST = (10, 50)    # 강화 시 성공 확률 증가폭 (%p, 양 끝 포함)
+MAX_SUCCESS_PROB = 1.0
+FAIL_PROFIT_RATE = -100     # 실패 시 투자금 전액 손실
+
+
+def get_random_character(rng=random):
+    """
+    랜덤 캐릭터 선택 (가중치 적용)
+    spawn_weight가 높을수록 자주 등장합니다.
+    """
+    keys = list(CHARACTERS.keys())
+    weights = [CHARACTERS[k]['spawn_weight'] for k in keys]
+
+    # 가중치 기반 랜덤 선택 (리스트로 반환되므로 [0]으로 꺼냄)
+    selected_key = rng.choices(keys, weights=weights, k=1)[0]
+    return CHARACTERS[selected_key]
+
+
+def roi_range(character):
+    """성공 시 수익률 범위 (%, 양 끝 포함)"""
+    return character.get('min_roi', 10), character.get('max_roi', 50)
+
+
+def is_valid_amount(amount, capital):
+    """투자 가능 금액인지 (2천만원 이상, 2천만원 미만은 전 재산 올인일 때만)"""
+    if amount <= 0 or amount > capital:
+        return False
+    return amount >= MIN_INVEST_AMOUNT or amount == capital
+
+
+def investment_return(amount, profit_rate):
+    """
+    성공 시 수익금 (소수점 이하는 호출한 쪽에서 버림)
+    numpy 배열을 넣어도 같은 순서로 계산되도록 식을 그대로 둠
+    """
+    return amount * (profit_rate / 100)
+
+
+def roll_investment(character, success_prob, amount, rng=random):
+    """성공 여부 + 수익률 + 자본금 변화량 결정"""
+    is_success = rng.random() < success_prob
+
+    if is_success:
+        profit_rate = rng.randint(*roi_range(character))
+        capital_delta = int(investment_return(amount, profit_rate))
+    else:
+        profit_rate = FAIL_PROFIT_RATE
+        capital_delta = -amount
+    return is_success, profit_rate, capital_delta
+
+
+def enchant(success_prob, rng=random):
+    """강화: 성공 확률 10~50%p 랜덤 증가 (최대 100%)"""
+    prob_add = rng.randint(*ENCHANT_BOOST) / 100
+    return min(MAX_SUCCESS_PROB, success_prob + prob_add)
+
+
+def is_game_over(capital, remaining_chances):
+    """파산했거나 투자 기회를 다 쓰면 종료 (numpy 배열도 가능하도록 | 사용)"""
+    return (capital <= 0) | (remaining_chances <= 0)
+
+
+def profit_rate(capital):
+    """수익률 계산: (현재자본 - 10000) / 10000 * 100"""
+    return (capital - START_CAPITAL) / START_CAPITAL * 100
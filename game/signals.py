@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.dispatch import Signal, receiver
+
+from .models import LeaderboardEntry
+
+# ============================================================
+# 게임 종료 신호
+# - finish_game()에서 GameSession이 is_finished=True로 바뀐 직후 발송
+# - 인자: session, boards (랭킹 보드 중 실제로 바뀐 [(board, day), ...])
+# ============================================================
+game_finished = Signal()
+
+
+# 캐시된 랭킹 조각 이름 (templates/game/main.html, ranking.html의 {% cache %} 태그와 같아야 함)
+DAILY_FRAGMENTS = ('main_top3', 'ranking_today')  # 날짜별
+ALL_TIME_FRAGMENTS = ('ranking_hall_of_fame',)
+
+
+def invalidate_ranking_fragments(day=None, all_time=True):
+    """랭킹 조각 캐시 삭제 (day: 오늘의 랭킹/Top 3 날짜, all_time: 명예의 전당 포함 여부)"""
+    keys = []
+    if day is not None:
+        keys += [make_template_fragment_key(name, [day]) for name in DAILY_FRAGMENTS]
+    if all_time:
+        keys += [make_template_fragment_key(name) for name in ALL_TIME_FRAGMENTS]
+    cache.delete_many(keys)
+
+
+@receiver(game_finished)
+def refresh_ranking_cache(sender, session, boards, **kwargs):
+    """랭킹 보드가 바뀐 경우에만 해당 조각 캐시 삭제 (상위권 밖이면 캐시 유지)"""
+    for board, day in boards:
+        if board == LeaderboardEntry.BOARD_DAILY:
+            invalidate_ranking_fragments(day=day, all_time=False)
+        else:
+            invalidate_ranking_fragments(all_time=True)
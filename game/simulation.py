@@ -0,0 +1,239 @@
+import numpy as np
+
+from . import rules
+from .gemini_service import CHARACTERS
+
+# ============================================================
+# 밸런스 몬테카를로 시뮬레이터 (numpy 필요, simulate_balance 명령에서 사용)
+# - 게임 N판을 배열 하나씩으로 두고 턴 단위로 한꺼번에 진행 (판마다 파이썬 루프 없음)
+# - 숫자/공식은 rules.py 것을 그대로 사용하므로 views의 실제 게임과 같은 규칙
+# - 한 턴 흐름: 캐릭터 등장 → (패스) → (강화) → 투자
+#   패스/투자 중 하나는 꼭 하므로 최대 MAX_CHANCES + MAX_PASSES 턴이면 모든 판이 끝남
+# ============================================================
+class CharacterTable:
+    """CHARACTERS 밸런스 데이터를 캐릭터 순서대로 배열로 모아둔 것"""
+
+    def __init__(self, characters=CHARACTERS):
+        self.keys = list(characters)
+        self.names = [characters[k]['name'] for k in self.keys]
+        weights = np.array([characters[k]['spawn_weight'] for k in self.keys], dtype=float)
+        self.spawn_prob = weights / weights.sum()
+        self.success_rate = np.array([characters[k].get('success_rate', 0.5) for k in self.keys])
+        roi = np.array([rules.roi_range(characters[k]) for k in self.keys])
+        self.min_roi, self.max_roi = roi[:, 0], roi[:, 1]
+        self.mean_roi = roi.mean(axis=1)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def draw(self, rng, size):
+        """rules.get_random_character()와 같은 가중치로 캐릭터 번호 size개"""
+        return rng.choice(len(self), size=size, p=self.spawn_prob)
+
+    def expected_return(self, character, prob):
+        """투자금 1당 기대 손익 (성공: +평균 수익률, 실패: -1)"""
+        return prob * self.mean_roi[character] / 100 - (1 - prob)
+
+
+class Turn:
+    """진행 중인 판들의 이번 턴 상태 (전략이 읽는 값, 모두 같은 길이의 배열)"""
+
+    def __init__(self, table, capital, chances, passes, character):
+        self.table = table
+        self.capital = capital
+        self.chances = chances
+        self.passes = passes
+        self.character = character
+        self.prob = table.success_rate[character]
+
+    def select(self, mask):
+        turn = Turn.__new__(Turn)
+        turn.table = self.table
+        for name in ('capital', 'chances', 'passes', 'character', 'prob'):
+            setattr(turn, name, getattr(self, name)[mask])
+        return turn
+
+
+# ============================================================
+# 플레이어 전략 (STRATEGIES에 등록된 이름으로 선택)
+# - should_pass / should_enchant: 판별 True/False 배열 (패스 횟수/강화 비용은 시뮬레이터가 확인)
+# - bet: 투자금 배열 (시뮬레이터가 최소 투자금~전 재산 범위로 맞춤)
+# ============================================================
+STRATEGIES = {}
+
+
+def register(name):
+    def decorator(cls):
+        cls.name = name
+        STRATEGIES[name] = cls
+        return cls
+    return decorator
+
+
+class Strategy:
+    """기본 전략: 패스/강화 없이 최소 금액만 투자"""
+    name = ''
+    description = ''
+
+    def should_pass(self, turn):
+        return np.zeros(len(turn.capital), dtype=bool)
+
+    def should_enchant(self, turn):
+        return np.zeros(len(turn.capital), dtype=bool)
+
+    def bet(self, turn):
+        return np.full(len(turn.capital), rules.MIN_INVEST_AMOUNT, dtype=np.int64)
+
+
+@register('min')
+class MinBet(Strategy):
+    description = '매번 최소 금액(2천만원)만 투자'
+
+
+@register('all_in')
+class AllIn(Strategy):
+    description = '매번 전 재산 올인'
+
+    def bet(self, turn):
+        return turn.capital
+
+
+@register('half')
+class Half(Strategy):
+    description = '매번 자본금의 절반 투자'
+
+    def bet(self, turn):
+        return turn.capital // 2
+
+
+@register('kelly')
+class Kelly(Strategy):
+    """켈리 비율 f = p - (1-p) / b (b: 평균 수익률 배수)"""
+    description = '켈리 비율만큼 투자'
+
+    def bet(self, turn):
+        odds = turn.table.mean_roi[turn.character] / 100
+        fraction = np.clip(turn.prob - (1 - turn.prob) / odds, 0, 1)
+        return (turn.capital * fraction).astype(np.int64)
+
+
+@register('picky')
+class Picky(Half):
+    """평균보다 기대값이 낮은 캐릭터는 패스, 강화 기대 이득이 비용보다 크면 강화"""
+    description = '기대값 낮은 캐릭터 패스 + 이득이면 강화, 절반 투자'
+
+    def should_pass(self, turn):
+        table = turn.table
+        average = (table.spawn_prob * table.expected_return(np.arange(len(table)), table.success_rate)).sum()
+        return table.expected_return(turn.character, turn.prob) < average
+
+    def should_enchant(self, turn):
+        boost = np.minimum(rules.MAX_SUCCESS_PROB - turn.prob, np.mean(rules.ENCHANT_BOOST) / 100)
+        amount = (turn.capital - rules.ENCHANT_COST) // 2
+        gain = boost * amount * (1 + turn.table.mean_roi[turn.character] / 100)
+        return gain > rules.ENCHANT_COST
+
+
+# ============================================================
+# 시뮬레이션
+# ============================================================
+class Result:
+    """시뮬레이션 결과 (판별 최종 자본금 + 캐릭터별 투자 집계)"""
+
+    def __init__(self, strategy, final_capital, table, invested, returned, investments, wins, elapsed=0.0):
+        self.strategy = strategy
+        self.final_capital = final_capital
+        self.table = table
+        self.invested = invested          # 캐릭터별 투자금 합계
+        self.returned = returned          # 캐릭터별 자본금 변화량 합계
+        self.investments = investments    # 캐릭터별 투자 횟수
+        self.wins = wins                  # 캐릭터별 성공 횟수
+        self.elapsed = elapsed
+
+    @property
+    def profit_rate(self):
+        return rules.profit_rate(self.final_capital)
+
+    @property
+    def bankrupt_rate(self):
+        return float((self.final_capital <= 0).mean())
+
+
+def simulate(strategy, games, rng, table=None):
+    """전략 하나로 games판을 끝까지 진행"""
+    table = table or CharacterTable()
+    capital = np.full(games, rules.START_CAPITAL, dtype=np.int64)
+    chances = np.full(games, rules.MAX_CHANCES, dtype=np.int64)
+    passes = np.full(games, rules.MAX_PASSES, dtype=np.int64)
+    size = len(table)
+    invested = np.zeros(size)
+    returned = np.zeros(size)
+    investments = np.zeros(size, dtype=np.int64)
+    wins = np.zeros(size, dtype=np.int64)
+
+    for _ in range(rules.MAX_CHANCES + rules.MAX_PASSES):
+        live = np.flatnonzero(~rules.is_game_over(capital, chances))
+        if not live.size:
+            break
+        turn = Turn(table, capital[live], chances[live], passes[live], table.draw(rng, live.size))
+
+        # 패스: 패스 횟수를 쓰고 이번 턴 종료
+        passing = strategy.should_pass(turn) & (turn.passes > 0)
+        passes[live[passing]] -= 1
+        live, turn = live[~passing], turn.select(~passing)
+
+        # 강화: 비용 차감 후 확률 증가 (비용을 내고 0원이 되면 투자 못하고 파산)
+        enchanting = strategy.should_enchant(turn) & (turn.capital >= rules.ENCHANT_COST)
+        turn.capital = turn.capital - np.where(enchanting, rules.ENCHANT_COST, 0)
+        boost = rng.integers(rules.ENCHANT_BOOST[0], rules.ENCHANT_BOOST[1], endpoint=True, size=live.size) / 100
+        turn.prob = np.where(enchanting, np.minimum(rules.MAX_SUCCESS_PROB, turn.prob + boost), turn.prob)
+        capital[live] = turn.capital
+        investing = turn.capital > 0
+        live, turn = live[investing], turn.select(investing)
+
+        # 투자: rules.is_valid_amount 범위로 맞춤 (최소 투자금 이상, 모자라면 올인)
+        amount = np.clip(strategy.bet(turn), np.minimum(rules.MIN_INVEST_AMOUNT, turn.capital), turn.capital)
+        success = rng.random(live.size) < turn.prob
+        rate = rng.integers(table.min_roi[turn.character], table.max_roi[turn.character], endpoint=True)
+        delta = np.where(success, rules.investment_return(amount, rate).astype(np.int64), -amount)
+        capital[live] += delta
+        chances[live] -= 1
+
+        invested += np.bincount(turn.character, weights=amount, minlength=size)
+        returned += np.bincount(turn.character, weights=delta, minlength=size)
+        investments += np.bincount(turn.character, minlength=size)
+        wins += np.bincount(turn.character[success], minlength=size)
+
+    return Result(strategy.name, capital, table, invested, returned, investments, wins)
+
+
+def simulate_scalar(strategy, games, rng, table=None):
+    """
+    같은 전략을 views와 같은 스칼라 함수(rules.get_random_character/roll_investment/enchant)로 한 판씩 진행
+    느리지만 simulate()의 배열 계산이 실제 게임 규칙과 어긋나지 않았는지 비교하는 용도
+    rng: random.Random
+    """
+    table = table or CharacterTable()
+    final_capital = np.zeros(games, dtype=np.int64)
+    for game in range(games):
+        capital, chances, passes = rules.START_CAPITAL, rules.MAX_CHANCES, rules.MAX_PASSES
+        while not rules.is_game_over(capital, chances):
+            character = rules.get_random_character(rng)
+            index = table.keys.index(character['key'])
+            turn = Turn(table, np.array([capital]), np.array([chances]), np.array([passes]), np.array([index]))
+            if passes > 0 and strategy.should_pass(turn)[0]:
+                passes -= 1
+                continue
+            prob = character.get('success_rate', 0.5)
+            if capital >= rules.ENCHANT_COST and strategy.should_enchant(turn)[0]:
+                capital -= rules.ENCHANT_COST
+                prob = rules.enchant(prob, rng)
+                if capital <= 0:
+                    break
+            turn.capital, turn.prob = np.array([capital]), np.array([prob])
+            amount = int(min(max(strategy.bet(turn)[0], min(rules.MIN_INVEST_AMOUNT, capital)), capital))
+            assert rules.is_valid_amount(amount, capital)
+            capital += rules.roll_investment(character, prob, amount, rng)[2]
+            chances -= 1
+        final_capital[game] = capital
+    return final_capital
@@ -0,0 +1,56 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import UserCharacterStats, UserStats
+
+
+# ============================================================
+# 유저 누적 통계 (마이페이지용 롤업 테이블)
+# - 쓰기: 투자/강화/패스/게임 종료 트랜잭션 안에서 호출, "x = x + n" UPDATE 한 번
+# - 읽기: 마이페이지에서 UserStats 1행 + 캐릭터별 최대 캐릭터 수만큼
+# - 기존 기록으로 다시 계산하려면 python manage.py backfill_user_stats
+# ============================================================
+def _increment(model, lookup, **deltas):
+    """lookup 행의 필드들에 deltas를 더함 (행이 없으면 그 값으로 생성)"""
+    changes = {field: F(field) + value for field, value in deltas.items()}
+    if model.objects.filter(**lookup).update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **deltas)
+    except IntegrityError:
+        # 다른 요청이 먼저 만든 경우
+        model.objects.filter(**lookup).update(**changes)
+
+
+def record_investment(user_id, character_key, invest_amount, is_success, capital_delta):
+    """투자 1회 반영 (전체 + 캐릭터별)"""
+    deltas = {
+        'investments': 1,
+        'successes': int(is_success),
+        'total_invested': invest_amount,
+        'total_profit': capital_delta,
+    }
+    _increment(UserStats, {'user_id': user_id}, **deltas)
+    _increment(UserCharacterStats, {'user_id': user_id, 'character_key': character_key}, **deltas)
+
+
+def record_enchant(user_id):
+    _increment(UserStats, {'user_id': user_id}, enchants=1)
+
+
+def record_pass(user_id):
+    _increment(UserStats, {'user_id': user_id}, passes=1)
+
+
+def record_game(user_id, bankrupt):
+    """게임 종료 반영 (판 수/최고 수익률은 transitions.record_user_game)"""
+    if bankrupt:
+        _increment(UserStats, {'user_id': user_id}, bankruptcies=1)
+
+
+def for_user(user):
+    """마이페이지용 (UserStats, 캐릭터별 목록), 기록이 없으면 0으로 채운 UserStats"""
+    user_stats = UserStats.objects.filter(user=user).first() or UserStats(user=user)
+    characters = list(UserCharacterStats.objects.filter(user=user).order_by('-investments', 'character_key'))
+    return user_stats, characters
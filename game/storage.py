@@ -0,0 +1,72 @@
+import hashlib
+import posixpath
+import re
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+
+# 내용 해시 이름 파일 (원본 profile/3f/3fa1...e9.webp, 썸네일 profile/3f/thumbs/3fa1...e9-sm.webp)
+CONTENT_ADDRESSED = re.compile(r'(^|/)[0-9a-f]{64}[^/]*$')
+
+
+# ============================================================
+# 내용 주소 저장소 (같은 파일은 한 번만 저장 + 참조 카운트)
+# ============================================================
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    파일 이름 대신 내용(SHA-256)으로 경로를 정하는 저장소
+    - save(): {upload_to}/{해시 앞 2자리}/{해시}{확장자}, 이미 있으면 쓰지 않고 참조 수만 +1
+    - delete(): 참조 수 -1, 0이 되면 실제 파일 삭제
+    - 해시 이름은 내용이 바뀌지 않으므로 URL을 영구 캐시해도 안전 (views.media_view 참고)
+    참조 수는 StoredFile 테이블에 기록하고, 어긋난 경우 gc_media 커맨드로 맞춥니다.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # 같은 이름 = 같은 내용이므로 뒤에 임의 문자열을 붙이지 않음
+        return name
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        sha256 = digest.hexdigest()
+        directory, filename = posixpath.split(name)
+        if CONTENT_ADDRESSED.search(name):
+            # 이미 해시 경로인 파일에서 파생된 이름 (예: 재인코딩) → 해시 앞자리 폴더 한 단계 위로
+            directory = posixpath.dirname(directory)
+        extension = posixpath.splitext(filename)[1].lower()
+        name = posixpath.join(directory, sha256[:2], f'{sha256}{extension}')
+
+        from .models import StoredFile
+
+        with transaction.atomic():
+            stored, created = StoredFile.objects.select_for_update().get_or_create(
+                name=name, defaults={'sha256': sha256, 'size': content.size, 'refcount': 1},
+            )
+            if not created:
+                StoredFile.objects.filter(pk=stored.pk).update(refcount=F('refcount') + 1)
+            if not self.exists(name):
+                content.seek(0)
+                super()._save(name, content)
+        return name
+
+    def delete(self, name):
+        from .models import StoredFile
+
+        with transaction.atomic():
+            stored = StoredFile.objects.select_for_update().filter(name=name).first()
+            if stored is None:
+                # 참조 기록이 없는 파일 (저장소 도입 전 업로드) → 바로 삭제
+                super().delete(name)
+                return
+            if stored.refcount > 1:
+                StoredFile.objects.filter(pk=stored.pk).update(refcount=F('refcount') - 1)
+                return
+            stored.delete()
+            super().delete(name)
+
+
+def profile_storage():
+    """User.img_profile용 저장소 (MEDIA_ROOT 기준)"""
+    return ContentAddressedStorage()
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .gemini_service import generate_result
+from .models import Investment, TextBlob
+
+
+# ============================================================
+# 백그라운드 작업 (요청 스레드 밖에서 처리)
+# ============================================================
+_executor = ThreadPoolExecutor(
+    max_workers=settings.BACKGROUND_WORKERS,
+    thread_name_prefix='game-background',
+)
+
+
+def submit(func, *args, **kwargs):
+    """백그라운드 스레드에서 func 실행 (작업 후 DB 연결 정리)"""
+    def run():
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            print(f"Background Task Error ({func.__name__}): {e}")
+        finally:
+            close_old_connections()
+
+    return _executor.submit(run)
+
+
+def fill_result_reaction(investment_id, character, idea_title, is_success):
+    """
+    투자 결과 반응 채우기
+    투자 기록은 이미 저장된 상태이고, AI 반응 문구만 나중에 업데이트합니다.
+    """
+    result = generate_result(character, idea_title, is_success)
+    system_msg_id, reaction_id = TextBlob.intern(result.get('system_msg', ''), result.get('reaction', ''))
+    Investment.objects.filter(pk=investment_id, reaction_ready=False).update(
+        result_system_msg_blob_id=system_msg_id,
+        result_character_reaction_blob_id=reaction_id,
+        reaction_ready=True,
+    )
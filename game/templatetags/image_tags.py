@@ -0,0 +1,80 @@
+import json
+import os
+import threading
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from game.thumbnails import retry_profile_image, thumbnail_name
+
+register = template.Library()
+
+_manifest = {'path': None, 'mtime': None, 'data': {}}
+_manifest_lock = threading.Lock()
+
+
+def load_manifest():
+    """
+    build_character_images가 만든 manifest.json 읽기 (파일이 바뀌었을 때만 다시 읽음)
+    없으면 빈 dict → 태그가 원본 PNG로 대체
+    """
+    path = finders.find(f'{settings.CHARACTER_IMAGE_DIR}/variants/manifest.json')
+    if not path:
+        return {}
+    mtime = os.path.getmtime(path)
+    with _manifest_lock:
+        if _manifest['path'] != path or _manifest['mtime'] != mtime:
+            with open(path, encoding='utf-8') as f:
+                _manifest.update(path=path, mtime=mtime, data=json.load(f))
+        return _manifest['data']
+
+
+@register.simple_tag
+def character_picture(name, alt='', sizes='300px', lazy=False):
+    """
+    캐릭터 이미지 <picture> 태그 (AVIF/WebP 폭별 srcset + 원본 PNG 대체)
+    name: 파일 이름 (확장자 제외) 예) 'jaemin', character.key, character_key|add:'_success'
+    sizes: 화면에 표시되는 크기 (CSS 기준) 예) '(max-width: 768px) 140px, 300px'
+
+    사용 예)
+        {% load image_tags %}
+        {% character_picture character.key alt=character.name sizes='(max-width: 768px) 140px, 300px' %}
+    """
+    fallback = static(f'{settings.CHARACTER_IMAGE_DIR}/{name}.png')
+    loading = 'lazy' if lazy else 'eager'
+    entry = load_manifest().get(name)
+    if entry is None:
+        return format_html('<img src="{}" alt="{}" loading="{}">', fallback, alt, loading)
+
+    sources = format_html_join(
+        '',
+        '<source type="image/{}" srcset="{}" sizes="{}">',
+        (
+            (fmt, ', '.join(f'{static(path)} {width}w' for width, path in entry['variants'][fmt]), sizes)
+            for fmt in settings.CHARACTER_IMAGE_FORMATS
+            if fmt in entry['variants']
+        ),
+    )
+    return format_html(
+        '<picture>{}<img src="{}" alt="{}" width="{}" height="{}" loading="{}" decoding="async"></picture>',
+        sources, fallback, alt, entry['width'], entry['height'], loading,
+    )
+
+
+@register.filter
+def profile_thumbnail(user, size='sm'):
+    """
+    프로필 이미지 썸네일 URL (settings.PROFILE_THUMBNAIL_SIZES의 키)
+    아직 처리 전이면 원본 URL (처리를 백그라운드로 다시 예약), 이미지가 없으면 빈 문자열
+    예) <img src="{{ user|profile_thumbnail:'sm' }}" srcset="{{ user|profile_thumbnail:'md' }} 2x">
+    """
+    field = user.img_profile
+    if not field:
+        return ''
+    if user.img_profile_thumbnails:
+        return field.storage.url(thumbnail_name(field.name, size))
+    retry_profile_image(user)
+    return field.url
@@ -0,0 +1,37 @@
+import hashlib
+import zlib
+
+
+# ============================================================
+# 생성 문구 중복 제거 (내용 주소 방식, TextBlob 모델에서 사용)
+# - 대체 문구("결과가 집계되었습니다." 등)와 캐릭터 반응은 같은 문자열이 수많은 투자 기록에 반복됨
+# - 문구마다 TextBlob 1행, Investment에는 8바이트 정수 id만 저장
+# - id = UTF-8 SHA-256 앞 8바이트 → 쓰는 쪽에서 바로 계산되므로 조회 없이 INSERT(충돌 무시) 한 번
+#   (64비트라 충돌 확률은 문구 수십억 개 전에는 무시할 수준)
+# - COMPRESS_MIN_BYTES 이상이고 실제로 줄어들 때만 zlib 압축
+# 마이그레이션에서도 쓰므로 모델을 import하지 않는 순수 함수만 둡니다.
+# ============================================================
+COMPRESS_MIN_BYTES = 200
+COMPRESS_LEVEL = 9
+
+
+def blob_id(text):
+    """문구 → TextBlob id (부호 있는 64비트 정수)"""
+    digest = hashlib.sha256(text.encode()).digest()
+    return int.from_bytes(digest[:8], 'big', signed=True)
+
+
+def pack(text):
+    """문구 → (저장할 bytes, 압축 여부)"""
+    raw = text.encode()
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(raw, COMPRESS_LEVEL)
+        if len(packed) < len(raw):
+            return packed, True
+    return raw, False
+
+
+def unpack(data, compressed):
+    """pack()의 반대"""
+    data = bytes(data)
+    return (zlib.decompress(data) if compressed else data).decode()
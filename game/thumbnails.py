@@ -0,0 +1,106 @@
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from . import tasks
+from .models import User
+
+
+# ============================================================
+# 프로필 이미지 축소/재인코딩 + 썸네일
+# - 원본은 PROFILE_IMAGE_MAX_SIZE 이하 WebP로 바꿔서 저장 (업로드 파일은 참조 해제)
+# - 썸네일은 원본 경로 옆 thumbs/{원본 이름}-{크기}.webp (PROFILE_THUMBNAIL_SIZES)
+#   원본이 내용 해시 이름이라 같은 원본을 쓰는 유저끼리 썸네일도 공유
+#   (원본 참조가 모두 사라진 썸네일은 gc_media 커맨드가 정리)
+# - 처리에 실패한 이미지는 화면에서 썸네일을 찾을 때(profile_thumbnail 필터) 백그라운드로 다시 시도
+#   (유저당 PROFILE_IMAGE_RETRY_INTERVAL초에 한 번, 한꺼번에 처리하려면 build_profile_thumbnails)
+# - Pillow는 처리할 때만 import (워커 시작 시간에 포함되지 않게)
+# ============================================================
+
+def thumbnail_name(name, size):
+    """원본 파일 이름 → 썸네일 파일 이름 (예: profile/a.webp, 'sm' → profile/thumbs/a-sm.webp)"""
+    path = PurePosixPath(name)
+    return str(path.parent / 'thumbs' / f'{path.stem}-{size}.webp')
+
+
+def _encode(image, max_size):
+    """긴 변이 max_size 이하가 되도록 줄여서 WebP 바이트로"""
+    from PIL import Image
+
+    image = image.copy()
+    image.thumbnail((max_size, max_size), Image.LANCZOS)
+    buffer = BytesIO()
+    image.save(buffer, 'WEBP', quality=settings.PROFILE_IMAGE_QUALITY, method=6)
+    return buffer.getvalue()
+
+
+def process_profile_image(user_id):
+    """프로필 이미지 재인코딩 + 썸네일 생성 (이미 처리된 이미지면 건너뜀)"""
+    from PIL import Image, ImageOps
+
+    user = User.objects.get(pk=user_id)
+    field = user.img_profile
+    if not field or user.img_profile_thumbnails:
+        return
+    storage = field.storage
+    old_name = field.name
+
+    with field.open('rb') as f:
+        image = Image.open(f)
+        image = ImageOps.exif_transpose(image)  # 휴대폰 사진 회전 정보 반영
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+
+    # 내용 주소 저장소면 같은 결과물이 이미 있을 때 참조 수만 늘어남
+    new_name = storage.save(
+        str(PurePosixPath(old_name).with_suffix('.webp')),
+        ContentFile(_encode(image, settings.PROFILE_IMAGE_MAX_SIZE)),
+    )
+    for size, pixels in settings.PROFILE_THUMBNAIL_SIZES.items():
+        name = thumbnail_name(new_name, size)
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(_encode(image, pixels)))
+
+    # 처리 중에 이미지가 바뀌지 않았을 때만 반영 (바뀌었으면 새 원본 참조 해제)
+    updated = User.objects.filter(pk=user_id, img_profile=old_name).update(
+        img_profile=new_name, img_profile_thumbnails=True,
+    )
+    storage.delete(old_name if updated else new_name)
+
+
+def schedule_profile_image(user):
+    """
+    업로드 직후 호출
+    작은 파일은 바로 처리하고, 큰 파일은 백그라운드 스레드로 넘깁니다. (처리 전까지는 원본 사용)
+    """
+    if not user.img_profile:
+        return
+    if user.img_profile.size > settings.PROFILE_IMAGE_SYNC_MAX_BYTES:
+        transaction.on_commit(lambda: _submit(user.pk))
+        return
+    try:
+        process_profile_image(user.pk)
+    except Exception as e:
+        # 썸네일 실패로 가입이 막히지 않도록 원본 그대로 사용 (다음에 화면에 나올 때 다시 시도)
+        print(f"Profile Image Error ({user.pk}): {e}")
+
+
+def retry_profile_image(user):
+    """
+    아직 처리되지 않은 프로필 이미지를 백그라운드에서 다시 처리 (profile_thumbnail 필터에서 호출)
+    업로드 직후 예약된 작업이나 최근 시도가 있으면 PROFILE_IMAGE_RETRY_INTERVAL 동안은 건너뜀
+    """
+    if user.img_profile and not user.img_profile_thumbnails:
+        _submit(user.pk)
+
+
+def _submit(user_id):
+    # cache.add는 키가 없을 때만 성공 → 같은 유저의 처리가 겹쳐서 예약되지 않음
+    if cache.add(f'profile-image-retry:{user_id}', True, settings.PROFILE_IMAGE_RETRY_INTERVAL):
+        tasks.submit(process_profile_image, user_id)
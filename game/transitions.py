@@ -0,0 +1,86 @@
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import GameSession, User
+from .rules import ENCHANT_COST, MIN_INVEST_AMOUNT
+from . import stats
+
+
+# ============================================================
+# 게임 상태 전이 (조건부 UPDATE 한 번으로 처리)
+# - 파이썬에서 값을 바꾸고 save()하면 따닥/여러 탭 요청이 서로 덮어씀
+# - 대신 "WHERE 조건을 만족할 때만 x = x - n" UPDATE를 실행하고, 바뀐 행 수로 성공 여부 판단
+# - turn_no 조건이 붙어 있어서 한 턴에 투자/패스는 한 번, 강화도 한 번만 성공
+# 모두 True/False만 반환하므로 최신 값이 필요하면 호출한 쪽에서 refresh_from_db() 하세요.
+# ============================================================
+def _active(session_id, turn_no):
+    return GameSession.objects.filter(pk=session_id, is_finished=False, turn_no=turn_no)
+
+
+def invest(session_id, turn_no, amount, capital_delta):
+    """
+    투자 결과 반영: 자본금 += capital_delta, 기회 -1, 다음 턴
+    자본금이 투자금보다 적거나(2천만원 미만은 올인일 때만) 기회가 없으면 실패
+    """
+    if amount <= 0:
+        return False
+    if amount >= MIN_INVEST_AMOUNT:
+        enough = Q(current_capital__gte=amount)
+    else:
+        enough = Q(current_capital=amount)
+    return _active(session_id, turn_no).filter(enough, remaining_chances__gt=0).update(
+        current_capital=F('current_capital') + capital_delta,
+        remaining_chances=F('remaining_chances') - 1,
+        turn_no=F('turn_no') + 1,
+    ) == 1
+
+
+def enchant(session_id, turn_no):
+    """강화 비용 차감 (턴당 1회, 자본금이 비용 이상일 때만)"""
+    return _active(session_id, turn_no).filter(
+        Q(enchanted_turn__isnull=True) | Q(enchanted_turn__lt=turn_no),
+        current_capital__gte=ENCHANT_COST,
+    ).update(
+        current_capital=F('current_capital') - ENCHANT_COST,
+        enchanted_turn=turn_no,
+    ) == 1
+
+
+def pass_turn(session_id, turn_no):
+    """패스 (패스 횟수 -1, 다음 턴)"""
+    return _active(session_id, turn_no).filter(remaining_reroles__gt=0).update(
+        remaining_reroles=F('remaining_reroles') - 1,
+        turn_no=F('turn_no') + 1,
+    ) == 1
+
+
+def finish(session):
+    """
+    게임 종료 (수익률 확정 + 유저 통계), 이미 종료된 게임이면 False
+    is_finished를 먼저 조건부로 바꾸므로 동시에 여러 요청이 와도 한 번만 처리되고,
+    그 뒤로는 자본금을 바꾸는 UPDATE가 모두 실패해서 수익률 계산 중에 값이 바뀌지 않습니다.
+    """
+    today = timezone.localdate()
+    with transaction.atomic():
+        if not GameSession.objects.filter(pk=session.pk, is_finished=False).update(
+            is_finished=True, finished_on=today,
+        ):
+            return False
+        session.refresh_from_db(fields=['current_capital', 'remaining_chances', 'remaining_reroles', 'turn_no'])
+        session.is_finished = True
+        session.finished_on = today
+        session.final_profit_rate = session.calculate_profit_rate()
+        GameSession.objects.filter(pk=session.pk).update(final_profit_rate=session.final_profit_rate)
+        record_user_game(session.user_id, session.final_profit_rate)
+        stats.record_game(session.user_id, bankrupt=session.current_capital <= 0)
+    return True
+
+
+def record_user_game(user_id, profit_rate):
+    """유저 통계 (판 수 +1, 최고 수익률 갱신)"""
+    User.objects.filter(pk=user_id).update(
+        total_games=F('total_games') + 1,
+        best_profit_rate=Greatest(F('best_profit_rate'), Value(profit_rate)),
+    )
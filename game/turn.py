@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+
+from .gemini_service import CHARACTERS
+
+
+# ============================================================
+# 현재 턴 상태 (Django 세션에 저장하는 최소 정보)
+# - 캐릭터 데이터(페르소나, 밸런스 수치 등)는 세션에 복사하지 않고 CHARACTERS에서 키로 조회
+# - 세션에는 [캐릭터 키, 아이디어 제목, 아이디어 설명, 성공 확률, 강화 여부, 게임 ID, 턴 번호] 한 줄만 저장
+# - 게임 ID/턴 번호가 DB의 GameSession과 다르면 (다른 탭에서 이미 투자/패스) 지난 턴으로 보고 버림
+# ============================================================
+SESSION_KEY = 'turn'
+
+# 예전 방식(캐릭터 dict 통째로 저장) 세션 키 - 배포 직후 남아 있는 세션 변환용
+LEGACY_KEYS = ('current_character', 'current_idea', 'success_prob', 'enchant_used')
+
+
+@dataclass
+class TurnState:
+    character_key: str
+    success_prob: float
+    idea_title: str = None  # 아이디어 스트리밍이 끝나기 전이면 None
+    idea_description: str = ''
+    enchant_used: bool = False
+    game_id: int = None
+    turn_no: int = 0
+
+    @property
+    def character(self):
+        return CHARACTERS[self.character_key]
+
+    @property
+    def idea(self):
+        """템플릿/프롬프트용 아이디어 dict (아직 없으면 None)"""
+        if self.idea_title is None:
+            return None
+        return {'title': self.idea_title, 'description': self.idea_description}
+
+    def set_idea(self, idea):
+        self.idea_title = idea['title']
+        self.idea_description = idea.get('description', '')
+
+    @classmethod
+    def new(cls, session, character, idea=None):
+        """게임 session의 현재 턴 (확률은 캐릭터 기본 성공률)"""
+        turn = cls(
+            character_key=character['key'], success_prob=character.get('success_rate', 0.5),
+            game_id=session.pk, turn_no=session.turn_no,
+        )
+        if idea is not None:
+            turn.set_idea(idea)
+        return turn
+
+    # ---------- 세션 저장/불러오기 ----------
+
+    def save(self, request):
+        request.session[SESSION_KEY] = [
+            self.character_key, self.idea_title, self.idea_description,
+            round(self.success_prob, 4), int(self.enchant_used), self.game_id, self.turn_no,
+        ]
+
+    @classmethod
+    def load(cls, request, session):
+        """게임 session의 현재 턴 (없거나, 알 수 없는 캐릭터거나, 지난 턴이면 None)"""
+        data = request.session.get(SESSION_KEY)
+        if data is None:
+            return cls._load_legacy(request, session)
+        if len(data) == 5:
+            # 턴 번호 도입 전 형식 → 지금 턴으로 간주
+            data = [*data, session.pk, session.turn_no]
+        key, title, description, prob, enchant, game_id, turn_no = data
+        if key not in CHARACTERS or game_id != session.pk or turn_no != session.turn_no:
+            return None
+        return cls(key, prob, title, description, bool(enchant), game_id, turn_no)
+
+    @classmethod
+    async def aload(cls, request, session):
+        """load()의 async 버전 (세션 데이터를 async로 먼저 읽어두면 이후 세션 접근은 DB를 안 씀)"""
+        await request.session.aget(SESSION_KEY)
+        return cls.load(request, session)
+
+    @classmethod
+    def _load_legacy(cls, request, session):
+        character = request.session.get('current_character')
+        if not character or character.get('key') not in CHARACTERS:
+            return None
+        turn = cls.new(session, CHARACTERS[character['key']], request.session.get('current_idea'))
+        turn.success_prob = request.session.get('success_prob', turn.success_prob)
+        turn.enchant_used = request.session.get('enchant_used', False)
+        for key in LEGACY_KEYS:
+            request.session.pop(key, None)
+        turn.save(request)
+        return turn
+
+    @staticmethod
+    def clear(request):
+        request.session.pop(SESSION_KEY, None)
@@ -1,8 +1,15 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'game'
 
+# LLM을 기다리는 게임 진행 화면은 ASGI 배포에서 async 뷰 사용 (settings.ASYNC_GAME_VIEWS)
+if settings.ASYNC_GAME_VIEWS:
+    from . import async_views as game_views
+else:
+    game_views = views
+
 urlpatterns = [
     # 메인
     path('', views.main_view, name='main'),
@@ -15,11 +22,16 @@ urlpatterns = [
     
     # 게임 (박기상)
     path('game/start/', views.game_start_view, name='game_start'),
-    path('game/<int:session_id>/play/', views.play_view, name='play'),
-    path('game/<int:session_id>/invest/', views.invest_view, name='invest'),
-    path('game/<int:session_id>/pass/', views.pass_view, name='pass'),
+    path('game/<int:session_id>/play/', game_views.play_view, name='play'),
+    path('game/<int:session_id>/play/stream/', views.play_stream_view, name='play_stream'),
+    path('game/<int:session_id>/invest/', game_views.invest_view, name='invest'),
+    path('game/<int:session_id>/pass/', game_views.pass_view, name='pass'),
     path('result/<int:investment_id>/', views.result_view, name='result'),
+    path('result/<int:investment_id>/reaction/', views.result_reaction_view, name='result_reaction'),
     
     # 랭킹 (김정원)
     path('ranking/', views.ranking_view, name='ranking'),
+    
+    # 운영 모니터링
+    path('ops/status/', views.ops_status_view, name='ops_status'),
 ]
@@ -1,13 +1,30 @@
-import random
+import hmac
+import json
+from collections import namedtuple
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, HttpResponse, HttpResponseForbidden, JsonResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.views.static import serve
 from datetime import datetime, timedelta
 
-from .models import User, GameSession, Investment
+from .models import User, GameSession, Investment, TextBlob
 from .forms import SignupForm, LoginForm
-from .gemini_service import generate_idea, generate_result, get_random_character
+from .gemini_service import (
+    IdeaStreamParser, fallback_idea, fallback_reason, fallback_result, generate_idea, generate_result,
+    get_character_by_name, llm_stats, parse_idea, stream_idea,
+)
+from .idea_pool import idea_pool, take_pooled_idea
+from .signals import game_finished
+from .storage import CONTENT_ADDRESSED
+from .thumbnails import schedule_profile_image
+from .rules import get_random_character
+from .turn import TurnState
+from . import archive, leaderboard, metrics, rules, stats, tasks, transitions
 
 
 # ============================================================
@@ -34,6 +51,138 @@ def get_prob_level(prob):
         return {'text': '😰최악', 'class': 'prob-worst'}
 
 
+# ============================================================
+# 새 턴 시작 (캐릭터 + 아이디어 세팅)
+# ============================================================
+def start_new_turn(request, session, blocking=True):
+    """
+    게임 session의 현재 턴에 쓸 새 캐릭터/아이디어를 뽑아서 세션에 저장 (TurnState, 확률은 캐릭터 기본값)
+    아이디어는 풀에서 먼저 꺼내고, 없을 때만 실시간 생성합니다.
+    스트리밍 모드에서는 아이디어를 비워두고 play 화면에서 SSE로 받아옵니다.
+    blocking=False면 실시간 생성이 필요할 때 턴을 비워두고 None 반환 (play 화면에서 생성)
+    """
+    character = get_random_character()
+    idea = take_pooled_idea(character)
+    if idea is None and not settings.IDEA_STREAMING:
+        if not blocking:
+            TurnState.clear(request)
+            return None
+        idea = generate_idea(character)
+    turn = TurnState.new(session, character, idea)
+    turn.save(request)
+    return turn
+
+
+# ============================================================
+# 투자/강화 공용 처리 (views, async_views에서 같이 사용)
+# ============================================================
+InvestOutcome = namedtuple('InvestOutcome', ['invest_amount', 'is_success', 'profit_rate', 'capital_delta'])
+
+
+def parse_invest_amount(request, session):
+    """POST의 투자금 (만원), 규칙에 안 맞으면 None (최종 확인은 transitions.invest의 UPDATE 조건)"""
+    try:
+        invest_amount = int(request.POST.get('amount', 0))
+    except ValueError:
+        return None
+    if not rules.is_valid_amount(invest_amount, session.current_capital):
+        return None
+    return invest_amount
+
+
+def roll_investment(turn, invest_amount):
+    """성공 여부 + 수익률 + 자본금 변화량 결정 (규칙은 rules.roll_investment)"""
+    is_success, profit_rate, capital_delta = rules.roll_investment(turn.character, turn.success_prob, invest_amount)
+    return InvestOutcome(invest_amount, is_success, profit_rate, capital_delta)
+
+
+def record_investment(session, turn, outcome, result):
+    """
+    자본금/기회 차감 + 투자 기록 저장 (짧은 트랜잭션 하나)
+    같은 턴에 이미 투자했거나 자본금이 모자라면 아무것도 하지 않고 None
+    result: generate_result() 결과 (ASYNC_RESULT_REACTION이면 빈 dict → 백그라운드에서 채움)
+    """
+    character = turn.character
+    idea = turn.idea
+    with transaction.atomic():
+        if not transitions.invest(session.pk, turn.turn_no, outcome.invest_amount, outcome.capital_delta):
+            return None
+        description_id, system_msg_id, reaction_id = TextBlob.intern(
+            idea.get('description', ''), result.get('system_msg', ''), result.get('reaction', ''),
+        )
+        investment = Investment.objects.create(
+            session=session,
+            character_name=character.get('name', '알 수 없음'),
+            idea_title=idea.get('title', '제목 없음'),
+            idea_description_blob_id=description_id,
+            invest_amount=outcome.invest_amount,
+            is_success=outcome.is_success,
+            profit_rate=outcome.profit_rate,
+            result_system_msg_blob_id=system_msg_id,
+            result_character_reaction_blob_id=reaction_id,
+            reaction_ready=not settings.ASYNC_RESULT_REACTION
+        )
+        stats.record_investment(
+            session.user_id, turn.character_key, outcome.invest_amount, outcome.is_success, outcome.capital_delta,
+        )
+        
+        if settings.ASYNC_RESULT_REACTION:
+            transaction.on_commit(lambda: tasks.submit(
+                tasks.fill_result_reaction,
+                investment.pk, character, idea.get('title', '무제'), outcome.is_success
+            ))
+    
+    character_key = turn.character_key
+    metrics.game_actions.inc(action='invest', character=character_key)
+    metrics.game_investments.inc(character=character_key, result='success' if outcome.is_success else 'fail')
+    metrics.game_invested_amount.inc(outcome.invest_amount, character=character_key)
+    return investment
+
+
+def spend_enchant(session, turn):
+    """강화 비용 차감 + 통계 (한 트랜잭션), 자본금이 모자라거나 이 턴에 이미 강화했으면 False"""
+    with transaction.atomic():
+        if not transitions.enchant(session.pk, turn.turn_no):
+            return False
+        stats.record_enchant(session.user_id)
+    return True
+
+
+def spend_pass(session, turn_no):
+    """패스 횟수 차감 + 통계 (한 트랜잭션), 남은 패스가 없거나 turn_no 턴에 이미 패스/투자했으면 False"""
+    with transaction.atomic():
+        if not transitions.pass_turn(session.pk, turn_no):
+            return False
+        stats.record_pass(session.user_id)
+    return True
+
+
+def submitted_turn_no(request):
+    """폼으로 제출된 턴 번호 (play 화면에 렌더링된 hidden turn_no), 없거나 숫자가 아니면 None"""
+    try:
+        return int(request.POST['turn_no'])
+    except (KeyError, ValueError):
+        return None
+
+
+def load_submitted_turn(request, session):
+    """
+    현재 턴, 단 제출된 turn_no(플레이어가 화면에서 본 턴)와 같을 때만 (아니면 None)
+    따닥/새로고침으로 같은 폼이 두 번 와도 첫 요청이 턴을 넘긴 뒤라 두 번째는 턴 번호가 달라서 걸림
+    """
+    turn = TurnState.load(request, session)
+    if turn is None or turn.turn_no != submitted_turn_no(request):
+        return None
+    return turn
+
+
+def apply_enchant(turn):
+    """강화 비용 차감 후 호출: 확률 10~50% 랜덤 증가 (세션 저장은 호출한 쪽에서)"""
+    turn.success_prob = rules.enchant(turn.success_prob)
+    turn.enchant_used = True  # 강화 사용 완료
+    metrics.game_actions.inc(action='enchant', character=turn.character_key)
+
+
 # ============================================================
 # 회원 시스템 (유동주 담당)
 # ============================================================
@@ -44,6 +193,7 @@ def signup_view(request):
         form = SignupForm(request.POST, request.FILES)
         if form.is_valid():
             user = form.save()
+            schedule_profile_image(user)
             login(request, user)
             return redirect('game:main')
     else:
@@ -80,11 +230,18 @@ def mypage_view(request):
     recent_games = GameSession.objects.filter(
         user=user,
         is_finished=True
-    ).order_by('-created_at')[:10]
+    ).select_related('archive').order_by('-created_at')[:10]
+    # 게임별 투자 내역 (오래된 게임은 보관 테이블에서 압축 해제)
+    recent_games = archive.attach_history(list(recent_games))
+    
+    # 누적 통계는 롤업 테이블에서 (투자 기록 전체를 읽지 않음)
+    user_stats, character_stats = stats.for_user(user)
     
     context = {
         'user': user,
         'recent_games': recent_games,
+        'user_stats': user_stats,
+        'character_stats': character_stats,
     }
     return render(request, 'game/mypage.html', context)
 
@@ -94,11 +251,16 @@ def mypage_view(request):
 # ============================================================
 
 def main_view(request):
-    """메인 페이지"""
+    """
+    메인 페이지
+    Top 3는 템플릿 조각 캐시에서 꺼내고 (캐시 미스일 때만 쿼리), 진행 중 게임만 매번 조회
+    """
     top3 = get_top3()
     
     context = {
         'top3': top3,
+        'ranking_day': timezone.localdate(),
+        'ranking_cache_timeout': settings.RANKING_CACHE_TIMEOUT,
     }
     
     if request.user.is_authenticated:
@@ -124,8 +286,8 @@ def game_start_view(request):
 
     session = GameSession.objects.create(
         user=request.user,
-        current_capital=10000,
-        remaining_chances=5
+        current_capital=rules.START_CAPITAL,
+        remaining_chances=rules.MAX_CHANCES
     )
     
     return redirect('game:play', session_id=session.pk)
@@ -142,48 +304,93 @@ def play_view(request, session_id):
     
     # 자본금 부족 체크 (0원 이하면 게임 종료)
     if session.current_capital <= 0:
-        session.is_finished = True
-        session.final_profit_rate = session.calculate_profit_rate()
-        session.save()
-        update_user_stats(request.user, session.final_profit_rate)
+        finish_game(request.user, session, reason='bankrupt')
         return redirect('game:ranking')
     
-    # ========== 새로고침 방지 ==========
-    character = request.session.get('current_character')
-    idea = request.session.get('current_idea')
+    # 마지막 투자 요청이 종료 처리 전에 실패한 경우 (기회는 이미 차감됨)
+    if session.remaining_chances <= 0:
+        finish_game(request.user, session, reason='completed')
+        return redirect('game:ranking')
     
-    if not character or not idea:
+    # ========== 새로고침 방지 ==========
+    # 보통은 투자/패스 때 다음 턴을 미리 세팅해두므로 여기서는 세션을 쓰지 않음
+    turn = TurnState.load(request, session)
+    if turn is None:
         # 새 캐릭터/아이디어 생성
-        character = get_random_character()
-        idea = generate_idea(character)
-        request.session['current_character'] = character
-        request.session['current_idea'] = idea
-        
-        # 기본 확률 설정
-        success_prob = character.get('success_rate', 0.5)
-        request.session['success_prob'] = success_prob
-        request.session['enchant_used'] = False  # 강화 사용 여부 초기화
-    else:
-        # 세션에 저장된 확률 불러오기
-        success_prob = request.session.get('success_prob', 0.5)
+        turn = start_new_turn(request, session)
     
+    return render(request, 'game/play.html', play_context(session, turn))
+
+
+def play_context(session, turn):
+    """투자 화면 템플릿 context (play_view, async_views.play_view 공용)"""
     # 확률 단계 계산
-    prob_level = get_prob_level(success_prob)
+    prob_level = get_prob_level(turn.success_prob)
     
     # 강화 가능 여부 (1회 제한 + 2천만원 이상 보유)
-    enchant_used = request.session.get('enchant_used', False)
-    can_enchant = not enchant_used and session.current_capital >= 2000
+    can_enchant = not turn.enchant_used and session.current_capital >= rules.ENCHANT_COST
 
-    context = {
+    return {
         'session': session,
-        'character': character,
-        'idea': idea,
+        'character': turn.character,
+        'idea': turn.idea,
         'prob_text': prob_level['text'],
         'prob_class': prob_level['class'],
         'can_enchant': can_enchant,
-        'enchant_used': enchant_used,
+        'enchant_used': turn.enchant_used,
+        'idea_streaming': turn.idea is None,  # 아이디어가 아직 없으면 SSE로 받아옴
+        'turn_no': turn.turn_no,  # 투자/강화/패스 폼에 그대로 실어 보냄 (load_submitted_turn)
     }
-    return render(request, 'game/play.html', context)
+
+
+@login_required
+def play_stream_view(request, session_id):
+    """
+    투자 화면 - 아이디어 피칭 스트리밍 (Server-Sent Events)
+    [TITLE]/[DESC] 텍스트를 생성되는 대로 보내고, 완료되면 세션에 저장합니다.
+    """
+    session = get_object_or_404(GameSession, pk=session_id, user=request.user, is_finished=False)
+    turn = TurnState.load(request, session)
+
+    def sse(event, data):
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    def event_stream():
+        if turn is None:
+            yield sse('done', fallback_idea())
+            return
+        # 이미 생성된 아이디어가 있으면 바로 완료 (새로고침 등)
+        if turn.idea:
+            yield sse('done', turn.idea)
+            return
+
+        parser = IdeaStreamParser()
+        try:
+            for chunk in stream_idea(turn.character):
+                for field, text in parser.feed(chunk):
+                    yield sse(field, {'text': text})
+            result = parse_idea(parser.text, turn.character)
+        except Exception as e:
+            print(f"Gemini API Error (Idea Stream): {e}")
+            metrics.llm_fallbacks.inc(function='stream_idea', reason=fallback_reason(e))
+            result = fallback_idea()
+
+        # 스트리밍 응답은 SessionMiddleware 저장 이후에 실행되므로 직접 저장
+        # 스트리밍 중에 다른 요청(자문, 다른 탭의 패스 등)이 세션을 바꿨을 수 있으므로
+        # 저장소에서 다시 읽고, 같은 턴(load()가 요청 시작 시점의 게임/턴 번호와 비교)이고
+        # 아직 아이디어가 없을 때만 아이디어를 채움
+        request.session = type(request.session)(request.session.session_key)
+        stored = TurnState.load(request, session)
+        if stored is not None and not stored.idea:
+            stored.set_idea(result)
+            stored.save(request)
+            request.session.save()
+        yield sse('done', result)
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 끄기
+    return response
 
 
 @login_required
@@ -199,98 +406,54 @@ def invest_view(request, session_id):
         
         # ========== 투자 처리 ==========
         if action == 'invest':
-            try:
-                invest_amount = int(request.POST.get('amount', 0))
-            except ValueError:
-                return redirect('game:play', session_id=session_id)
-            
-            # 투자금 검증
-            if invest_amount < 2000 and invest_amount != session.current_capital:
-                return redirect('game:play', session_id=session_id)
-            
-            if invest_amount > session.current_capital:
+            invest_amount = parse_invest_amount(request, session)
+            if invest_amount is None:
                 return redirect('game:play', session_id=session_id)
             
-            character = request.session.get('current_character', {})
-            idea = request.session.get('current_idea', {})
+            turn = load_submitted_turn(request, session)
             
-            if not character:
+            # 화면에서 본 턴이 아니거나(따닥/다른 탭에서 이미 넘어감) 아이디어 스트리밍이 끝나기 전이면 무시
+            if turn is None or turn.idea is None:
                 return redirect('game:play', session_id=session_id)
             
-            # 세션에서 저장된 확률 불러오기
-            success_prob = request.session.get('success_prob', 0.5)
+            outcome = roll_investment(turn, invest_amount)
             
-            is_success = random.random() < success_prob
-            
-            if is_success:
-                min_roi = character.get('min_roi', 10)
-                max_roi = character.get('max_roi', 50)
-                profit_rate = random.randint(min_roi, max_roi)
-                profit = int(invest_amount * (profit_rate / 100))
-                session.current_capital += profit
+            if settings.ASYNC_RESULT_REACTION:
+                # 결과는 바로 저장, AI 반응은 백그라운드에서 채움
+                result = {}
             else:
-                profit_rate = -100
-                session.current_capital -= invest_amount
-            
-            # AI 결과 메시지 생성
-            result = generate_result(character, idea.get('title', '무제'), is_success)
-            
-            # 투자 기록 저장
-            investment = Investment.objects.create(
-                session=session,
-                character_name=character.get('name', '알 수 없음'),
-                idea_title=idea.get('title', '제목 없음'),
-                idea_description=idea.get('description', ''),
-                invest_amount=invest_amount,
-                is_success=is_success,
-                profit_rate=profit_rate,
-                result_system_msg=result.get('system_msg', ''),
-                result_character_reaction=result.get('reaction', '')
-            )
+                # AI 결과 메시지 생성 (LLM 호출이 트랜잭션/쓰기 잠금을 잡고 있지 않게 먼저 실행)
+                result = generate_result(turn.character, turn.idea['title'], outcome.is_success)
             
-            # 기회 차감
-            session.remaining_chances -= 1
+            investment = record_investment(session, turn, outcome, result)
+            if investment is None:
+                return redirect('game:play', session_id=session_id)
             
-            # 게임 종료 조건 체크
-            if session.remaining_chances <= 0 or session.current_capital <= 0:
-                session.is_finished = True
-                session.final_profit_rate = session.calculate_profit_rate()
-                session.save()
-                update_user_stats(request.user, session.final_profit_rate)
+            # 게임 종료 조건 체크 (다른 요청이 바꾼 값까지 반영된 최신 값으로)
+            session.refresh_from_db(fields=['current_capital', 'remaining_chances', 'turn_no'])
+            if rules.is_game_over(session.current_capital, session.remaining_chances):
+                finish_game(request.user, session, reason='bankrupt' if session.current_capital <= 0 else 'completed')
+                TurnState.clear(request)
             else:
-                session.save()
-            
-            # 세션 데이터 삭제 (다음 턴에 새 캐릭터)
-            request.session.pop('current_character', None)
-            request.session.pop('current_idea', None)
-            request.session.pop('success_prob', None)
-            request.session.pop('enchant_used', None)
+                # 다음 턴을 지금 세팅 (세션 저장 한 번으로 끝, 다음 play 화면은 세션을 쓰지 않음)
+                start_new_turn(request, session, blocking=False)
 
             return redirect('game:result', investment_id=investment.pk)
         
         # ========== 강화 처리 ==========
         elif action == 'enchant':
-            enchant_used = request.session.get('enchant_used', False)
+            turn = load_submitted_turn(request, session)
             
-            # 이미 강화했으면 무시
-            if enchant_used:
+            # 화면에서 본 턴이 아니거나 이미 강화했으면 무시
+            if turn is None or turn.enchant_used:
                 return redirect('game:play', session_id=session_id)
             
-            # 2천만원 미만이면 무시
-            if session.current_capital < 2000:
+            # 2천만원 차감 (부족하거나 이 턴에 이미 강화했으면 무시)
+            if not spend_enchant(session, turn):
                 return redirect('game:play', session_id=session_id)
             
-            # 2천만원 차감
-            session.current_capital -= 2000
-            session.save()
-            
-            # 확률 10~50% 랜덤 증가
-            prob_add = random.randint(10, 50) / 100  # 0.1 ~ 0.5
-            success_prob = request.session.get('success_prob', 0.5)
-            success_prob = min(1.0, success_prob + prob_add)
-            
-            request.session['success_prob'] = success_prob
-            request.session['enchant_used'] = True  # 강화 사용 완료
+            apply_enchant(turn)
+            turn.save(request)
             
             return redirect('game:play', session_id=session_id)
 
@@ -299,42 +462,37 @@ def invest_view(request, session_id):
 
 @login_required
 def pass_view(request, session_id):
-    """패스 - 기회 차감 없이 다음 캐릭터"""
-    # 세션 데이터 삭제 (새 캐릭터 나오게)
+    """패스 - 기회 차감 없이 다음 캐릭터 (POST, play 화면의 turn_no 포함)"""
     # <><><><><><><><><><><><><><><> 0130
     session = get_object_or_404(GameSession, pk=session_id, user=request.user)
-    if session.remaining_reroles >0:
-    # <><><><><><><><><><><><><><><> end of 0130
-        session.remaining_reroles -= 1
-        session.save()
-        request.session.pop('current_character', None)
-        request.session.pop('current_idea', None)
-        request.session.pop('success_prob', None)
-        request.session.pop('enchant_used', None)
+    if request.method != 'POST':
         return redirect('game:play', session_id=session_id)
-    # <><><><><><><><><><><><><><><> 0130
-    else:
+    # 화면에서 본 턴에 패스 횟수가 남아 있을 때만 (두 번 눌러도 두 번째는 턴 번호가 달라서 실패)
+    turn_no = submitted_turn_no(request)
+    if turn_no is None or not spend_pass(session, turn_no):
         return redirect('game:play', session_id=session_id)
     # <><><><><><><><><><><><><><><> end of 0130
+    turn = TurnState.load(request, session)
+    metrics.game_actions.inc(action='pass', character=turn.character_key if turn else '')
+    # 다음 캐릭터는 풀에서 바로 꺼내서 세팅
+    session.turn_no = turn_no + 1
+    start_new_turn(request, session)
+    return redirect('game:play', session_id=session_id)
 
 @login_required
 def result_view(request, investment_id):
     """결과 화면"""
-    investment = get_object_or_404(Investment, pk=investment_id)
+    investment = get_object_or_404(
+        Investment.objects.select_related('session', *Investment.TEXT_BLOBS), pk=investment_id,
+    )
     session = investment.session
     
-    if session.user != request.user:
+    if session.user_id != request.user.pk:
         return redirect('game:main')
     
-    # 캐릭터 이름 → 키 매핑 (이미지 파일명용)
-    name_to_key = {
-        '김잼민': 'jaemin',
-        '성수동': 'hipster',
-        '유능한': 'elite',
-        '공필태(G.P.T)': 'ai_fan',
-        '왕소심': 'shy',
-    }
-    character_key = name_to_key.get(investment.character_name, 'jaemin')
+    # 캐릭터 이름 → 키 (이미지 파일명용)
+    character = get_character_by_name(investment.character_name)
+    character_key = character['key'] if character else 'jaemin'
     
     context = {
         'investment': investment,
@@ -344,53 +502,120 @@ def result_view(request, investment_id):
     return render(request, 'game/result.html', context)
 
 
+@login_required
+def result_reaction_view(request, investment_id):
+    """결과 화면 - AI 반응 폴링용 (JSON)"""
+    investments = Investment.objects.select_related('result_system_msg_blob', 'result_character_reaction_blob')
+    investment = get_object_or_404(investments, pk=investment_id, session__user=request.user)
+    
+    # 백그라운드 작업이 유실/지연되면 기본 문구로 마무리
+    if not investment.reaction_ready:
+        elapsed = (timezone.now() - investment.created_at).total_seconds()
+        if elapsed > settings.RESULT_REACTION_TIMEOUT:
+            character = get_character_by_name(investment.character_name) or {'name': investment.character_name}
+            result = fallback_result(character, investment.is_success)
+            system_msg_id, reaction_id = TextBlob.intern(result['system_msg'], result['reaction'])
+            Investment.objects.filter(pk=investment.pk, reaction_ready=False).update(
+                result_system_msg_blob_id=system_msg_id,
+                result_character_reaction_blob_id=reaction_id,
+                reaction_ready=True,
+            )
+            investment = investments.get(pk=investment.pk)
+    
+    return JsonResponse({
+        'ready': investment.reaction_ready,
+        'system_msg': investment.result_system_msg,
+        'reaction': investment.result_character_reaction,
+    })
+
+
 # ============================================================
 # 랭킹 및 유틸리티 (김정원 담당)
 # ============================================================
 
 def ranking_view(request):
-    """랭킹 페이지"""
+    """
+    랭킹 페이지
+    쿼리셋은 지연 평가라서 템플릿 조각 캐시가 살아 있으면 DB를 조회하지 않습니다.
+    """
     today_ranking = get_today_ranking()
     hall_of_fame = get_hall_of_fame()
     
     context = {
         'today_ranking': today_ranking,
         'hall_of_fame': hall_of_fame,
+        'ranking_day': timezone.localdate(),
+        'ranking_cache_timeout': settings.RANKING_CACHE_TIMEOUT,
     }
     return render(request, 'game/ranking.html', context)
 
 
 def get_today_ranking():
     """오늘의 랭킹 조회"""
-    today = timezone.now().date()
-    ranking = GameSession.objects.filter(
-        is_finished=True,
-        created_at__date=today
-    ).order_by('-final_profit_rate')[:20]
-    return ranking
+    return leaderboard.get_daily(timezone.localdate(), limit=20)
 
 
 def get_top3():
     """메인 페이지용 Top 3"""
-    today = timezone.now().date()
-    top3 = GameSession.objects.filter(
-        is_finished=True,
-        created_at__date=today
-    ).order_by('-final_profit_rate')[:3]
-    return top3
+    return leaderboard.get_daily(timezone.localdate(), limit=3)
 
 
 def get_hall_of_fame():
     """명예의 전당 - 역대 Top 10"""
-    hall_of_fame = GameSession.objects.filter(
-        is_finished=True
-    ).order_by('-final_profit_rate')[:10]
-    return hall_of_fame
+    return leaderboard.get_all_time(limit=10)
+
+
+def finish_game(user, session, reason):
+    """
+    게임 종료 처리 (수익률 확정 + 유저 통계 + 랭킹 보드 반영)
+    동시에 여러 요청이 종료를 시도해도 처음 한 번만 처리 (transitions.finish)
+    """
+    if not transitions.finish(session):
+        return
+    boards = leaderboard.record(session)
+    metrics.games_finished.inc(reason=reason)
+    game_finished.send(sender=GameSession, session=session, boards=boards)
 
 
-def update_user_stats(user, profit_rate):
-    """유저 통계 업데이트 (게임 종료 시 호출)"""
-    user.total_games += 1
-    if profit_rate > user.best_profit_rate:
-        user.best_profit_rate = profit_rate
-    user.save()
\ No newline at end of file
+# ============================================================
+# 운영 모니터링
+# ============================================================
+
+def media_view(request, path):
+    """
+    미디어 파일 서빙 (개발 서버용, 운영에서는 웹 서버가 같은 규칙으로 서빙)
+    내용 해시 이름 파일은 내용이 절대 바뀌지 않으므로 1년 + immutable 캐시
+    """
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    if CONTENT_ADDRESSED.search(path):
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
+def _metrics_allowed(request):
+    """스태프 로그인 / METRICS_TOKEN / METRICS_ALLOWED_IPS 중 하나면 허용"""
+    if request.user.is_authenticated and request.user.is_staff:
+        return True
+    if settings.METRICS_TOKEN:
+        token = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        if hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+            return True
+    return request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
+
+
+def metrics_view(request):
+    """Prometheus 스크랩용 메트릭 (텍스트 포맷), METRICS_ENABLED일 때만"""
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    if not _metrics_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@staff_member_required
+def ops_status_view(request):
+    """운영 상태 (아이디어 풀 깊이/hit/miss, LLM 브레이커/헤지)"""
+    return JsonResponse({
+        'idea_pool': idea_pool.stats(),
+        'llm': llm_stats(),
+    })
@@ -0,0 +1,27 @@
+"""
+gunicorn 설정 (gunicorn config.wsgi 실행 시 자동으로 읽음)
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '127.0.0.1:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', 2))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+
+def post_worker_init(worker):
+    """
+    워커 fork + 앱 로딩 직후 실행
+    LLM SDK import/클라이언트 생성과 아이디어 풀 워커를 첫 요청 전에 준비합니다.
+    """
+    from django.conf import settings
+
+    if not settings.LLM_WARMUP:
+        return
+
+    from game import gemini_service
+    from game.idea_pool import idea_pool
+
+    gemini_service.warm_up()
+    if settings.IDEA_POOL_ENABLED:
+        idea_pool.start()